@@ -1,11 +1,176 @@
 import argparse
+import csv
+import json
+import math
 import pathlib
+import re
+import statistics
 import sys
+from dataclasses import asdict, dataclass, field
+from src.solvers.batch import SolveStatus, solve_one
 from src.solvers.solver_type import SudokuSolverType
+from src.model.corpus import read_puzzles
 from src.model.grid import SudokuGrid
+from src.utils.metrics import SearchMetrics
 from timeit import default_timer as timer
 
 
+PUZZLE_NAME = re.compile(r"sudokuN(?P<block_size>\d+)num(?P<number>\d+)")
+"""Pattern of the bundled puzzle names, e.g. `sudokuN3num0.txt` is the first 9x9 puzzle"""
+
+EXACT_TEST_LIMIT = 40
+"""Largest total number of timings for which the slowdown test uses the exact distribution"""
+
+
+@dataclass(slots=True)
+class Measurement:
+    """
+    Timings of a single solver on a single puzzle.
+
+    Attributes:
+    -----------
+    puzzle: str
+        name of the puzzle, its path (and index within a multi-puzzle file)
+    size: int
+        size of the puzzle grid
+    solver: str
+        name of the solver
+    status: str
+        outcome of the last run, see `SolveStatus`
+    times: list[float]
+        running times (in seconds) of the measured repetitions
+    metrics: dict[str, int | float] | None
+        search metrics of an extra, instrumented run, if requested
+    """
+
+    puzzle: str
+    size: int
+    solver: str
+    status: str = SolveStatus.SOLVED
+    times: list[float] = field(default_factory=list)
+    metrics: dict[str, int | float] | None = None
+
+
+def summarize(times: list[float]) -> dict[str, float | None]:
+    """
+    Computes statistics of the running times.
+
+    Parameters:
+    -----------
+    times: list[float]
+        running times (in seconds)
+
+    Return:
+    --------
+    statistics: dict[str, float | None]
+        median, 95th percentile, minimum, maximum, standard deviation
+        and coefficient of variation (standard deviation relative to the mean),
+        `None` where there are not enough measurements
+    """
+
+    if not times:
+        return {"median": None, "p95": None, "min": None, "max": None, "stddev": None, "cv": None}
+    ordered = sorted(times)
+    stddev = statistics.stdev(ordered) if len(ordered) > 1 else 0.0
+    mean = statistics.fmean(ordered)
+    return {
+        "median": statistics.median(ordered),
+        "p95": ordered[max(math.ceil(0.95 * len(ordered)) - 1, 0)],
+        "min": ordered[0],
+        "max": ordered[-1],
+        "stddev": stddev,
+        "cv": stddev / mean if mean > 0 else 0.0,
+    }
+
+
+def slower_p_value(current: list[float], baseline: list[float]) -> float:
+    """
+    One-sided Mann-Whitney U test checking whether the current timings
+    are larger than the baseline ones. Up to `EXACT_TEST_LIMIT` timings
+    in total, the p-value is exact (conditional on the ties), so a few
+    repetitions cannot reach a small p-value, e.g. 3 against 3 timings
+    never go below 0.05. Larger samples use the normal approximation
+    with the tie correction.
+    See: https://en.wikipedia.org/wiki/Mann%E2%80%93Whitney_U_test
+
+    Parameters:
+    -----------
+    current: list[float]
+        current running times
+    baseline: list[float]
+        baseline running times
+
+    Return:
+    --------
+    p_value: float
+        probability of seeing such a difference if the running times
+        were not slower, `1.0` if there are not enough measurements
+    """
+
+    n, m = len(current), len(baseline)
+    if n == 0 or m == 0:
+        return 1.0
+
+    ordered = sorted([(time, 0) for time in current] + [(time, 1) for time in baseline])
+    ranks = [0.0] * len(ordered)
+    tie_correction = 0.0
+    start = 0
+    while start < len(ordered):
+        end = start
+        while end + 1 < len(ordered) and ordered[end + 1][0] == ordered[start][0]:
+            end += 1
+        ties = end - start + 1
+        tie_correction += ties**3 - ties
+        for i in range(start, end + 1):
+            ranks[i] = (start + end) / 2 + 1
+        start = end + 1
+
+    rank_sum = sum(rank for rank, (_, sample) in zip(ranks, ordered) if sample == 0)
+    total = n + m
+    if total <= EXACT_TEST_LIMIT:
+        return _exact_p_value(ranks, n, rank_sum)
+
+    u = rank_sum - n * (n + 1) / 2
+    variance = n * m / 12 * ((total + 1) - tie_correction / (total * (total - 1)))
+    if variance <= 0:
+        return 1.0
+    z = (u - n * m / 2 - 0.5) / math.sqrt(variance)
+    return 1 - statistics.NormalDist().cdf(z)
+
+
+def _exact_p_value(ranks: list[float], n: int, rank_sum: float) -> float:
+    """
+    Computes the probability that `n` timings picked at random
+    have at least the given rank sum, by counting the subsets of the ranks
+    of every size and (doubled, so integer) rank sum.
+
+    Parameters:
+    -----------
+    ranks: list[float]
+        ranks of all the timings, halves for the ties
+    n: int
+        number of the current timings
+    rank_sum: float
+        rank sum of the current timings
+
+    Return:
+    --------
+    p_value: float
+        share of the subsets of `n` ranks with at least the rank sum
+    """
+
+    doubled = [round(2 * rank) for rank in ranks]
+    # counts[k][s] is the number of the subsets of k ranks with the doubled sum s
+    counts = [[1] + [0] * sum(doubled)] + [[0] * (sum(doubled) + 1) for _ in range(n)]
+    for rank in doubled:
+        for k in range(n, 0, -1):
+            below, row = counts[k - 1], counts[k]
+            for total in range(len(row) - 1, rank - 1, -1):
+                row[total] += below[total - rank]
+    at_least = sum(counts[n][round(2 * rank_sum):])
+    return at_least / math.comb(len(ranks), n)
+
+
 def parse_arguments() -> argparse.Namespace:
     """
     Parses the command line arguments.
@@ -35,60 +200,376 @@ def parse_arguments() -> argparse.Namespace:
         default=10,
         help="how many times do we repeat an experiment",
     )
+    arg_parser.add_argument(
+        "--warmup",
+        "-w",
+        type=int,
+        default=1,
+        help="how many unmeasured runs precede the experiment",
+    )
+    arg_parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="seed of the randomized solvers, the n-th run uses seed + n",
+    )
+    arg_parser.add_argument(
+        "--solvers",
+        "-s",
+        type=SudokuSolverType,
+        choices=list(SudokuSolverType),
+        nargs="+",
+        help="solvers to be compared, all of them by default",
+    )
+    arg_parser.add_argument(
+        "--output",
+        "-o",
+        type=pathlib.Path,
+        help="file to store the results in, .json or .csv",
+    )
+    arg_parser.add_argument(
+        "--metrics",
+        "-m",
+        action="store_true",
+        help="collect search metrics in an extra run of every solver on every puzzle",
+    )
+    arg_parser.add_argument(
+        "--baseline",
+        "-b",
+        type=pathlib.Path,
+        help="JSON results to compare with, the puzzles and solvers default to the baseline ones",
+    )
+    arg_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="relative slowdown of the median considered a regression",
+    )
+    arg_parser.add_argument(
+        "--alpha",
+        type=float,
+        default=0.05,
+        help="significance level of the slowdown test",
+    )
     arg_parser.add_argument(
         "puzzle_paths",
         type=pathlib.Path,
         nargs="*",
-        help="path to the files containing benchmark puzzles",
+        help="path to the files containing benchmark puzzles, text files or binary corpora (.sdc)",
     )
     return arg_parser.parse_args()
 
 
-def get_puzzle(filepath: pathlib.Path) -> SudokuGrid:
-    with open(filepath) as f:
-        lines = f.readlines()
-    return SudokuGrid.from_text(lines)
+def get_puzzles(filepath: pathlib.Path) -> list[tuple[str, SudokuGrid]]:
+    """
+    Reads all the puzzles of a file, see `read_puzzles`.
 
+    Parameters:
+    -----------
+    filepath: pathlib.Path
+        path to a text file or a binary corpus
 
-def main() -> int:
-    args = parse_arguments()
-    puzzles = [get_puzzle(puzzle_path) for puzzle_path in args.puzzle_paths]
-    results = {}
-
-    for solver_type in SudokuSolverType:
-        try:
-            start = timer()
-            for puzzle, _ in zip(puzzles, range(args.repetitions)):
-                solution = solver_type.solve(puzzle, args.time_limit)
-                if solution is None:
-                    results[solver_type] = "failure"
-            took = timer() - start
-            average_took = took / args.repetitions
-            results[solver_type] = average_took
-        except TimeoutError:
-            results[solver_type] = "timeout"
-            continue
-        except Exception:
-            results[solver_type] = "failure"
+    Return:
+    --------
+    puzzles: list[tuple[str, SudokuGrid]]
+        the puzzles with their names, the path itself for a single puzzle,
+        `<path>#<index>` for a file with more puzzles
+    """
+    puzzles = list(read_puzzles(filepath))
+    if len(puzzles) == 1:
+        return [(str(filepath), puzzles[0])]
+    return [(f"{filepath}#{index}", puzzle) for index, puzzle in enumerate(puzzles)]
+
+
+def puzzle_size(name: str, puzzle: SudokuGrid) -> int:
+    """
+    Returns the grid size of a puzzle, parsed from its name if possible.
+
+    Parameters:
+    -----------
+    name: str
+        name of the puzzle, e.g. `puzzles/sudokuN3num0.txt`
+    puzzle: SudokuGrid
+        the puzzle itself
+
+    Return:
+    --------
+    size: int
+        size of the grid, e.g. 9 for `sudokuN3num0.txt`
+    """
+    match = PUZZLE_NAME.search(pathlib.Path(name).name)
+    if match is None:
+        return puzzle.size
+    return int(match["block_size"]) ** 2
+
+
+def measure(
+    name: str,
+    puzzle: SudokuGrid,
+    solver_type: SudokuSolverType,
+    repetitions: int,
+    warmup: int,
+    time_limit: float,
+    collect_metrics: bool = False,
+    seed: int = 0,
+) -> Measurement:
+    """
+    Measures running times of a solver on a puzzle.
+    Measuring stops at the first run which has not solved the puzzle.
+
+    Parameters:
+    -----------
+    name: str
+        name of the puzzle
+    puzzle: SudokuGrid
+        the puzzle to be solved
+    solver_type: SudokuSolverType
+        the solver to be measured
+    repetitions: int
+        how many runs are measured
+    warmup: int
+        how many runs precede the measured ones
+    time_limit: float
+        time limit of every run
+    collect_metrics: bool
+        whether to collect search metrics in an extra run,
+        it is not timed, so the instrumentation does not affect the timings
+    seed: int
+        seed of the randomized solvers, the n-th run uses `seed + n`,
+        so the repetitions sample their running time distribution
+
+    Return:
+    --------
+    measurement: Measurement
+        the running times of the solver
+    """
+
+    measurement = Measurement(name, puzzle_size(name, puzzle), str(solver_type))
+    for run in range(warmup + repetitions):
+        start = timer()
+        result = solve_one(puzzle, solver_type, time_limit, seed=seed + run)
+        took = timer() - start
+        measurement.status = result.status
+        if result.status != SolveStatus.SOLVED:
+            break
+        if run >= warmup:
+            measurement.times.append(took)
+
+    if collect_metrics:
+        metrics = SearchMetrics()
+        solve_one(puzzle, solver_type, time_limit, metrics, seed=seed)
+        measurement.metrics = metrics.as_dict()
+    return measurement
+
+
+def group_by_size(measurements: list[Measurement]) -> list[dict]:
+    """
+    Aggregates the measurements of every solver over the puzzles of the same size.
+    Only the solved puzzles contribute to the statistics.
+
+    Parameters:
+    -----------
+    measurements: list[Measurement]
+        per-puzzle measurements
+
+    Return:
+    --------
+    groups: list[dict]
+        statistics per (size, solver)
+    """
+
+    groups: dict[tuple[int, str], list[Measurement]] = {}
+    for measurement in measurements:
+        groups.setdefault((measurement.size, measurement.solver), []).append(measurement)
+
+    return [
+        {
+            "size": size,
+            "solver": solver,
+            "puzzles": len(members),
+            "solved": sum(member.status == SolveStatus.SOLVED for member in members),
+            **summarize([statistics.median(member.times) for member in members if member.times]),
+        }
+        for (size, solver), members in sorted(groups.items())
+    ]
+
+
+def save(path: pathlib.Path, report: dict) -> None:
+    """
+    Stores the results in a machine-readable form,
+    JSON with all the raw timings or CSV with one row per puzzle and solver.
+
+    Parameters:
+    -----------
+    path: pathlib.Path
+        file to store the results in, its suffix selects the format
+    report: dict
+        the benchmark report
+    """
+
+    if path.suffix == ".csv":
+        with open(path, "w", newline="") as f:
+            fields = ["puzzle", "size", "solver", "status", "median", "p95", "min", "max", "stddev", "cv", "times"]
+            metric_fields = list(SearchMetrics().as_dict())
+            writer = csv.DictWriter(f, fieldnames=fields + metric_fields, extrasaction="ignore")
+            writer.writeheader()
+            for result in report["results"]:
+                writer.writerow(
+                    {**result, **(result["metrics"] or {}), "times": " ".join(map(str, result["times"]))}
+                )
+    else:
+        with open(path, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+def run_benchmark(args: argparse.Namespace) -> dict:
+    """
+    Measures every solver on every puzzle.
+
+    Parameters:
+    -----------
+    args: argparse.Namespace
+        parsed arguments
+
+    Return:
+    --------
+    report: dict
+        settings, per-puzzle results and per-size statistics
+    """
+
+    puzzles = [puzzle for puzzle_path in args.puzzle_paths for puzzle in get_puzzles(puzzle_path)]
+    measurements = [
+        measure(name, puzzle, solver_type, args.repetitions, args.warmup, args.time_limit, args.metrics, args.seed)
+        for name, puzzle in puzzles
+        for solver_type in args.solvers or list(SudokuSolverType)
+    ]
+    return {
+        "time_limit": args.time_limit,
+        "repetitions": args.repetitions,
+        "warmup": args.warmup,
+        "seed": args.seed,
+        "results": [asdict(measurement) | summarize(measurement.times) for measurement in measurements],
+        "groups": group_by_size(measurements),
+    }
+
+
+def compare(baseline: dict, report: dict, threshold: float, alpha: float) -> list[dict]:
+    """
+    Compares the results with the baseline, puzzle by puzzle.
+
+    A puzzle regresses if the baseline has solved it and now it is not solved,
+    or if its median running time has grown by more than the threshold
+    and the slowdown is statistically significant.
+
+    Parameters:
+    -----------
+    baseline: dict
+        the baseline report
+    report: dict
+        the current report
+    threshold: float
+        relative slowdown of the median considered a regression, e.g. 0.1 for 10%
+    alpha: float
+        significance level of the slowdown test
+
+    Return:
+    --------
+    comparisons: list[dict]
+        comparison of every (puzzle, solver) present in both reports
+    """
+
+    previous = {(result["puzzle"], result["solver"]): result for result in baseline["results"]}
+    comparisons = []
+    for result in report["results"]:
+        before = previous.get((result["puzzle"], result["solver"]))
+        if before is None:
             continue
 
-    good_results = sorted(
-        [
-            (solver, time)
-            for (solver, time) in results.items()
-            if isinstance(time, float)
-        ],
-        key=lambda r: r[1],
+        comparison = {
+            "puzzle": result["puzzle"],
+            "solver": result["solver"],
+            "baseline": before["median"],
+            "current": result["median"],
+            "change": None,
+            "p_value": None,
+            "regression": False,
+        }
+        if before["status"] == SolveStatus.SOLVED and result["status"] != SolveStatus.SOLVED:
+            comparison["regression"] = True
+        elif before["times"] and result["times"]:
+            comparison["change"] = result["median"] / before["median"] - 1
+            comparison["p_value"] = slower_p_value(result["times"], before["times"])
+            comparison["regression"] = comparison["change"] > threshold and comparison["p_value"] < alpha
+        comparisons.append(comparison)
+    return comparisons
+
+
+def print_comparisons(comparisons: list[dict]) -> None:
+    print(f"{'puzzle':<32} {'solver':<15} {'baseline':>10} {'current':>10} {'change':>8} {'p-value':>8}")
+    for comparison in comparisons:
+        baseline, current, change, p_value = (
+            "-" if comparison[key] is None else f"{comparison[key]:{spec}}"
+            for key, spec in (("baseline", ".4f"), ("current", ".4f"), ("change", "+.1%"), ("p_value", ".3f"))
+        )
+        verdict = "REGRESSION" if comparison["regression"] else ""
+        print(
+            f"{comparison['puzzle']:<32} {comparison['solver']:<15} "
+            f"{baseline:>10} {current:>10} {change:>8} {p_value:>8} {verdict}"
+        )
+
+
+def print_metrics(results: list[dict]) -> None:
+    print(
+        f"{'puzzle':<32} {'solver':<15} {'nodes':>8} {'backtr.':>8} {'depth':>6} "
+        f"{'choose':>8} {'assign':>8} {'check':>8} {'total':>8}"
     )
+    for result in results:
+        metrics = result["metrics"]
+        if metrics is None:
+            continue
+        print(
+            f"{result['puzzle']:<32} {result['solver']:<15} {metrics['nodes']:>8} {metrics['backtracks']:>8} "
+            f"{metrics['max_depth']:>6} {metrics['choose_time']:>8.4f} {metrics['assign_time']:>8.4f} "
+            f"{metrics['check_time']:>8.4f} {metrics['total_time']:>8.4f}"
+        )
 
-    bad_results = [
-        (solver, msg) for (solver, msg) in results.items() if isinstance(msg, str)
-    ]
 
-    for solver, result in bad_results:
-        print(f"{solver}: \t{result} sec")
-    for solver, msg in good_results:
-        print(f"{solver}: \t{msg}")
+def print_groups(groups: list[dict]) -> None:
+    columns = ("median", "p95", "min", "max", "stddev", "cv")
+    print(f"{'size':>5} {'solver':<20} {'solved':>7} " + " ".join(f"{column:>10}" for column in columns))
+    for group in groups:
+        stats = ["-" if group[key] is None else f"{group[key]:.4f}" for key in columns]
+        solved = f"{group['solved']}/{group['puzzles']}"
+        print(f"{group['size']:>5} {group['solver']:<20} {solved:>7} " + " ".join(f"{stat:>10}" for stat in stats))
+
+
+def main() -> int:
+    args = parse_arguments()
+
+    baseline = None
+    if args.baseline is not None:
+        with open(args.baseline) as f:
+            baseline = json.load(f)
+        results = baseline["results"]
+        if not args.puzzle_paths:
+            args.puzzle_paths = list(dict.fromkeys(pathlib.Path(result["puzzle"].partition("#")[0]) for result in results))
+        if not args.solvers:
+            args.solvers = list(dict.fromkeys(SudokuSolverType(result["solver"]) for result in results))
+
+    report = run_benchmark(args)
+    print_groups(report["groups"])
+    if args.metrics:
+        print()
+        print_metrics(report["results"])
+    if args.output is not None:
+        save(args.output, report)
+
+    if baseline is not None:
+        comparisons = compare(baseline, report, args.threshold, args.alpha)
+        print()
+        print_comparisons(comparisons)
+        if any(comparison["regression"] for comparison in comparisons):
+            return 1
     return 0
 
 
@@ -1,16 +1,49 @@
 import argparse
-from enum import Enum
+import json
+import sys
 
+from src.model.corpus import RecordFormat
 from src.model.grid import SudokuGrid
-from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
-from src.solvers.first_fail_solver import FirstFailSudokuSolver
-from src.solvers.naive_solver import NaiveSudokuSolver
+from src.solvers.batch import solve_stream
+from src.solvers.solver_type import SudokuSolverType
+from src.utils.metrics import SearchMetrics
 
 
-class SudokuSolverType(Enum):
-    naive = 'naive'
-    first_fail = 'first_fail' 
-    dancing_links = 'dancing_links'
+STREAM_TIME_LIMIT = 60.0
+"""Time limit (in seconds) for every puzzle of a stream, unless given by `--time-limit`"""
+
+
+def stream(args: argparse.Namespace) -> int:
+    """
+    Solves puzzles read from stdin, one per line, and writes the results
+    to stdout in the same order, see `RecordFormat` for the line formats.
+    Lines which cannot be read get the `invalid` status.
+
+    Parameters:
+    -----------
+    args: argparse.Namespace
+        parsed arguments
+
+    Return:
+    --------
+    code: int
+        the exit code
+    """
+
+    def puzzles():
+        for line in sys.stdin:
+            if not line.strip():
+                continue
+            try:
+                yield args.format.parse(line)
+            except (KeyError, TypeError, ValueError):
+                yield None
+
+    time_limit = STREAM_TIME_LIMIT if args.time_limit is None else args.time_limit
+    for result in solve_stream(puzzles(), args.algorithm, time_limit, args.jobs, args.read_ahead):
+        print(args.format.format(result.status, result.solution), flush=True)
+    return 0
+
 
 def main():
     parser = argparse.ArgumentParser(
@@ -20,34 +53,56 @@ def main():
     parser.add_argument('-a', '--algorithm',
                        type=SudokuSolverType,
                        choices=list(SudokuSolverType),
-                       default=SudokuSolverType.naive,
+                       default=SudokuSolverType.NAIVE,
                        help='algorithm used to solver the sudoku')
     parser.add_argument('--time-limit', '-t',
                        type=float,
                        help='time limit for the solver (in seconds)')
-    parser.add_argument('puzzle_path', help='path to the file containing a sudoku puzzle')
+    parser.add_argument('--metrics', '-m',
+                       action='store_true',
+                       help='print search metrics (as JSON) to stderr')
+    parser.add_argument('--seed',
+                       type=int,
+                       help='seed of the randomized solvers')
+    parser.add_argument('--workers', '-w',
+                       type=int,
+                       help='number of worker processes of the parallel solver, the number of CPUs by default')
+    parser.add_argument('--stream', '-s',
+                       action='store_true',
+                       help='solve puzzles read from stdin, one per line, and write the results to stdout')
+    parser.add_argument('--format', '-f',
+                       type=RecordFormat,
+                       choices=list(RecordFormat),
+                       default=RecordFormat.JSON,
+                       help='line format of the streamed puzzles and results')
+    parser.add_argument('--jobs', '-j',
+                       type=int,
+                       default=1,
+                       help='number of worker processes solving the streamed puzzles')
+    parser.add_argument('--read-ahead',
+                       type=int,
+                       help='how many streamed puzzles may be solved at once, twice the number of jobs by default')
+    parser.add_argument('puzzle_path', nargs='?', help='path to the file containing a sudoku puzzle')
 
     args = parser.parse_args()
+    if args.stream:
+        return stream(args)
+    if args.puzzle_path is None:
+        parser.error('the puzzle_path is required unless --stream is given')
+    metrics = SearchMetrics() if args.metrics else None
 
-    with open(args.puzzle_path, 'r') as file:
-        grid = SudokuGrid.from_text(file.readlines())
-        match args.algorithm:
-            case SudokuSolverType.naive:
-                result = NaiveSudokuSolver(grid, args.time_limit).solve(grid, args.time_limit)
-                if result is None:
-                    return 1
-                print(result.__str__())
-            case SudokuSolverType.first_fail:
-                result = FirstFailSudokuSolver(grid, args.time_limit).solve(grid, args.time_limit)
-                if result is None:
-                    return 1
-                print(result.__str__())
-            case SudokuSolverType.dancing_links:
-                result = DancingLinksSudokuSolver(grid, args.time_limit).solve(grid, args.time_limit)
-                if result is None:
-                    return 1
-                print(result.__str__())
-        return 0
+    try:
+        with open(args.puzzle_path, 'r') as file:
+            grid = SudokuGrid.from_text(file.readlines())
+            result = args.algorithm.solve(grid, args.time_limit, metrics=metrics, seed=args.seed,
+                                          workers=args.workers)
+            if result is None:
+                return 1
+            print(result.__str__())
+            return 0
+    finally:
+        if metrics is not None:
+            print(json.dumps(metrics.as_dict()), file=sys.stderr)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,91 @@
+import argparse
+import asyncio
+import sys
+
+from src.service.server import SolvingService
+from src.solvers.solver_type import SudokuSolverType
+
+
+def parse_arguments() -> argparse.Namespace:
+    """
+    Parses the command line arguments.
+
+    Return:
+    --------
+    args: argparse.Namespace
+        parsed arguments
+    """
+    arg_parser = argparse.ArgumentParser(
+        prog="sudolver",
+        description="Sudolver - yet another sudoku solver, as a service.",
+    )
+    arg_parser.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="address to listen on, the loopback by default",
+    )
+    arg_parser.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=7878,
+        help="port to listen on, 0 picks a free one",
+    )
+    arg_parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        help="number of the worker processes, the number of CPUs by default",
+    )
+    arg_parser.add_argument(
+        "--max-pending",
+        "-q",
+        dest="max_pending",
+        type=int,
+        default=64,
+        help="how many requests may be in flight at once, the others are rejected",
+    )
+    arg_parser.add_argument(
+        "--algorithm",
+        "-a",
+        type=SudokuSolverType,
+        choices=list(SudokuSolverType),
+        default=SudokuSolverType.FIRST_FAIL,
+        help="solver used by the requests not choosing one",
+    )
+    arg_parser.add_argument(
+        "--time-limit",
+        "-t",
+        dest="time_limit",
+        type=float,
+        default=10.0,
+        help="time limit of the requests not setting one (in seconds)",
+    )
+    arg_parser.add_argument(
+        "--max-time-limit",
+        dest="max_time_limit",
+        type=float,
+        default=60.0,
+        help="upper bound of the requested time limits (in seconds)",
+    )
+    return arg_parser.parse_args()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    service = SolvingService(args.workers, args.max_pending, args.algorithm, args.time_limit, args.max_time_limit)
+    async with service:
+        host, port = await service.start(args.host, args.port)
+        print(f"listening on {host}:{port}", file=sys.stderr)
+        await service.serve_forever()
+
+
+def main() -> int:
+    try:
+        asyncio.run(serve(parse_arguments()))
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,246 @@
+from __future__ import annotations
+import numpy as np
+import numpy.typing as npt
+
+from src.model.grid import SudokuGrid
+from src.model.topology import Topology
+
+
+class CandidateTensor:
+    """
+    Keeps the candidates of every cell of a sudoku grid
+    in a single `n`x`n`x`n` boolean numpy array, i.e.
+
+        candidates[row, col, value - 1]
+
+    tells whether `value` can be put in the (empty) cell (row, col).
+    The tensor is built once for the whole grid and then
+    updated with array slicing whenever a cell is filled or emptied.
+
+    Attributes:
+    -----------
+    candidates: npt.NDArray[np.bool_]
+        the candidate tensor
+    empty: npt.NDArray[np.bool_]
+        `n`x`n` array telling which cells are empty
+    row_has: npt.NDArray[np.bool_]
+        row_has[row, value - 1] tells whether the value is placed in the row
+    col_has: npt.NDArray[np.bool_]
+        col_has[col, value - 1] tells whether the value is placed in the column
+    block_has: npt.NDArray[np.bool_]
+        block_has[block, value - 1] tells whether the value is placed in the block
+    block_of: npt.NDArray[np.intp]
+        `n`x`n` array with the block index of every cell
+    block_size: int
+        size of a single block
+    topology: Topology
+        the layout of the grid
+
+    Methods:
+    --------
+    allowed(row: int, col: int, value: int) -> bool:
+        checks whether a value can be put in the cell
+    values(row: int, col: int) -> list[int]:
+        returns values which can be put in the cell
+    count(row: int, col: int) -> int:
+        returns the number of values which can be put in the cell
+    unit_counts() -> npt.NDArray[np.intp]:
+        returns how many cells of every row, column and block can take every value
+    assign(row: int, col: int, value: int) -> None:
+        updates the tensor after the cell has been filled
+    remove_assignment(row: int, col: int, value: int) -> None:
+        updates the tensor after the cell has been emptied
+    """
+
+    candidates: npt.NDArray[np.bool_]
+    empty: npt.NDArray[np.bool_]
+    row_has: npt.NDArray[np.bool_]
+    col_has: npt.NDArray[np.bool_]
+    block_has: npt.NDArray[np.bool_]
+    block_of: npt.NDArray[np.intp]
+    block_size: int
+    topology: Topology
+
+    def __init__(self, grid: SudokuGrid) -> None:
+        size = grid.size
+        self.topology = grid.topology
+        self.block_size = self.topology.block_size
+        self.block_of = self.topology.block_of
+
+        array = grid._array
+        self.empty = array == 0
+        rows, cols = np.nonzero(~self.empty)
+        values = array[rows, cols].astype(np.intp) - 1
+
+        self.row_has = np.zeros((size, size), dtype=np.bool_)
+        self.col_has = np.zeros((size, size), dtype=np.bool_)
+        self.block_has = np.zeros((size, size), dtype=np.bool_)
+        self.row_has[rows, values] = True
+        self.col_has[cols, values] = True
+        self.block_has[self.block_of[rows, cols], values] = True
+
+        everything = slice(None)
+        self.candidates = self._allowed(everything, everything)
+
+    def allowed(self, row: int, col: int, value: int) -> bool:
+        """
+        Checks whether a value can be put in the given cell.
+
+        Parameters:
+        -----------
+        row: int
+            a row coordinate
+        col: int
+            a column coordinate
+        value: int
+            a value to be stored in the cell
+
+        Return:
+        --------
+        allowed: bool
+            `True` if the cell is empty and the value is not placed
+            in its row, column or block yet, `False` otherwise
+        """
+        return bool(self.candidates[row, col, value - 1])
+
+    def values(self, row: int, col: int) -> list[int]:
+        """
+        Returns the values which can be put in the given cell.
+
+        Parameters:
+        -----------
+        row: int
+            a row coordinate
+        col: int
+            a column coordinate
+
+        Return:
+        --------
+        values: list[int]
+            acceptable values in the increasing order
+        """
+        return (np.flatnonzero(self.candidates[row, col]) + 1).tolist()
+
+    def count(self, row: int, col: int) -> int:
+        """
+        Returns the number of values which can be put in the given cell.
+
+        Parameters:
+        -----------
+        row: int
+            a row coordinate
+        col: int
+            a column coordinate
+
+        Return:
+        --------
+        count: int
+            number of candidates of the cell
+        """
+        return int(np.count_nonzero(self.candidates[row, col]))
+
+    def unit_counts(self) -> npt.NDArray[np.intp]:
+        """
+        Counts the cells of every row, column and block which can take every value.
+
+        Return:
+        --------
+        counts: npt.NDArray[np.intp]
+            `3n`x`n` array, counts[unit, value - 1] is the number of cells
+            of the unit which can take the value; the units are the rows,
+            then the columns, then the blocks, as in `Topology.units`
+        """
+        size = self.candidates.shape[0]
+        flat = self.candidates.reshape(size * size, size)
+        return np.concatenate((
+            np.count_nonzero(self.candidates, axis=1),
+            np.count_nonzero(self.candidates, axis=0),
+            np.count_nonzero(flat[self.topology.blocks], axis=1),
+        ))
+
+    def assign(self, row: int, col: int, value: int) -> None:
+        """
+        Updates the tensor after the value has been put in the given cell.
+
+        Parameters:
+        -----------
+        row: int
+            a row coordinate
+        col: int
+            a column coordinate
+        value: int
+            a value put in the cell
+        """
+
+        v = value - 1
+        block = self.topology.block_index[row][col]
+        self.empty[row, col] = False
+        self.row_has[row, v] = True
+        self.col_has[col, v] = True
+        self.block_has[block, v] = True
+
+        block_rows, block_cols = self.topology.block_slices[block]
+        self.candidates[row, col, :] = False
+        self.candidates[row, :, v] = False
+        self.candidates[:, col, v] = False
+        self.candidates[block_rows, block_cols, v] = False
+
+    def remove_assignment(self, row: int, col: int, value: int) -> None:
+        """
+        Updates the tensor after the value has been removed from the given cell.
+
+        Parameters:
+        -----------
+        row: int
+            a row coordinate
+        col: int
+            a column coordinate
+        value: int
+            a value removed from the cell
+        """
+
+        v = value - 1
+        block = self.topology.block_index[row][col]
+        self.empty[row, col] = True
+        self.row_has[row, v] = False
+        self.col_has[col, v] = False
+        self.block_has[block, v] = False
+
+        row_slice, col_slice = slice(row, row + 1), slice(col, col + 1)
+        everything = slice(None)
+        for rows, cols in (
+            (row_slice, everything),
+            (everything, col_slice),
+            self.topology.block_slices[block],
+        ):
+            self.candidates[rows, cols, v] = self._allowed(rows, cols, v)
+        self.candidates[row, col, :] = self._allowed(row_slice, col_slice)[0, 0]
+
+    def _allowed(self, rows: slice, cols: slice, value_index: slice | int = slice(None)) -> npt.NDArray[np.bool_]:
+        """
+        Computes candidates of a rectangular region of the grid from scratch.
+
+        Parameters:
+        -----------
+        rows: slice
+            rows of the region
+        cols: slice
+            columns of the region
+        value_index: slice | int
+            (indices of) values to be computed, all of them by default
+
+        Return:
+        --------
+        candidates: npt.NDArray[np.bool_]
+            candidates of the region
+        """
+
+        empty = self.empty[rows, cols]
+        if isinstance(value_index, slice):
+            empty = empty[..., None]
+        return (
+            empty
+            & ~self.row_has[rows, value_index][:, None]
+            & ~self.col_has[cols, value_index][None, :]
+            & ~self.block_has[self.block_of[rows, cols], value_index]
+        )
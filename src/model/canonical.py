@@ -0,0 +1,166 @@
+from __future__ import annotations
+from dataclasses import dataclass
+
+import numpy as np
+import numpy.typing as npt
+
+from src.model.grid import SudokuGrid
+
+
+@dataclass(frozen=True, slots=True)
+class CanonicalForm:
+    """
+    A puzzle transformed by a sudoku symmetry into a normalized orientation.
+
+    The transformation is a composition of:
+    - an optional transposition,
+    - a permutation of the bands and of the rows within every band,
+    - a permutation of the stacks and of the columns within every stack,
+    - a relabeling of the values.
+    Each of them maps solutions to solutions, so a solution of the canonical
+    grid maps back to a solution of the original puzzle.
+
+    Attributes:
+    -----------
+    grid: SudokuGrid
+        the transformed puzzle
+    key: bytes
+        the transformed puzzle as bytes, equal for puzzles with the same form
+    transposed: bool
+        whether the puzzle has been transposed first
+    rows: npt.NDArray[np.intp]
+        rows[i] is the (possibly transposed) puzzle row moved to row `i`
+    cols: npt.NDArray[np.intp]
+        cols[j] is the (possibly transposed) puzzle column moved to column `j`
+    labels: npt.NDArray[np.intp]
+        labels[value] is the canonical value of the original `value`, labels[0] = 0
+
+    Methods:
+    --------
+    to_original(solution: SudokuGrid) -> SudokuGrid:
+        maps a solution of the canonical grid back to the original puzzle
+    """
+
+    grid: SudokuGrid
+    key: bytes
+    transposed: bool
+    rows: npt.NDArray[np.intp]
+    cols: npt.NDArray[np.intp]
+    labels: npt.NDArray[np.intp]
+
+    def to_original(self, solution: SudokuGrid) -> SudokuGrid:
+        """
+        Maps a solution of the canonical grid back to the original puzzle,
+        i.e. applies the inverse transformation.
+
+        Parameters:
+        -----------
+        solution: SudokuGrid
+            a solution of the canonical grid
+
+        Return:
+        --------
+        original: SudokuGrid
+            the corresponding solution of the original puzzle
+        """
+
+        inverse = np.empty_like(self.labels)
+        inverse[self.labels] = np.arange(self.labels.size)
+        array = np.empty_like(solution._array)
+        array[np.ix_(self.rows, self.cols)] = inverse[solution._array]
+        return SudokuGrid(array.T.copy() if self.transposed else array)
+
+
+def _line_order(array: npt.NDArray, block_size: int) -> npt.NDArray[np.intp]:
+    """
+    Orders the rows of the array by signatures not changed by permuting
+    the columns or relabeling the values: the rows within every band,
+    then the bands themselves. Ties keep their original order.
+
+    The signature of a row consists of the number of its values, the sorted
+    numbers of its values in every block, and the sorted column counts
+    and global frequencies of its values.
+
+    Parameters:
+    -----------
+    array: npt.NDArray
+        the (possibly transposed) puzzle
+    block_size: int
+        size of a single block
+
+    Return:
+    --------
+    order: npt.NDArray[np.intp]
+        order[i] is the row moved to row `i`
+    """
+
+    size = array.shape[0]
+    filled = array != 0
+    frequency = np.bincount(array.reshape(-1), minlength=size + 1)
+    frequency[0] = 0
+    signatures = list(
+        map(
+            tuple,
+            np.concatenate(
+                [
+                    filled.sum(axis=1, keepdims=True),
+                    np.sort(filled.reshape(size, block_size, block_size).sum(axis=2), axis=1),
+                    np.sort(np.where(filled, filled.sum(axis=0), 0), axis=1),
+                    np.sort(frequency[array], axis=1),
+                ],
+                axis=1,
+            ).tolist(),
+        )
+    )
+
+    bands = []
+    for band in range(block_size):
+        rows = sorted(range(band * block_size, (band + 1) * block_size), key=signatures.__getitem__)
+        bands.append(([signatures[row] for row in rows], rows))
+    bands.sort(key=lambda band: band[0])
+    return np.array([row for _, rows in bands for row in rows], dtype=np.intp)
+
+
+def canonical_form(puzzle: SudokuGrid) -> CanonicalForm:
+    """
+    Transforms the puzzle into a normalized orientation.
+
+    The rows and columns are ordered by signatures invariant under
+    the other symmetries (see `_line_order`), both for the puzzle and its transposition,
+    then the values are relabeled in the order of their first appearance.
+    The smaller of the two results is the canonical form.
+
+    The form is exact: it is always the puzzle transformed by a symmetry.
+    It is not complete, i.e. isomorphic puzzles whose line signatures tie
+    may still get different forms, which only costs a cache miss.
+
+    Parameters:
+    -----------
+    puzzle: SudokuGrid
+        a sudoku puzzle
+
+    Return:
+    --------
+    form: CanonicalForm
+        the canonical form of the puzzle
+    """
+
+    best = None
+    for transposed in (False, True):
+        array = puzzle._array.T if transposed else puzzle._array
+        rows = _line_order(array, puzzle.block_size)
+        cols = _line_order(array.T, puzzle.block_size)
+        arranged = array[np.ix_(rows, cols)]
+
+        values = arranged[arranged != 0]
+        _, first = np.unique(values, return_index=True)
+        seen = values[np.sort(first)]
+        unseen = np.setdiff1d(np.arange(1, puzzle.size + 1), seen)
+        labels = np.zeros(puzzle.size + 1, dtype=np.intp)
+        labels[np.concatenate([seen, unseen]).astype(np.intp)] = np.arange(1, puzzle.size + 1)
+
+        grid = SudokuGrid(labels[arranged])
+        key = grid._array.tobytes()
+        if best is None or key < best.key:
+            best = CanonicalForm(grid, key, transposed, rows, cols, labels)
+    return best
@@ -0,0 +1,261 @@
+from __future__ import annotations
+import json
+import os
+import struct
+from collections.abc import Iterable, Iterator
+from enum import StrEnum, auto
+
+import numpy as np
+import numpy.typing as npt
+
+from src.model.grid import SudokuGrid, cell_dtype
+
+
+CORPUS_SUFFIX = ".sdc"
+"""Suffix of the binary corpus files"""
+
+CORPUS_MAGIC = b"SDKC"
+"""First bytes of every binary corpus file"""
+
+CORPUS_VERSION = 1
+
+HEADER = struct.Struct("<4sBBHI")
+"""
+Header of a binary corpus file (little-endian):
+- magic bytes `SDKC`,
+- format version,
+- cell width in bytes (`1` for uint8, `2` for uint16 cells),
+- grid size,
+- number of puzzles.
+The header is followed by the puzzles, every one stored row by row.
+"""
+
+Path = str | os.PathLike
+
+
+def read_text_puzzles(path: Path) -> Iterator[SudokuGrid]:
+    """
+    Reads puzzles from a text file lazily, one puzzle at a time.
+    Every puzzle is in the format read by `SudokuGrid.from_text`
+    and the puzzles are separated by (at least one) empty line,
+    so a single puzzle file is a valid multi-puzzle file as well.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the text file
+
+    Return:
+    --------
+    puzzles: Iterator[SudokuGrid]
+        the puzzles, in the order of the file
+    """
+
+    with open(path) as f:
+        lines: list[str] = []
+        for line in f:
+            if line.strip():
+                lines.append(line)
+            elif lines:
+                yield SudokuGrid.from_text(lines)
+                lines = []
+        if lines:
+            yield SudokuGrid.from_text(lines)
+
+
+def open_corpus(path: Path) -> np.memmap:
+    """
+    Maps a binary corpus file into memory, without reading it.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the corpus file
+
+    Return:
+    --------
+    puzzles: np.memmap
+        a read-only array of shape (number of puzzles, size, size)
+
+    Raises:
+    -------
+    value_error: ValueError
+        when the file is not a valid corpus
+    """
+
+    with open(path, "rb") as f:
+        header = f.read(HEADER.size)
+    if len(header) != HEADER.size:
+        raise ValueError(f"{path}: truncated corpus header")
+
+    magic, version, width, size, count = HEADER.unpack(header)
+    if magic != CORPUS_MAGIC or version != CORPUS_VERSION:
+        raise ValueError(f"{path}: not a sudoku corpus")
+    if width not in (1, 2) or cell_dtype(size).itemsize != width:
+        raise ValueError(f"{path}: invalid cell width {width} for size {size}")
+    if os.path.getsize(path) != HEADER.size + count * size * size * width:
+        raise ValueError(f"{path}: corpus size does not match its header")
+
+    if count == 0:
+        return np.empty((0, size, size), dtype=cell_dtype(size))
+    return np.memmap(path, dtype=f"<u{width}", mode="r", offset=HEADER.size, shape=(count, size, size))
+
+
+def read_corpus(path: Path) -> Iterator[SudokuGrid]:
+    """
+    Reads puzzles from a binary corpus file lazily.
+    Only the puzzle being yielded is copied out of the mapped file,
+    so a corpus of any length is iterated in constant memory.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the corpus file
+
+    Return:
+    --------
+    puzzles: Iterator[SudokuGrid]
+        the puzzles, in the order of the file
+    """
+
+    for array in open_corpus(path):
+        yield SudokuGrid(np.array(array, dtype=cell_dtype(len(array))))
+
+
+def write_corpus(path: Path, puzzles: Iterable[SudokuGrid]) -> int:
+    """
+    Writes puzzles to a binary corpus file, one puzzle at a time.
+    All the puzzles have to be of the same size.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the corpus file
+    puzzles: Iterable[SudokuGrid]
+        puzzles to be written
+
+    Return:
+    --------
+    count: int
+        the number of puzzles written
+
+    Raises:
+    -------
+    value_error: ValueError
+        when the puzzles differ in size
+    """
+
+    count, size = 0, None
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, 0, 0, 0))
+        for puzzle in puzzles:
+            if size is None:
+                size, dtype = puzzle.size, cell_dtype(puzzle.size).newbyteorder("<")
+            elif puzzle.size != size:
+                raise ValueError(f"puzzle of size {puzzle.size} in a corpus of size {size}")
+            f.write(puzzle.flatten().astype(dtype).tobytes())
+            count += 1
+
+        size = size or 0
+        f.seek(0)
+        f.write(HEADER.pack(CORPUS_MAGIC, CORPUS_VERSION, cell_dtype(size).itemsize, size, count))
+    return count
+
+
+def read_puzzles(path: Path) -> Iterator[SudokuGrid]:
+    """
+    Reads puzzles lazily from a binary corpus (`.sdc`) or a text file.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the file
+
+    Return:
+    --------
+    puzzles: Iterator[SudokuGrid]
+        the puzzles, in the order of the file
+    """
+
+    if os.fspath(path).endswith(CORPUS_SUFFIX):
+        return read_corpus(path)
+    return read_text_puzzles(path)
+
+
+def grid_from_values(values: npt.ArrayLike) -> SudokuGrid:
+    """
+    Creates a grid from untrusted values, e.g. parsed from a request.
+
+    Parameters:
+    -----------
+    values: npt.ArrayLike
+        rows of the grid, `0` for an empty cell
+
+    Return:
+    --------
+    grid: SudokuGrid
+        the grid
+
+    Raises:
+    -------
+    value_error: ValueError
+        when the values are not a square of integers between `0` and its size
+    """
+
+    array = np.array(values)
+    if array.ndim != 2 or array.size == 0 or not np.issubdtype(array.dtype, np.integer):
+        raise ValueError("the puzzle must be a square of integers")
+    if array.min() < 0 or array.max() > array.shape[0]:
+        raise ValueError("the puzzle values must be between 0 and its size")
+    return SudokuGrid(array)
+
+
+class RecordFormat(StrEnum):
+    """
+    Type representing the formats of puzzle streams, one puzzle per line:
+    - `JSON`: a JSON array of the rows, e.g. `[[0, 3, 4, 0], ...]`,
+      or an object with such an array under the "puzzle" key;
+      a result is an object with the status and the solution, if any,
+      e.g. `{"status": "solved", "solution": [[2, 3, 4, 1], ...]}`,
+    - `FLAT`: the size followed by all the cells row by row, separated by commas,
+      e.g. `4,0,3,4,0,...`; a result is the solution in the same format,
+      or just the status if there is no solution.
+
+    Methods:
+    --------
+    parse(self, line: str) -> SudokuGrid:
+        reads a puzzle from a line
+    format(self, status: str, solution: SudokuGrid | None) -> str:
+        writes a result as a line, without the line break
+    """
+
+    JSON = auto()
+    FLAT = auto()
+
+    def parse(self, line: str) -> SudokuGrid:
+        match self:
+            case RecordFormat.JSON:
+                record = json.loads(line)
+                return grid_from_values(record["puzzle"] if isinstance(record, dict) else record)
+            case RecordFormat.FLAT:
+                values = np.array(line.split(","), dtype=np.int64)
+                size = int(values[0]) if values.size else 0
+                if size <= 0 or values.size != 1 + size * size:
+                    raise ValueError("the record must contain the size and size x size cells")
+                return grid_from_values(values[1:].reshape(size, size))
+            case _:
+                raise NotImplementedError()
+
+    def format(self, status: str, solution: SudokuGrid | None) -> str:
+        match self:
+            case RecordFormat.JSON:
+                record = {"status": str(status)}
+                if solution is not None:
+                    record["solution"] = solution._array.tolist()
+                return json.dumps(record)
+            case RecordFormat.FLAT:
+                if solution is None:
+                    return str(status)
+                return ",".join(map(str, [solution.size, *solution.flatten().tolist()]))
+            case _:
+                raise NotImplementedError()
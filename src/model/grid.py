@@ -4,6 +4,26 @@ import math  # noqa
 import numpy as np
 import numpy.typing as npt
 
+from src.model.topology import Topology, topology
+
+
+def cell_dtype(size: int) -> np.dtype:
+    """
+    Returns the narrowest unsigned integer type able to hold
+    the values of a grid of the given size.
+
+    Parameters:
+    -----------
+    size: int
+        size of the grid
+
+    Return:
+    --------
+    dtype: np.dtype
+        `uint8` for grids up to 255x255, `uint16` otherwise
+    """
+    return np.dtype(np.uint8) if size <= np.iinfo(np.uint8).max else np.dtype(np.uint16)
+
 
 @dataclass(frozen=True, slots=True)
 class SudokuGrid:
@@ -61,9 +81,11 @@ class SudokuGrid:
 
     Protected Attributes:
     ---------------------
-    _array: npt.NDArray[np.uint]
+    _array: npt.NDArray[np.unsignedinteger]
         Underlying representation of the grid.
-        Uses dtype=np.uint to ensure its values are non-negative integer numbers.
+        Uses the narrowest unsigned dtype fitting the grid size (see `cell_dtype`),
+        i.e. `uint8` up to 255x255 and `uint16` beyond. An array of another dtype
+        is converted when the grid is created, values out of 0..n raise ValueError.
 
     Properties:
     -----------
@@ -71,10 +93,12 @@ class SudokuGrid:
         size of the grid
     block_size: int
         size of the single block
+    topology: Topology
+        the (cached) layout of rows, columns and blocks of the grid
 
     Methods:
     --------
-    __getitem__(coords: tuple[int, int]) -> np.uint:
+    __getitem__(coords: tuple[int, int]) -> np.unsignedinteger:
         returns a value at the given coordinates
     __setitem__(coords: tuple[int,int], value: int) -> None:
         puts a value in the given cell of the grid
@@ -82,10 +106,12 @@ class SudokuGrid:
         enumerates over the grid cells
     block_index(cell_row: int, cell_column: int) -> int:
         returns block index of the given cell
-    block(block_index: int) -> npt.NDArray[np.uint]
+    block(block_index: int) -> npt.NDArray[np.unsignedinteger]
         returns a block of the grid with the given index
     copy() -> SudokuGrid:
         returns a copy of the grid
+    to_array(dtype: npt.DTypeLike) -> npt.NDArray:
+        returns a copy of the grid array widened to the given dtype
 
     Static Methods:
     ---------------
@@ -93,12 +119,18 @@ class SudokuGrid:
         creates the grid from a textual representation
     """
 
-    _array: npt.NDArray[np.uint]
+    _array: npt.NDArray[np.unsignedinteger]
 
     def __post_init__(self) -> None:
         rows, columns = self._array.shape
         if self._array.ndim != 2 or rows != columns or not math.sqrt(rows).is_integer():
             raise ValueError
+        dtype = cell_dtype(rows)
+        if self._array.dtype != dtype:
+            # narrowing would silently wrap the values not fitting the grid
+            if self._array.size and (self._array.min() < 0 or self._array.max() > rows):
+                raise ValueError
+            object.__setattr__(self, "_array", self._array.astype(dtype))
 
     @property
     def size(self) -> int:
@@ -122,9 +154,21 @@ class SudokuGrid:
         size: int
             the size of a single block, e.g. 3 for a 9x9 grid.
         """
-        return int(math.sqrt(self._array.shape[0]))
+        return self.topology.block_size
+
+    @property
+    def topology(self) -> Topology:
+        """
+        Returns the layout of the grid, shared by all grids of the same size.
+
+        Return:
+        --------
+        topology: Topology
+            the topology of the grid
+        """
+        return topology(self._array.shape[0])
 
-    def __getitem__(self, coords: tuple[int, int]) -> np.uint:
+    def __getitem__(self, coords: tuple[int, int]) -> np.unsignedinteger:
         """
         Returns a value of the given cell in the grid.
 
@@ -134,8 +178,8 @@ class SudokuGrid:
             coordinates (row, col) of the cell
         Return:
         --------
-        value: np.uint
-            a numpy array with values from the specified block
+        value: np.unsignedinteger
+            the value stored in the cell
         """
         return self._array[coords]
 
@@ -164,14 +208,14 @@ class SudokuGrid:
         """
         return np.ndenumerate(self._array)
     
-    def flatten(self) -> npt.NDArray[np.uint]:
+    def flatten(self) -> npt.NDArray[np.unsignedinteger]:
         """
         Returns a 1D copy of the grid array.
         See: https://numpy.org/doc/2.2/reference/generated/numpy.ndarray.flatten.html
 
         Return:
         --------
-        flat_grid: npt.NDArray[np.uint]
+        flat_grid: npt.NDArray[np.unsignedinteger]
             a flat copy of the array
         """
         return self._array.flatten()
@@ -193,13 +237,9 @@ class SudokuGrid:
             index of the block the specified cell belongs to
         """
 
-        #dla col 6 row 4
-        a = cell_column // self.block_size
-        b = cell_row // self.block_size
-        b *= self.block_size
-        return a+b
+        return self.topology.block_index[cell_row][cell_column]
 
-    def block(self, block_index: int) -> npt.NDArray[np.uint]:
+    def block(self, block_index: int) -> npt.NDArray[np.unsignedinteger]:
         """
         Returns a single block with a given index.
 
@@ -210,17 +250,11 @@ class SudokuGrid:
 
         Return:
         --------
-        block: npt.NDArray[np.uint]
+        block: npt.NDArray[np.unsignedinteger]
             a numpy array with values from the specified block
         """
 
-        a = block_index
-        block_row = (block_index // self.block_size) * self.block_size
-        block_col = (block_index % self.block_size) * self.block_size
-        return self._array[
-               block_row : block_row + self.block_size,
-               block_col : block_col + self.block_size
-               ]
+        return self._array[self.topology.block_slices[block_index]]
 
     def copy(self) -> SudokuGrid:
         """
@@ -233,6 +267,23 @@ class SudokuGrid:
         """
         return SudokuGrid(self._array.copy())
 
+    def to_array(self, dtype: npt.DTypeLike) -> npt.NDArray:
+        """
+        Returns a copy of the grid array converted to the given dtype,
+        e.g. to pass the grid to code expecting wider integers (like C `int`).
+
+        Parameters:
+        -----------
+        dtype: npt.DTypeLike
+            the desired dtype
+
+        Return:
+        --------
+        array: npt.NDArray
+            a C-contiguous copy of the grid array
+        """
+        return np.array(self._array, dtype=dtype, order="C")
+
     def __str__(self) -> str:
         """
         Prints the grid in a pretty format, e.g.
@@ -315,21 +366,20 @@ class SudokuGrid:
 
         if not lines:
             raise ValueError()
-        
-        size = len(lines[0].split(','))
-        
+
+        size = lines[0].count(',') + 1
+
         if not math.sqrt(size).is_integer():
             raise ValueError()
-        
-        block_size = int(math.sqrt(size))
-        merged = []
-        
-        for line in lines:
-            nums = line.split(',')
-            if len(nums) != size:
-                raise ValueError
-            for num in nums:
-                merged.append(int(num))
 
-        grid = np.array(merged, dtype=np.uint).reshape(size, size)
+        if len(lines) != size or any(line.count(',') + 1 != size for line in lines):
+            raise ValueError
+
+        # the whole block is parsed at once, a malformed number raises ValueError;
+        # it is parsed wide, so out-of-range values are rejected instead of wrapped
+        merged = np.fromstring(','.join(lines), dtype=np.int64, sep=',')
+        if merged.size != size * size:
+            raise ValueError
+
+        grid = merged.reshape(size, size)
         return SudokuGrid(grid)
@@ -0,0 +1,119 @@
+from __future__ import annotations
+import math
+from dataclasses import dataclass
+from functools import cache
+
+import numpy as np
+import numpy.typing as npt
+
+
+@dataclass(frozen=True, slots=True)
+class Topology:
+    """
+    The layout of a sudoku grid of a given size: which cells form
+    the rows, columns and blocks, and which block every cell belongs to.
+    It does not depend on the values of the grid, so a single instance
+    (see `topology`) is shared by all the grids of the same size.
+
+    The cells are numbered row by row, i.e. the cell (row, col)
+    has the flat index `row * size + col`. The arrays are read-only.
+
+    Attributes:
+    -----------
+    size: int
+        size of the grid
+    block_size: int
+        size of a single block
+    block_of: npt.NDArray[np.intp]
+        `n`x`n` array with the block index of every cell
+    block_index: tuple[tuple[int, ...], ...]
+        the same as `block_of`, as nested tuples of Python ints for the hot loops
+    rows: npt.NDArray[np.intp]
+        rows[row] contains flat indices of the cells in the row
+    cols: npt.NDArray[np.intp]
+        cols[col] contains flat indices of the cells in the column
+    blocks: npt.NDArray[np.intp]
+        blocks[block] contains flat indices of the cells in the block
+    block_slices: tuple[tuple[slice, slice], ...]
+        block_slices[block] is the pair of (row, column) slices of the block
+    cells: tuple[tuple[int, int, int], ...]
+        cells[index] is the (row, column, block) triple of the cell with the flat index,
+        the same tuple object is shared by all the tables below
+    units: tuple[tuple[tuple[int, int, int], ...], ...]
+        the (row, column, block) triples of the cells of every unit: the rows first,
+        then the columns, then the blocks, i.e. the cell (row, col) belongs to the units
+        `row`, `size + col` and `2 * size + block`; its peers are the other cells
+        of these units, so the units replace a peer table, which would take
+        hundreds of megabytes for a 256x256 grid
+    """
+
+    size: int
+    block_size: int
+    block_of: npt.NDArray[np.intp]
+    block_index: tuple[tuple[int, ...], ...]
+    rows: npt.NDArray[np.intp]
+    cols: npt.NDArray[np.intp]
+    blocks: npt.NDArray[np.intp]
+    block_slices: tuple[tuple[slice, slice], ...]
+    cells: tuple[tuple[int, int, int], ...]
+    units: tuple[tuple[tuple[int, int, int], ...], ...]
+
+
+@cache
+def topology(size: int) -> Topology:
+    """
+    Returns the topology of a grid of the given size,
+    it is computed once per size and then reused.
+
+    Parameters:
+    -----------
+    size: int
+        size of the grid, a perfect square
+
+    Return:
+    --------
+    topology: Topology
+        the (shared) topology of the grid
+    """
+
+    block_size = math.isqrt(size)
+    indices = np.arange(size)
+    block_of = (indices[:, None] // block_size) * block_size + indices[None, :] // block_size
+
+    cells = np.arange(size * size).reshape(size, size)
+    blocks = (
+        cells.reshape(block_size, block_size, block_size, block_size)
+        .swapaxes(1, 2)
+        .reshape(size, size)
+    )
+    block_slices = tuple(
+        (
+            slice(block_row * block_size, (block_row + 1) * block_size),
+            slice(block_col * block_size, (block_col + 1) * block_size),
+        )
+        for block_row in range(block_size)
+        for block_col in range(block_size)
+    )
+
+    rows, cols = cells, cells.T.copy()
+    for array in (block_of, rows, cols, blocks):
+        array.flags.writeable = False
+
+    block_index = tuple(map(tuple, block_of.tolist()))
+    triples = tuple((row, col, block_index[row][col]) for row in range(size) for col in range(size))
+    units = tuple(
+        tuple(triples[cell] for cell in unit)
+        for unit in np.concatenate((rows, cols, blocks)).tolist()
+    )
+    return Topology(
+        size,
+        block_size,
+        block_of,
+        block_index,
+        rows,
+        cols,
+        blocks,
+        block_slices,
+        triples,
+        units,
+    )
@@ -0,0 +1,391 @@
+from __future__ import annotations
+import asyncio
+import json
+import math
+import multiprocessing
+import os
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from timeit import default_timer as timer
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.batch import SolveResult, SolveStatus, solve_one
+from src.solvers.solver_type import SudokuSolverType
+
+
+REJECTED = "rejected"
+"""Status of a request turned away because too many requests are in flight"""
+
+
+def _solve(puzzle: SudokuGrid, solver_type: SudokuSolverType, deadline: float) -> SolveResult:
+    """
+    Solves a puzzle in a worker process, within the time left until the deadline.
+    A request which has waited in the queue past its deadline is not solved at all.
+
+    Parameters:
+    -----------
+    puzzle: SudokuGrid
+        a sudoku puzzle to be solved
+    solver_type: SudokuSolverType
+        which solver should be used
+    deadline: float
+        wall-clock time (see `time.time`) by which the request must be answered,
+        the wall clock is shared by the processes unlike the monotonic timers
+
+    Return:
+    --------
+    result: SolveResult
+        the outcome of solving the puzzle
+    """
+
+    time_limit = deadline - time.time()
+    if time_limit <= 0:
+        return SolveResult(SolveStatus.TIMEOUT)
+    return solve_one(puzzle, solver_type, time_limit)
+
+
+def _percentile(ordered: list[float], fraction: float) -> float | None:
+    if not ordered:
+        return None
+    return ordered[max(math.ceil(fraction * len(ordered)) - 1, 0)]
+
+
+class SolvingService:
+    """
+    An asyncio server solving puzzles sent over a local socket.
+
+    The protocol is line-based JSON: every request is a single line with an object
+    ```
+    {"id": 1, "puzzle": [[0, 3, 4, 0], ...], "algorithm": "first_fail", "time_limit": 1.5}
+    ```
+    where only the puzzle (rows of ints, `0` for an empty cell) is required.
+    Every response is a single line with the same id and a status
+    (see `SolveStatus`, or "rejected") plus the solution, if any.
+    A request `{"command": "stats"}` returns the statistics instead, see `stats`.
+    The requests of a connection are handled concurrently, so the responses
+    may come in a different order, matched by their ids.
+
+    The puzzles are solved by a pool of processes. Requests in flight
+    (waiting or being solved) are bounded: once there are `max_pending` of them,
+    new requests are rejected right away rather than queued, so an overloaded
+    service keeps its latency instead of building an unbounded backlog.
+    The time limit of a request covers its waiting in the queue as well.
+    A request answered with a timeout keeps its place until its worker
+    actually finishes, so the bound caps the real load of the pool.
+
+    Attributes:
+    -----------
+    in_flight: int
+        number of the requests waiting or being solved,
+        including the timed out ones still being solved
+    accepted: int
+        number of the requests handed to the pool
+    rejected: int
+        number of the requests turned away because of the overload
+
+    Protected Attributes:
+    ---------------------
+    _workers: int
+        number of the worker processes
+    _max_pending: int
+        how many requests may be in flight at once
+    _algorithm: SudokuSolverType
+        solver used by the requests not choosing one
+    _time_limit: float
+        time limit of the requests not setting one
+    _max_time_limit: float
+        upper bound of the requested time limits
+    _latencies: deque[float]
+        latencies (in seconds) of the latest answered requests
+    _peak_in_flight: int
+        the largest number of the requests in flight so far
+    _executor: ProcessPoolExecutor | None
+        the pool, created once the service starts
+    _server: asyncio.Server | None
+        the listening server, once the service starts
+    _connections: dict[asyncio.Task, asyncio.StreamWriter]
+        tasks serving the open connections, with their outgoing sides
+    _requests: set[asyncio.Task]
+        tasks answering the requests
+
+    Methods:
+    --------
+    start(host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        starts listening, returns the bound address
+    serve_forever() -> None:
+        serves until cancelled
+    close() -> None:
+        stops listening and shuts the pool down
+    handle(request: dict) -> dict:
+        answers a single request
+    stats() -> dict:
+        returns the queue depth and the latency percentiles
+    """
+
+    TIMEOUT_GRACE: float = 0.5
+    HISTORY: int = 1000
+
+    in_flight: int
+    accepted: int
+    rejected: int
+    _workers: int
+    _max_pending: int
+    _algorithm: SudokuSolverType
+    _time_limit: float
+    _max_time_limit: float
+    _latencies: deque[float]
+    _peak_in_flight: int
+    _executor: ProcessPoolExecutor | None
+    _server: asyncio.Server | None
+    _connections: dict[asyncio.Task, asyncio.StreamWriter]
+    _requests: set[asyncio.Task]
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        max_pending: int = 64,
+        algorithm: SudokuSolverType = SudokuSolverType.FIRST_FAIL,
+        time_limit: float = 10.0,
+        max_time_limit: float = 60.0,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        workers: int | None
+            number of the worker processes, the number of CPUs by default
+        max_pending: int
+            how many requests may be in flight at once, the others are rejected
+        algorithm: SudokuSolverType
+            solver used by the requests not choosing one
+        time_limit: float
+            time limit (in seconds) of the requests not setting one
+        max_time_limit: float
+            upper bound (in seconds) of the requested time limits
+        """
+
+        self.in_flight = 0
+        self.accepted = 0
+        self.rejected = 0
+        self._workers = workers or os.cpu_count() or 1
+        self._max_pending = max_pending
+        self._algorithm = algorithm
+        self._time_limit = time_limit
+        self._max_time_limit = max_time_limit
+        self._latencies = deque(maxlen=self.HISTORY)
+        self._peak_in_flight = 0
+        self._executor = None
+        self._server = None
+        self._connections = {}
+        self._requests = set()
+
+    async def __aenter__(self) -> SolvingService:
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> tuple[str, int]:
+        """
+        Starts the pool and listens for the connections.
+        The workers are started by a fork server, so the main module
+        has to be safe to import (see `multiprocessing` start methods).
+
+        Parameters:
+        -----------
+        host: str
+            address to listen on, the loopback by default
+        port: int
+            port to listen on, `0` picks a free one
+
+        Return:
+        --------
+        address: tuple[str, int]
+            the bound host and port
+        """
+
+        # forked workers would inherit the sockets of the server and its clients,
+        # so closed connections would stay open as long as the pool lives
+        self._executor = ProcessPoolExecutor(
+            max_workers=self._workers, mp_context=multiprocessing.get_context("forkserver")
+        )
+        self._server = await asyncio.start_server(self._serve_connection, host, port)
+        return self._server.sockets[0].getsockname()[:2]
+
+    async def serve_forever(self) -> None:
+        await self._server.serve_forever()
+
+    async def close(self) -> None:
+        """
+        Stops listening, closes the open connections and shuts the pool down.
+        The requests waiting for a worker are dropped, the ones being solved
+        are answered within their time limits before the connections close.
+        """
+
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        await asyncio.gather(*self._requests, return_exceptions=True)
+        for writer in self._connections.values():
+            writer.close()
+        await asyncio.gather(*self._connections, return_exceptions=True)
+
+    def stats(self) -> dict:
+        """
+        Returns the statistics of the service.
+
+        Return:
+        --------
+        stats: dict
+            numbers of the requests in flight, waiting for a worker
+            (`queue_depth`), accepted and rejected, the peak number
+            of the requests in flight and the 50th, 95th and 99th percentile
+            of the latencies (in seconds) of the latest answered requests
+        """
+
+        ordered = sorted(self._latencies)
+        return {
+            "in_flight": self.in_flight,
+            "queue_depth": max(self.in_flight - self._workers, 0),
+            "peak_in_flight": self._peak_in_flight,
+            "max_pending": self._max_pending,
+            "accepted": self.accepted,
+            "rejected": self.rejected,
+            "latency_p50": _percentile(ordered, 0.50),
+            "latency_p95": _percentile(ordered, 0.95),
+            "latency_p99": _percentile(ordered, 0.99),
+        }
+
+    async def handle(self, request: dict) -> dict:
+        """
+        Answers a single request, see the class description for the format.
+
+        Parameters:
+        -----------
+        request: dict
+            a decoded request
+
+        Return:
+        --------
+        response: dict
+            the response to be encoded
+        """
+
+        response = {"id": request.get("id")} if isinstance(request, dict) else {"id": None}
+        if isinstance(request, dict) and request.get("command") == "stats":
+            return response | self.stats()
+
+        try:
+            puzzle, solver_type, time_limit = self._parse(request)
+        except (KeyError, TypeError, ValueError) as error:
+            return response | {"status": SolveStatus.INVALID, "error": str(error) or type(error).__name__}
+
+        if self.in_flight >= self._max_pending:
+            self.rejected += 1
+            return response | {"status": REJECTED}
+
+        self.in_flight += 1
+        self.accepted += 1
+        self._peak_in_flight = max(self._peak_in_flight, self.in_flight)
+        start = timer()
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._executor, _solve, puzzle, solver_type, time.time() + time_limit
+            )
+        except RuntimeError:
+            self.in_flight -= 1
+            result = SolveResult(SolveStatus.FAILURE)
+        else:
+            # the slot is released once the worker is done, not once the request is answered
+            future.add_done_callback(self._release)
+            try:
+                result = await asyncio.wait_for(asyncio.shield(future), time_limit + self.TIMEOUT_GRACE)
+            except TimeoutError:
+                result = SolveResult(SolveStatus.TIMEOUT)
+            except Exception:
+                result = SolveResult(SolveStatus.FAILURE)
+        self._latencies.append(timer() - start)
+
+        response["status"] = str(result.status)
+        if result.solution is not None:
+            response["solution"] = result.solution._array.tolist()
+        return response
+
+    def _release(self, future: asyncio.Future) -> None:
+        self.in_flight -= 1
+
+    def _parse(self, request: dict) -> tuple[SudokuGrid, SudokuSolverType, float]:
+        """
+        Validates a request.
+
+        Parameters:
+        -----------
+        request: dict
+            a decoded request
+
+        Return:
+        --------
+        puzzle: SudokuGrid
+            the puzzle to be solved
+        solver_type: SudokuSolverType
+            the solver to be used
+        time_limit: float
+            the time limit (in seconds), at most `max_time_limit`
+
+        Raises:
+        -------
+        error: KeyError | TypeError | ValueError
+            if the request is malformed
+        """
+
+        puzzle = grid_from_values(request["puzzle"])
+
+        solver_type = SudokuSolverType(request.get("algorithm", self._algorithm))
+        time_limit = float(request.get("time_limit", self._time_limit))
+        if not time_limit > 0:
+            raise ValueError("the time limit must be positive")
+        return puzzle, solver_type, min(time_limit, self._max_time_limit)
+
+    async def _serve_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """
+        Reads the requests of a connection line by line, handles them concurrently
+        and writes every response as soon as it is ready.
+
+        Parameters:
+        -----------
+        reader: asyncio.StreamReader
+            the incoming side of the connection
+        writer: asyncio.StreamWriter
+            the outgoing side of the connection
+        """
+
+        async def answer(line: bytes) -> None:
+            try:
+                request = json.loads(line)
+            except ValueError as error:
+                response = {"id": None, "status": SolveStatus.INVALID, "error": str(error)}
+            else:
+                response = await self.handle(request)
+            writer.write(json.dumps(response).encode() + b"\n")
+            await writer.drain()
+
+        self._connections[asyncio.current_task()] = writer
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                if not line.strip():
+                    continue
+                task = asyncio.create_task(answer(line))
+                for pending in (tasks, self._requests):
+                    pending.add(task)
+                    task.add_done_callback(pending.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            del self._connections[asyncio.current_task()]
+            writer.close()
@@ -0,0 +1,175 @@
+from abc import abstractmethod
+from collections.abc import Hashable, Iterable, Iterator
+
+from src.solvers.solver import SudokuSolver
+
+
+class BacktrackingSudokuSolver(SudokuSolver):
+    """
+    An abstract backtracking sudoku solver.
+    The search is performed iteratively, using an explicit stack
+    of (variable, remaining candidates) records instead of recursion,
+    so it works for grids of any size without touching the recursion limit.
+
+    Subclasses decide which variable is filled next and how to (un)assign it.
+
+    Methods:
+    --------
+    _dfs() -> bool:
+        performs the depth-first-search
+    _solutions() -> Iterator[None]:
+        performs the depth-first-search, pausing at every solution
+    _candidates(variable: Hashable, domain: Iterable[int]) -> Iterable[int]:
+        orders the values to be tried for the chosen variable
+    _propagate() -> bool:
+        checks consequences of the latest assignment
+
+    Abstract Methods:
+    -----------------
+    _choose_variable() -> tuple[Hashable, Iterable[int]] | None:
+        chooses the next variable to be filled together with its domain
+    _assign(variable: Hashable, value: int) -> None:
+        assigns a value to the variable
+    _remove_assignment(variable: Hashable) -> None:
+        removes the variable's assignment
+    """
+
+    def _dfs(self) -> bool:
+        """
+        Performs a depth-first-search to solve the sudoku puzzle.
+        The search stops at the first solution, which is left in place.
+
+        Return:
+        --------
+        solved: bool
+            `True` - if method found the solution
+            `False` - otherwise
+        """
+
+        for _ in self._solutions():
+            return True
+        return False
+
+    def _solutions(self) -> Iterator[None]:
+        """
+        Performs a depth-first-search, yielding whenever all the variables
+        are assigned, i.e. the current assignment is a solution.
+        Resuming the iterator removes the last assignment and continues
+        the search, so the whole search space is enumerated.
+
+        Every stack record holds a variable and an iterator over the values
+        not tried yet. The top record's variable is assigned the next value
+        and a new record is pushed for the next variable. When a record runs
+        out of values, it is popped and the assignment of the variable below
+        it is removed, i.e. we backtrack. An assignment found inconsistent
+        by `_propagate` is removed right away and the next value is tried.
+
+        Return:
+        --------
+        solutions: Iterator[None]
+            an iterator pausing at every solution
+        """
+
+        choice = self._choose_variable()
+        if choice is None:
+            yield
+            return
+
+        stack: list[tuple[Hashable, Iterator[int]]] = [self._record(*choice)]
+        while stack:
+            if self._timeout():
+                raise TimeoutError()
+
+            variable, candidates = stack[-1]
+            value = next(candidates, None)
+            if value is None:
+                stack.pop()
+                if stack:
+                    self._remove_assignment(stack[-1][0])
+                continue
+
+            self._assign(variable, value)
+            if not self._propagate():
+                self._remove_assignment(variable)
+                continue
+            choice = self._choose_variable()
+            if choice is None:
+                yield
+                self._remove_assignment(variable)
+                continue
+            stack.append(self._record(*choice))
+
+    def _record(self, variable: Hashable, domain: Iterable[int]) -> tuple[Hashable, Iterator[int]]:
+        return variable, iter(self._candidates(variable, domain))
+
+    def _candidates(self, variable: Hashable, domain: Iterable[int]) -> Iterable[int]:
+        """
+        Orders the values to be tried for the given variable.
+        By default, the domain is tried as it is.
+
+        Parameters:
+        -----------
+        variable: Hashable
+            a variable chosen by `_choose_variable`
+        domain: Iterable[int]
+            its available values
+
+        Return:
+        --------
+        candidates: Iterable[int]
+            values to be tried, in order
+        """
+        return domain
+
+    def _propagate(self) -> bool:
+        """
+        Checks (and possibly applies) consequences of the latest assignment.
+        By default, there is nothing to check.
+        Whatever it changes, is undone by removing the latest assignment.
+
+        Return:
+        --------
+        consistent: bool
+            `False` if the latest assignment certainly leads to no solution
+            `True` otherwise
+        """
+        return True
+
+    @abstractmethod
+    def _choose_variable(self) -> tuple[Hashable, Iterable[int]] | None:
+        """
+        Chooses the next variable to be filled.
+
+        Return:
+        --------
+        var_dom: tuple[Hashable, Iterable[int]] | None:
+            if there are no free variables left, returns `None`
+            otherwise returns the next variable together with its domain
+        """
+        pass
+
+    @abstractmethod
+    def _assign(self, variable: Hashable, value: int) -> None:
+        """
+        Assigns a given value to a given variable.
+
+        Parameters:
+        -----------
+        variable: Hashable
+            variable to be assigned to
+        value: int
+            what value should we assign
+        """
+        pass
+
+    @abstractmethod
+    def _remove_assignment(self, variable: Hashable) -> None:
+        """
+        Removes a value assignment.
+
+        Parameters:
+        -----------
+        variable: Hashable
+            an already assigned variable
+        """
+        pass
@@ -0,0 +1,228 @@
+from __future__ import annotations
+import math
+import multiprocessing
+import os
+import threading
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from functools import partial
+from queue import SimpleQueue
+from typing import Iterable
+
+from src.model.grid import SudokuGrid
+from src.solvers.dancing_links_pool import DancingLinksPool
+from src.solvers.solution_cache import SolutionCache
+from src.solvers.solve_result import SolveResult, SolveStatus
+from src.solvers.solver_type import SudokuSolverType
+from src.utils.metrics import SearchMetrics
+
+
+def solve_one(
+    puzzle: SudokuGrid,
+    solver_type: SudokuSolverType,
+    time_limit: float,
+    metrics: SearchMetrics | None = None,
+    cache: SolutionCache | None = None,
+    seed: int | None = None,
+    workers: int | None = None,
+) -> SolveResult:
+    """
+    Solves a single puzzle and reports the outcome instead of raising.
+
+    Parameters:
+    -----------
+    puzzle: SudokuGrid
+        a sudoku puzzle to be solved
+    solver_type: SudokuSolverType
+        which solver should be used
+    time_limit: float
+        amount of time (in seconds) available to the solver
+    metrics: SearchMetrics | None
+        if given, it is filled with statistics of the run
+    cache: SolutionCache | None
+        if given, solutions are looked up there first and stored there
+    seed: int | None
+        seed of the randomized solvers
+    workers: int | None
+        number of the worker processes of the parallel solvers
+
+    Return:
+    --------
+    result: SolveResult
+        the outcome of solving the puzzle
+    """
+
+    try:
+        solution = solver_type.solve(puzzle, time_limit, metrics, cache, seed, workers)
+    except TimeoutError:
+        return SolveResult(SolveStatus.TIMEOUT)
+    except Exception:
+        return SolveResult(SolveStatus.FAILURE)
+
+    if solution is None:
+        return SolveResult(SolveStatus.UNSOLVABLE)
+    return SolveResult(SolveStatus.SOLVED, solution)
+
+
+def solve_batch(
+    puzzles: Iterable[SudokuGrid],
+    solver_type: SudokuSolverType,
+    time_limit: float,
+    workers: int | None = None,
+    chunk_size: int | None = None,
+) -> list[SolveResult]:
+    """
+    Solves many puzzles in parallel using a pool of processes.
+    Every puzzle gets its own time limit, enforced by the solver itself.
+    The dancing links puzzles are solved by a `DancingLinksPool`.
+
+    Parameters:
+    -----------
+    puzzles: Iterable[SudokuGrid]
+        sudoku puzzles to be solved
+    solver_type: SudokuSolverType
+        which solver should be used
+    time_limit: float
+        amount of time (in seconds) available for every single puzzle
+    workers: int | None
+        number of the worker processes, the number of CPUs by default;
+        `1` solves the puzzles in the current process
+    chunk_size: int | None
+        how many puzzles are sent to a worker at once,
+        by default the puzzles are split into about four chunks per worker
+
+    Return:
+    --------
+    results: list[SolveResult]
+        outcomes in the order of the puzzles
+    """
+
+    puzzles = list(puzzles)
+    workers = workers or os.cpu_count() or 1
+    solve = partial(solve_one, solver_type=solver_type, time_limit=time_limit)
+
+    if workers == 1 or len(puzzles) <= 1:
+        return [solve(puzzle) for puzzle in puzzles]
+
+    workers = min(workers, len(puzzles))
+    if solver_type == SudokuSolverType.DANCING_LINKS:
+        # the C solver runs in processes of its own anyway, a pool of them
+        # loads the library once per worker rather than once per puzzle
+        with DancingLinksPool(workers) as pool:
+            return pool.solve_many(puzzles, time_limit)
+
+    chunk_size = chunk_size or math.ceil(len(puzzles) / (4 * workers))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(solve, puzzles, chunksize=chunk_size))
+
+
+def solve_stream(
+    puzzles: Iterable[SudokuGrid | None],
+    solver_type: SudokuSolverType,
+    time_limit: float,
+    workers: int = 1,
+    read_ahead: int | None = None,
+) -> Iterator[SolveResult]:
+    """
+    Solves a stream of puzzles lazily, yielding the results in the order of the puzzles.
+    At most `read_ahead` puzzles are taken from the stream before their results
+    are yielded, so a stream of any length is solved in constant memory.
+
+    With several workers the stream is read by a background thread, so a result
+    is yielded as soon as it (and all the results before it) is ready, even while
+    reading the next puzzle blocks, e.g. on a pipe waiting for that very result.
+    The workers are started by a fork server, so the main module has to be safe
+    to import (see `multiprocessing` start methods).
+
+    Parameters:
+    -----------
+    puzzles: Iterable[SudokuGrid | None]
+        sudoku puzzles to be solved, `None` stands for a puzzle which could not be read
+    solver_type: SudokuSolverType
+        which solver should be used
+    time_limit: float
+        amount of time (in seconds) available for every single puzzle
+    workers: int
+        number of the worker processes, `1` solves the puzzles in the current process
+    read_ahead: int | None
+        how many puzzles may be submitted to the workers at once,
+        twice the number of workers by default
+
+    Return:
+    --------
+    results: Iterator[SolveResult]
+        outcomes in the order of the puzzles
+    """
+
+    solve = partial(solve_one, solver_type=solver_type, time_limit=time_limit)
+    if workers == 1:
+        for puzzle in puzzles:
+            yield SolveResult(SolveStatus.INVALID) if puzzle is None else solve(puzzle)
+        return
+
+    # the reader thread and the finished solves both report to the same queue,
+    # so waiting for either of them is a single blocking `get`
+    events: SimpleQueue = SimpleQueue()
+    slots = threading.Semaphore(max(read_ahead or 2 * workers, 1))
+    threading.Thread(target=_read, args=(puzzles, events, slots), daemon=True).start()
+
+    pending: deque[Future[SolveResult] | None] = deque()
+    exhausted = False
+    # a forked worker would start with the stdin lock held by the reader thread
+    # and hang closing stdin, so the workers are started by a fork server
+    context = multiprocessing.get_context("forkserver")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as executor:
+        while not exhausted or pending:
+            event = events.get()
+            if event is _END:
+                exhausted = True
+            elif isinstance(event, BaseException):
+                raise event
+            elif event is not _DONE:
+                future = None if event is None else executor.submit(solve, event)
+                if future is not None:
+                    future.add_done_callback(lambda _: events.put(_DONE))
+                pending.append(future)
+
+            while pending and (pending[0] is None or pending[0].done()):
+                yield _result(pending.popleft())
+                slots.release()
+
+
+_END = object()
+"""Event marking the end of the stream"""
+
+_DONE = object()
+"""Event marking a finished solve"""
+
+
+def _read(puzzles: Iterable[SudokuGrid | None], events: SimpleQueue, slots: threading.Semaphore) -> None:
+    """
+    Moves the puzzles to the event queue, taking a slot before reading every puzzle,
+    so it runs at most the number of the slots ahead of the results.
+
+    Parameters:
+    -----------
+    puzzles: Iterable[SudokuGrid | None]
+        the stream of puzzles
+    events: SimpleQueue
+        queue receiving the puzzles, then `_END`, or the exception raised by the stream
+    slots: threading.Semaphore
+        slots released as the results are yielded
+    """
+
+    try:
+        iterator = iter(puzzles)
+        while True:
+            slots.acquire()
+            puzzle = next(iterator, _END)
+            events.put(puzzle)
+            if puzzle is _END:
+                return
+    except BaseException as error:
+        events.put(error)
+
+
+def _result(future: Future[SolveResult] | None) -> SolveResult:
+    return SolveResult(SolveStatus.INVALID) if future is None else future.result()
@@ -0,0 +1,295 @@
+from __future__ import annotations
+import atexit
+import math
+import os
+import threading
+from collections import deque
+from dataclasses import dataclass
+from multiprocessing import Pipe, Process
+from multiprocessing.connection import Connection, wait
+from timeit import default_timer as timer
+
+from src.model.grid import SudokuGrid
+from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
+from src.solvers.solve_result import SolveResult, SolveStatus
+
+
+def _serve(connection: Connection) -> None:
+    """
+    A worker's main loop: receives puzzles, solves them and sends back the results.
+    The solver library is loaded on the first puzzle and reused by the following ones.
+
+    Parameters:
+    -----------
+    connection: Connection
+        worker's end of the pipe, `None` received through it stops the worker
+    """
+
+    while True:
+        task = connection.recv()
+        if task is None:
+            return
+
+        task_id, puzzle = task
+        try:
+            solution = DancingLinksSudokuSolver(puzzle, math.inf)._run_algorithm()
+        except Exception:
+            result = SolveResult(SolveStatus.FAILURE)
+        else:
+            status = SolveStatus.UNSOLVABLE if solution is None else SolveStatus.SOLVED
+            result = SolveResult(status, solution)
+        connection.send((task_id, result))
+
+
+@dataclass(slots=True)
+class _Worker:
+    """
+    A single worker process together with the puzzle it is solving.
+
+    Attributes:
+    -----------
+    process: Process
+        the worker process
+    connection: Connection
+        parent's end of the pipe connected to the worker
+    task_id: int | None
+        index of the puzzle being solved, `None` if the worker is idle
+    deadline: float
+        when the current puzzle runs out of time
+    """
+
+    process: Process
+    connection: Connection
+    task_id: int | None = None
+    deadline: float = math.inf
+
+    @staticmethod
+    def start() -> _Worker:
+        connection, worker_connection = Pipe()
+        process = Process(target=_serve, args=(worker_connection,), daemon=True)
+        process.start()
+        worker_connection.close()
+        return _Worker(process, connection)
+
+    def stop(self) -> None:
+        try:
+            self.connection.send(None)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout=1)
+        self.kill()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+            self.process.join()
+        self.connection.close()
+
+
+class DancingLinksPool:
+    """
+    A long-lived pool of processes solving sudoku puzzles
+    with the external Dancing Links implementation.
+
+    Every worker loads the library only once and then solves puzzles
+    sent to it one by one. A worker exceeding the time limit is killed
+    and replaced by a fresh one; the other workers keep running.
+    The calls are serialized, so the pool may be shared by threads.
+
+    The pool can be used as a context manager, which closes it on exit.
+    See `shared_pool` for the pool used by `SudokuSolverType`.
+
+    Protected Attributes:
+    ---------------------
+    _workers: list[_Worker]
+        the worker processes
+    _lock: threading.Lock
+        lock held while the workers are busy
+
+    Methods:
+    --------
+    solve(puzzle: SudokuGrid, time_limit: float) -> SudokuGrid | None:
+        solves a single puzzle
+    solve_many(puzzles: list[SudokuGrid], time_limit: float) -> list[SolveResult]:
+        solves many puzzles, each one within the time limit
+    close() -> None:
+        stops all the workers
+    """
+
+    _workers: list[_Worker]
+    _lock: threading.Lock
+
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        Starts the worker processes.
+
+        Parameters:
+        -----------
+        workers: int | None
+            number of the worker processes, the number of CPUs by default
+        """
+        self._workers = [_Worker.start() for _ in range(workers or os.cpu_count() or 1)]
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> DancingLinksPool:
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """
+        Stops all the workers.
+        """
+        with self._lock:
+            for worker in self._workers:
+                worker.stop()
+            self._workers = []
+
+    def solve(self, puzzle: SudokuGrid, time_limit: float) -> SudokuGrid | None:
+        """
+        Solves a single puzzle.
+
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle to be solved
+        time_limit: float
+            amount of time (in seconds) available for the puzzle
+
+        Return:
+        --------
+        solution: SudokuGrid | None:
+            - a sudoku solution if it has been found
+            - `None` if the solution has not been found
+
+        Raises:
+        -------
+        timeout_error: TimeoutError
+            when the available time runs out
+        runtime_error: RuntimeError
+            when the solver has failed, e.g. the library is missing
+        """
+
+        [result] = self._run([puzzle], time_limit)
+        match result.status:
+            case SolveStatus.TIMEOUT:
+                raise TimeoutError()
+            case SolveStatus.FAILURE:
+                raise RuntimeError("the dancing links solver has failed")
+        return result.solution
+
+    def solve_many(self, puzzles: list[SudokuGrid], time_limit: float) -> list[SolveResult]:
+        """
+        Solves many puzzles using all the workers.
+
+        Parameters:
+        -----------
+        puzzles: list[SudokuGrid]
+            sudoku puzzles to be solved
+        time_limit: float
+            amount of time (in seconds) available for every single puzzle
+
+        Return:
+        --------
+        results: list[SolveResult]
+            outcomes in the order of the puzzles, like those of `solve_one`
+        """
+
+        return self._run(puzzles, time_limit)
+
+    def _run(self, puzzles: list[SudokuGrid], time_limit: float) -> list[SolveResult]:
+        """
+        Distributes the puzzles among the workers and collects the results.
+
+        Parameters:
+        -----------
+        puzzles: list[SudokuGrid]
+            sudoku puzzles to be solved
+        time_limit: float
+            amount of time (in seconds) available for every single puzzle
+
+        Return:
+        --------
+        results: list[SolveResult]
+            outcomes in the order of the puzzles
+        """
+
+        with self._lock:
+            if not self._workers:
+                raise ValueError("the pool has been closed")
+
+            results: list[SolveResult | None] = [None] * len(puzzles)
+            pending = deque(enumerate(puzzles))
+            busy: dict[Connection, _Worker] = {}
+
+            while pending or busy:
+                for worker in self._workers:
+                    if pending and worker.task_id is None:
+                        task_id, puzzle = pending.popleft()
+                        worker.task_id, worker.deadline = task_id, timer() + time_limit
+                        worker.connection.send((task_id, puzzle))
+                        busy[worker.connection] = worker
+
+                # with no finite deadline the workers are awaited without a timeout,
+                # `wait` cannot take an infinite one
+                remaining = min(worker.deadline for worker in busy.values()) - timer()
+                timeout = max(remaining, 0) if math.isfinite(remaining) else None
+                for connection in wait(list(busy), timeout=timeout):
+                    worker = busy.pop(connection)
+                    try:
+                        task_id, result = connection.recv()
+                    except EOFError:
+                        # the worker has crashed, e.g. the library has failed
+                        result = SolveResult(SolveStatus.FAILURE)
+                        self._replace(worker)
+                    results[worker.task_id] = result
+                    worker.task_id = None
+
+                now = timer()
+                for connection, worker in list(busy.items()):
+                    if worker.deadline <= now:
+                        del busy[connection]
+                        results[worker.task_id] = SolveResult(SolveStatus.TIMEOUT)
+                        self._replace(worker)
+
+            return results
+
+    def _replace(self, worker: _Worker) -> None:
+        """
+        Kills the worker and starts a fresh one in its place.
+
+        Parameters:
+        -----------
+        worker: _Worker
+            a worker to be replaced
+        """
+
+        worker.kill()
+        self._workers[self._workers.index(worker)] = _Worker.start()
+
+
+_shared: tuple[int, DancingLinksPool] | None = None
+"""The shared pool together with the process it belongs to"""
+
+
+def shared_pool() -> DancingLinksPool:
+    """
+    Returns the pool shared by the dancing links solves of the process,
+    starting it on the first call. It has a single worker, as the solves
+    going through it come one by one, and it is closed when the process exits.
+    A forked process starts a pool of its own instead of using
+    the workers of its parent.
+
+    Return:
+    --------
+    pool: DancingLinksPool
+        the shared pool
+    """
+
+    global _shared
+    if _shared is None or _shared[0] != os.getpid() or not _shared[1]._workers:
+        pool = DancingLinksPool(workers=1)
+        atexit.register(pool.close)
+        _shared = (os.getpid(), pool)
+    return _shared[1]
@@ -1,10 +1,35 @@
 from ctypes import CDLL, c_int, Array
+from functools import cache
 from multiprocessing import Queue, Process #noqa
 from pathlib import Path
 
 import numpy as np #noqa§
+import numpy.typing as npt
 from src.solvers.solver import SudokuSolver
 from src.model.grid import SudokuGrid
+from src.utils.deadline import DeadlineType
+
+
+IntArray = np.ctypeslib.ndpointer(dtype=np.intc, ndim=1, flags="C_CONTIGUOUS")
+"""ctypes type of a flat, contiguous numpy array of C ints, passed to C as `int *`"""
+
+
+@cache
+def _load_library(path: Path) -> CDLL:
+    """
+    Loads a shared library, at most once per process.
+
+    Parameters:
+    -----------
+    path: Path
+        path to the library
+
+    Return:
+    --------
+    library: CDLL
+        the loaded library
+    """
+    return CDLL(path)
 
 
 class DancingLinksSudokuSolver(SudokuSolver):
@@ -14,6 +39,9 @@ class DancingLinksSudokuSolver(SudokuSolver):
         https://github.com/nstagman/exact_cover_sudoku
     """
 
+    # the C solver is stopped by the time limit of its process, not by the checks
+    DEADLINE = DeadlineType.CLOCK
+
     def run_algorithm(self) -> SudokuGrid | None:
         q = Queue()
         p = Process(target=self._communicate_with_external_solver, args=(q,))
@@ -86,34 +114,38 @@ class DancingLinksSudokuSolver(SudokuSolver):
         #   6. run `make`
         #   It should create the `ss.so` file you can copy to `lib` directory.
         LIB_PATH = Path("lib").joinpath("ss.so")
-        return CDLL(LIB_PATH)
+        library = _load_library(LIB_PATH)
+        library.solve_puzzle.argtypes = [IntArray, c_int, IntArray]
+        return library
 
-    def _c_args(self) -> tuple[Array[c_int], c_int, Array[c_int]]:
+    def _c_args(self) -> tuple[npt.NDArray[np.intc], c_int, npt.NDArray[np.intc]]:
         """
         Translates sudoku puzzle to the arguments used by the solver.
+        The arrays are contiguous numpy arrays of C ints,
+        their buffers are handed to C directly without copying element by element.
 
         Return:
         --------
-        puzzle_array: Array[c_int]
+        puzzle_array: npt.NDArray[np.intc]
             a flat array containing the initial state of the puzzle
         size: c_int
             a c_int object with size of the puzzle, `9` for the classical one
-        solution_array: Array[c_int]
+        solution_array: npt.NDArray[np.intc]
             a flat array of the same same as puzzle_array, but containing only zeros
         """
         size = c_int(self._puzzle.size)
-        flat_puzzle = self._puzzle.flatten()
-        puzzle_array = (c_int * len(flat_puzzle))(*flat_puzzle)
-        solution_array = (c_int * len(flat_puzzle))(*[0] * len(flat_puzzle))
+        puzzle_array = self._puzzle.to_array(np.intc).reshape(-1)
+        solution_array = np.zeros_like(puzzle_array)
         return puzzle_array, size, solution_array
 
-    def _grid_from_array(self, solution: Array[c_int]) -> SudokuGrid:
+    def _grid_from_array(self, solution: npt.NDArray[np.intc] | Array[c_int]) -> SudokuGrid:
         """
         Translates the C array into a sudoku grid.
+        The values are narrowed from C `int` to the grid's compact dtype.
 
         Parameters:
         ----------
-        solution: Array[c_int]
+        solution: npt.NDArray[np.intc] | Array[c_int]
             an array containing the solution
 
         Return:
@@ -121,9 +153,10 @@ class DancingLinksSudokuSolver(SudokuSolver):
         grid: SudokuGrid
             a sudoku grid corresponding to the array
         """
-        array = np.array(solution)
+        if isinstance(solution, Array):
+            solution = np.ctypeslib.as_array(solution)
         size = self._puzzle.size
-        reshaped = array.reshape((size, size))
+        reshaped = solution.reshape((size, size))
         return SudokuGrid(reshaped)
 
     def _run_algorithm(self) -> SudokuGrid | None:
@@ -0,0 +1,284 @@
+from collections.abc import Iterator
+
+import numpy as np
+
+from src.model.candidates import CandidateTensor
+from src.model.grid import SudokuGrid
+from src.solvers.solver import SudokuSolver
+
+
+class ExactCoverSudokuSolver(SudokuSolver):
+    """
+    This solver uses the famous Knuth's Algorithm X with dancing links,
+    implemented in pure Python, so it needs no external library.
+    See: https://en.wikipedia.org/wiki/Dancing_Links
+
+    The sudoku is an exact cover problem with `4n^2` constraints (columns):
+    - every cell holds a value,
+    - every row, column and block contains every value.
+    Every candidate (row, col, value) is a row of the problem covering
+    exactly four columns.
+
+    The links are kept in flat integer lists indexed by the node number
+    instead of node objects:
+    - node `0` is the root,
+    - nodes `1..4n^2` are the column headers,
+    - the remaining nodes belong to the candidates, four nodes per candidate.
+    Only candidates consistent with the initial grid are added, and only
+    the constraints not satisfied by the initial grid are linked to the root.
+
+    Protected Attributes:
+    ---------------------
+    _left, _right, _up, _down: list[int]
+        neighbours of every node
+    _column: list[int]
+        column header of every node
+    _count: list[int]
+        number of nodes in every column (indexed by the header)
+    _candidates: list[tuple[int, int, int]]
+        (row, col, value) of every candidate, in the order of their nodes
+    """
+
+    _left: list[int]
+    _right: list[int]
+    _up: list[int]
+    _down: list[int]
+    _column: list[int]
+    _count: list[int]
+    _candidates: list[tuple[int, int, int]]
+
+    def __init__(self, puzzle: SudokuGrid, time_limit: float) -> None:
+        super().__init__(puzzle, time_limit)
+        self._build()
+
+    def run_algorithm(self) -> SudokuGrid | None:
+        rows = self._search()
+        if rows is None:
+            return None
+
+        headers = 4 * self._puzzle.size**2 + 1
+        for node in rows:
+            row, col, value = self._candidates[(node - headers) // 4]
+            self._puzzle[row, col] = value
+        return self._puzzle
+
+    def _build(self) -> None:
+        """
+        Builds the dancing links structure for the puzzle.
+        Column indices of all the candidates are computed at once with numpy.
+        """
+
+        n = self._puzzle.size
+        headers = 4 * n * n + 1
+        tensor = CandidateTensor(self._puzzle)
+
+        rows, cols, values = np.nonzero(tensor.candidates)
+        blocks = tensor.block_of[rows, cols]
+        node_column = (
+            np.stack(
+                [
+                    rows * n + cols,
+                    n * n + rows * n + values,
+                    2 * n * n + cols * n + values,
+                    3 * n * n + blocks * n + values,
+                ],
+                axis=1,
+            ).reshape(-1)
+            + 1
+        )
+        nodes = np.arange(headers, headers + node_column.size)
+        total = headers + node_column.size
+
+        # every candidate is a circular list of its four nodes
+        left = np.arange(total)
+        right = np.arange(total)
+        position = (nodes - headers) % 4
+        right[nodes] = np.where(position == 3, nodes - 3, nodes + 1)
+        left[nodes] = np.where(position == 0, nodes + 3, nodes - 1)
+
+        # every column is a circular list of its header and nodes
+        up = np.arange(total)
+        down = np.arange(total)
+        order = np.argsort(node_column, kind="stable")
+        sorted_nodes, sorted_columns = nodes[order], node_column[order]
+        if sorted_nodes.size:
+            first = np.r_[True, sorted_columns[1:] != sorted_columns[:-1]]
+            last = np.r_[first[1:], True]
+            up[sorted_nodes] = np.where(first, sorted_columns, np.roll(sorted_nodes, 1))
+            down[sorted_nodes] = np.where(last, sorted_columns, np.roll(sorted_nodes, -1))
+            down[sorted_columns[first]] = sorted_nodes[first]
+            up[sorted_columns[last]] = sorted_nodes[last]
+
+        # only the unsatisfied constraints are linked to the root
+        needed = np.concatenate(
+            [
+                [0],
+                np.flatnonzero(
+                    np.concatenate(
+                        [
+                            tensor.empty.reshape(-1),
+                            ~tensor.row_has.reshape(-1),
+                            ~tensor.col_has.reshape(-1),
+                            ~tensor.block_has.reshape(-1),
+                        ]
+                    )
+                )
+                + 1,
+            ]
+        )
+        right[needed] = np.roll(needed, -1)
+        left[needed] = np.roll(needed, 1)
+
+        column = np.arange(total)
+        column[nodes] = node_column
+
+        self._left = left.tolist()
+        self._right = right.tolist()
+        self._up = up.tolist()
+        self._down = down.tolist()
+        self._column = column.tolist()
+        self._count = np.bincount(node_column, minlength=headers).tolist()
+        self._candidates = list(zip(rows.tolist(), cols.tolist(), (values + 1).tolist()))
+
+    def _choose_column(self) -> int:
+        """
+        Finds a column with the smallest number of nodes.
+
+        Return:
+        --------
+        column: int
+            header of the chosen column
+        """
+
+        right, count = self._right, self._count
+        best = column = right[0]
+        while column != 0:
+            if count[column] < count[best]:
+                best = column
+                if count[best] <= 1:
+                    break
+            column = right[column]
+        return best
+
+    def _cover(self, column: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        node_column, count = self._column, self._count
+
+        right[left[column]] = right[column]
+        left[right[column]] = left[column]
+        row = down[column]
+        while row != column:
+            node = right[row]
+            while node != row:
+                down[up[node]] = down[node]
+                up[down[node]] = up[node]
+                count[node_column[node]] -= 1
+                node = right[node]
+            row = down[row]
+
+    def _uncover(self, column: int) -> None:
+        left, right, up, down = self._left, self._right, self._up, self._down
+        node_column, count = self._column, self._count
+
+        row = up[column]
+        while row != column:
+            node = left[row]
+            while node != row:
+                count[node_column[node]] += 1
+                down[up[node]] = node
+                up[down[node]] = node
+                node = left[node]
+            row = up[row]
+        right[left[column]] = column
+        left[right[column]] = column
+
+    def _select(self, row: int) -> None:
+        """
+        Puts the candidate in the solution, i.e. covers its other columns
+        (its own column is covered when it is chosen).
+
+        Parameters:
+        -----------
+        row: int
+            a node of the candidate
+        """
+
+        right, node_column = self._right, self._column
+        node = right[row]
+        while node != row:
+            self._cover(node_column[node])
+            node = right[node]
+
+    def _deselect(self, row: int) -> None:
+        """
+        Takes the candidate out of the solution, reverting `_select`.
+
+        Parameters:
+        -----------
+        row: int
+            a node of the candidate
+        """
+
+        left, node_column = self._left, self._column
+        node = left[row]
+        while node != row:
+            self._uncover(node_column[node])
+            node = left[node]
+
+    def _search(self) -> list[int] | None:
+        """
+        Performs the Algorithm X search, stopping at the first solution.
+
+        Return:
+        --------
+        rows: list[int] | None
+            `None` if there is no solution,
+            otherwise a node of every chosen candidate
+        """
+        return next(self._solutions(), None)
+
+    def _solutions(self) -> Iterator[list[int]]:
+        """
+        Performs the Algorithm X search iteratively with an explicit stack,
+        yielding whenever all the columns are covered. Resuming the iterator
+        backtracks from the solution, so the whole search space is enumerated.
+
+        Return:
+        --------
+        solutions: Iterator[list[int]]
+            a node of every chosen candidate, for every solution;
+            the list is reused by the search, so it is valid until resumed
+        """
+
+        right, down, node_column = self._right, self._down, self._column
+        stack: list[int] = []
+
+        while True:
+            if right[0] == 0:
+                yield stack
+                if not stack:
+                    return
+                # backtrack from the solution
+                row = stack.pop()
+                self._deselect(row)
+                column = node_column[row]
+                row = down[row]
+            else:
+                if self._timeout():
+                    raise TimeoutError()
+                column = self._choose_column()
+                self._cover(column)
+                row = down[column]
+
+            while row == column:
+                # the column cannot be covered, backtrack
+                self._uncover(column)
+                if not stack:
+                    return
+                row = stack.pop()
+                self._deselect(row)
+                column = node_column[row]
+                row = down[row]
+
+            stack.append(row)
+            self._select(row)
@@ -1,9 +1,13 @@
 from __future__ import annotations
+import random
 from dataclasses import dataclass
+from enum import StrEnum, auto
+from collections.abc import Iterator
 from typing import NewType
-from src.solvers.solver import SudokuSolver
+from src.solvers.backtracking_solver import BacktrackingSudokuSolver
+from src.model.candidates import CandidateTensor
 from src.model.grid import SudokuGrid
-from src.utils.recursion_limit import recursion_limit_set_to  # noqa
+from src.solvers.restarts import RestartSchedule
 
 
 Variable = NewType("Variable", tuple[int, int, int])
@@ -13,6 +17,10 @@ Variable = NewType("Variable", tuple[int, int, int])
 Domain = NewType("Domain", set[int])
 """Type representing set of of available values"""
 
+Mask = NewType("Mask", int)
+"""Type representing set of available values encoded as bits,
+   i.e. value `v` is available iff the `v`-th bit of the mask is set"""
+
 
 @dataclass(frozen=True, slots=True)
 class State:
@@ -60,6 +68,43 @@ class State:
         row, col, block = variable
         return Domain(set.intersection(self.row_domains[row], self.col_domains[col], self.block_domains[block]))
 
+    def domain_size(self, variable: Variable) -> int:
+        """
+        Return number of values available for the given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain size we want to get
+
+        Return:
+        --------
+        size: int
+            number of values in the variable's domain
+        """
+
+        return len(self.domain(variable))
+
+    def domain_mask(self, variable: Variable) -> Mask:
+        """
+        Return domain of the given variable encoded as a bitmask.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain we want to get
+
+        Return:
+        --------
+        mask: Mask
+            values available for the given variable
+        """
+
+        mask = 0
+        for value in self.domain(variable):
+            mask |= 1 << value
+        return Mask(mask)
+
     def assign(self, variable: Variable, value: int) -> None:
         """
         Assigns a given value to a given variable.
@@ -91,7 +136,7 @@ class State:
         """
 
         row, col, block = variable
-        value = self.grid._array[row][col]
+        value = int(self.grid._array[row][col])
 
         self.grid._array[row][col] = 0
         self.free_variables.add(variable)
@@ -127,60 +172,941 @@ class State:
         col_domains = [Domain(default_domain.copy()) for _ in range(grid.size)]
         block_domains = [Domain(default_domain.copy()) for _ in range(grid.size)]
 
+        # the variables are the shared cell triples of the topology
+        block_index, cells = grid.topology.block_index, grid.topology.cells
         for (row, col), val in grid.enumerate():
-            block = grid.block_index(row, col)
+            block = block_index[row][col]
             if val != 0:
                 row_domains[row].remove(val)
                 col_domains[col].remove(val)
                 block_domains[block].remove(val)
             else:
-                free_variables.add(Variable((row, col, block)))
+                free_variables.add(Variable(cells[row * grid.size + col]))
 
         return State(grid, free_variables, row_domains, col_domains, block_domains)
 
-class FirstFailSudokuSolver(SudokuSolver):
+
+@dataclass(frozen=True, slots=True)
+class BitmaskState:
+    """
+    Represent the current state of the backtracking solver.
+    Works exactly like `State`, but keeps the domains as integer bitmasks,
+    so computing a domain does not allocate any sets.
+
+    Attributes:
+    -----------
+    grid: SudokuGrid
+        a current state of the grid
+    free_variables: set[Variable]
+        set of the variables without assigned values
+    row_masks: list[Mask]
+        values available in the given row, e.g.
+            row_masks[5] = 0b11110
+        means the {1,2,3,4} can be assigned in row 5
+    col_masks: list[Mask]
+        values available in the given column
+    block_masks: list[Mask]
+        values available in the given block
+    """
+
+    grid: SudokuGrid
+    free_variables: set[Variable]
+    row_masks: list[Mask]
+    col_masks: list[Mask]
+    block_masks: list[Mask]
+
+    def domain_mask(self, variable: Variable) -> Mask:
+        """
+        Return domain of the given variable encoded as a bitmask.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain we want to get
+
+        Return:
+        --------
+        mask: Mask
+            values available for the given variable
+        """
+
+        row, col, block = variable
+        return Mask(self.row_masks[row] & self.col_masks[col] & self.block_masks[block])
+
+    def domain(self, variable: Variable) -> Domain:
+        """
+        Return domain (available values) for the given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain we want to get
+
+        Return:
+        --------
+        domain: Domain
+            values available for the given domain
+        """
+
+        mask = self.domain_mask(variable)
+        domain = set()
+        while mask:
+            lowest = mask & -mask
+            domain.add(lowest.bit_length() - 1)
+            mask ^= lowest
+        return Domain(domain)
+
+    def domain_size(self, variable: Variable) -> int:
+        """
+        Return number of values available for the given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain size we want to get
+
+        Return:
+        --------
+        size: int
+            number of values in the variable's domain
+        """
+
+        return self.domain_mask(variable).bit_count()
+
+    def assign(self, variable: Variable, value: int) -> None:
+        """
+        Assigns a given value to a given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            variable to be assigned to
+        value: int
+            what value should we assign
+        """
+
+        row, col, block = variable
+        bit = 1 << value
+        self.row_masks[row] &= ~bit
+        self.col_masks[col] &= ~bit
+        self.block_masks[block] &= ~bit
+        self.free_variables.remove(variable)
+
+        self.grid._array[row][col] = value
+
+    def remove_assignment(self, variable: Variable) -> None:
+        """
+        Removes a value assignment.
+
+        Parameters:
+        -----------
+        variable: Variable
+            an already assigned variable
+        """
+
+        row, col, block = variable
+        bit = 1 << int(self.grid._array[row][col])
+
+        self.grid._array[row][col] = 0
+        self.free_variables.add(variable)
+        self.row_masks[row] |= bit
+        self.col_masks[col] |= bit
+        self.block_masks[block] |= bit
+
+    @staticmethod
+    def from_grid(grid: SudokuGrid) -> BitmaskState:
+        """
+        Creates an initial state for a given grid.
+
+        Parameters:
+        -----------
+        grid: SudokuGrid
+            an initial state of the sudoku grid
+
+        Return:
+        --------
+        state: BitmaskState
+            a state matching the grid
+        """
+
+        default_mask = ((1 << grid.size) - 1) << 1
+        free_variables = set()
+        row_masks = [Mask(default_mask) for _ in range(grid.size)]
+        col_masks = [Mask(default_mask) for _ in range(grid.size)]
+        block_masks = [Mask(default_mask) for _ in range(grid.size)]
+
+        # the variables are the shared cell triples of the topology
+        block_index, cells = grid.topology.block_index, grid.topology.cells
+        for (row, col), val in grid.enumerate():
+            block = block_index[row][col]
+            if val != 0:
+                bit = 1 << int(val)
+                row_masks[row] &= ~bit
+                col_masks[col] &= ~bit
+                block_masks[block] &= ~bit
+            else:
+                free_variables.add(Variable(cells[row * grid.size + col]))
+
+        return BitmaskState(grid, free_variables, row_masks, col_masks, block_masks)
+
+
+@dataclass(frozen=True, slots=True)
+class TensorState:
+    """
+    Represent the current state of the backtracking solver.
+    Works exactly like `State`, but keeps candidates of all the cells
+    in a numpy `CandidateTensor`, so domains are queried with array operations.
+
+    Attributes:
+    -----------
+    grid: SudokuGrid
+        a current state of the grid
+    free_variables: set[Variable]
+        set of the variables without assigned values
+    candidates: CandidateTensor
+        candidates of every cell of the grid
+    """
+
+    grid: SudokuGrid
+    free_variables: set[Variable]
+    candidates: CandidateTensor
+
+    def domain(self, variable: Variable) -> Domain:
+        """
+        Return domain (available values) for the given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain we want to get
+
+        Return:
+        --------
+        domain: Domain
+            values available for the given domain
+        """
+
+        row, col, _ = variable
+        return Domain(set(self.candidates.values(row, col)))
+
+    def domain_size(self, variable: Variable) -> int:
+        """
+        Return number of values available for the given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain size we want to get
+
+        Return:
+        --------
+        size: int
+            number of values in the variable's domain
+        """
+
+        row, col, _ = variable
+        return self.candidates.count(row, col)
+
+    def domain_mask(self, variable: Variable) -> Mask:
+        """
+        Return domain of the given variable encoded as a bitmask.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable whose domain we want to get
+
+        Return:
+        --------
+        mask: Mask
+            values available for the given variable
+        """
+
+        mask = 0
+        for value in self.candidates.values(variable[0], variable[1]):
+            mask |= 1 << value
+        return Mask(mask)
+
+    def assign(self, variable: Variable, value: int) -> None:
+        """
+        Assigns a given value to a given variable.
+
+        Parameters:
+        -----------
+        variable: Variable
+            variable to be assigned to
+        value: int
+            what value should we assign
+        """
+
+        row, col, _ = variable
+        self.candidates.assign(row, col, value)
+        self.free_variables.remove(variable)
+
+        self.grid._array[row][col] = value
+
+    def remove_assignment(self, variable: Variable) -> None:
+        """
+        Removes a value assignment.
+
+        Parameters:
+        -----------
+        variable: Variable
+            an already assigned variable
+        """
+
+        row, col, _ = variable
+        value = int(self.grid._array[row][col])
+
+        self.grid._array[row][col] = 0
+        self.free_variables.add(variable)
+        self.candidates.remove_assignment(row, col, value)
+
+    @staticmethod
+    def from_grid(grid: SudokuGrid) -> TensorState:
+        """
+        Creates an initial state for a given grid.
+
+        Parameters:
+        -----------
+        grid: SudokuGrid
+            an initial state of the sudoku grid
+
+        Return:
+        --------
+        state: TensorState
+            a state matching the grid
+        """
+
+        candidates = CandidateTensor(grid)
+        cells = grid.topology.cells
+        free_variables = set()
+        for (row, col), val in grid.enumerate():
+            if val == 0:
+                free_variables.add(Variable(cells[row * grid.size + col]))
+
+        return TensorState(grid, free_variables, candidates)
+
+
+AnyState = State | BitmaskState | TensorState
+"""Type representing a state stored with any of the backends"""
+
+
+class StateBackend(StrEnum):
+    """
+    Type representing the ways the solver can store its domains.
+
+    Methods:
+    --------
+    state_from_grid(self, grid: SudokuGrid) -> AnyState:
+        creates an initial state of the matching type for a given grid
+    """
+
+    SET = auto()
+    BITMASK = auto()
+    TENSOR = auto()
+
+    def state_from_grid(self, grid: SudokuGrid) -> AnyState:
+        match self:
+            case StateBackend.SET:
+                return State.from_grid(grid)
+            case StateBackend.BITMASK:
+                return BitmaskState.from_grid(grid)
+            case StateBackend.TENSOR:
+                return TensorState.from_grid(grid)
+            case _:
+                raise NotImplementedError()
+
+
+class DomainIndex:
+    """
+    A bucket queue of the free variables keyed by their domain size.
+    It is updated incrementally: assigning (or unassigning) a variable
+    recomputes domains of its peers only, instead of all the free variables.
+    The peers are read from the units of the grid's shared `Topology`.
+    A peer's domain can only lose or regain the value being (un)assigned,
+    so the change of its size updates the per-unit value counts as well.
+    The assignments are removed in the reverse order, so a freed variable
+    gets back the domain it had just before its assignment.
+
+    Attributes:
+    -----------
+    state: AnyState
+        a state whose free variables are indexed
+    buckets: list[set[Variable]]
+        buckets[k] contains the free variables with exactly `k` available values
+    sizes: dict[Variable, int]
+        current domain size of every free variable
+    units: list[list[Variable]]
+        initially free variables of every row, column and block,
+        in the order of `Topology.units`
+    counts: list[list[int]]
+        counts[unit][value] is the number of the free variables of the unit
+        with the value in their domain
+    assignments: dict[Variable, tuple[int, Mask]]
+        the value of every assigned variable together with its domain
+        just before the assignment
+    recomputations: int
+        how many times a domain size has been computed
+    scanned: int
+        how many domain sizes a full scan of the free variables would have computed
+
+    Properties:
+    -----------
+    recomputations_avoided: int
+        how many domain computations have been saved compared to the full scan
+    """
+
+    state: AnyState
+    buckets: list[set[Variable]]
+    sizes: dict[Variable, int]
+    units: list[list[Variable]]
+    counts: list[list[int]]
+    assignments: dict[Variable, tuple[int, Mask]]
+    recomputations: int
+    scanned: int
+
+    def __init__(self, state: AnyState) -> None:
+        size = state.grid.size
+        self.state = state
+        self.buckets = [set() for _ in range(size + 1)]
+        self.sizes = {}
+        self.assignments = {}
+        self.recomputations = len(state.free_variables)
+        self.scanned = 0
+
+        for variable in state.free_variables:
+            self._insert(variable, state.domain_size(variable))
+        # the givens never change, so they are left out of the shared units once
+        self.units = [[var for var in unit if var in self.sizes] for unit in state.grid.topology.units]
+        # counted at once on the candidate tensor, the value 0 is never available
+        tensor = state.candidates if isinstance(state, TensorState) else CandidateTensor(state.grid)
+        self.counts = [[0] + unit for unit in tensor.unit_counts().tolist()]
+
+    @property
+    def recomputations_avoided(self) -> int:
+        return self.scanned - self.recomputations
+
+    def minimum(self, rng: random.Random | None = None) -> Variable | None:
+        """
+        Finds a free variable with the smallest domain.
+
+        Parameters:
+        -----------
+        rng: random.Random | None
+            if given, the variable is chosen at random among
+            the variables with the smallest domain
+
+        Return:
+        --------
+        variable: Variable | None
+            `None` if there are no free variables left,
+            otherwise a variable with the smallest domain
+        """
+
+        self.scanned += len(self.sizes)
+        for bucket in self.buckets:
+            if bucket:
+                if rng is not None:
+                    return rng.choice(tuple(bucket))
+                return next(iter(bucket))
+        return None
+
+    def assigned(self, variable: Variable, value: int, domain: Mask) -> None:
+        """
+        Updates the index after the variable has been assigned.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a freshly assigned variable
+        value: int
+            the assigned value
+        domain: Mask
+            domain of the variable just before the assignment
+        """
+
+        self.buckets[self.sizes.pop(variable)].remove(variable)
+        self.assignments[variable] = value, domain
+        self._count(variable, domain, -1)
+        self._update_peers(variable, value)
+
+    def unassigned(self, variable: Variable) -> None:
+        """
+        Updates the index after the variable assignment has been removed.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a freshly freed variable, the latest one assigned
+        """
+
+        value, domain = self.assignments.pop(variable)
+        self._insert(variable, domain.bit_count())
+        self._count(variable, domain, 1)
+        self._update_peers(variable, value)
+
+    def _insert(self, variable: Variable, size: int) -> None:
+        self.sizes[variable] = size
+        self.buckets[size].add(variable)
+
+    def _count(self, variable: Variable, domain: Mask, delta: int) -> None:
+        row, col, block = variable
+        size = len(self.buckets) - 1
+        row_counts, col_counts, block_counts = self.counts[row], self.counts[size + col], self.counts[2 * size + block]
+        while domain:
+            bit = domain & -domain
+            value = bit.bit_length() - 1
+            row_counts[value] += delta
+            col_counts[value] += delta
+            block_counts[value] += delta
+            domain ^= bit
+
+    def _update_peers(self, variable: Variable, value: int) -> None:
+        row, col, block = variable
+        size = len(self.buckets) - 1
+        for peer in self.units[row]:
+            self._update(peer, value)
+        for peer in self.units[size + col]:
+            self._update(peer, value)
+        for peer in self.units[2 * size + block]:
+            # the block peers sharing a row or a column are already updated
+            if peer[0] != row and peer[1] != col:
+                self._update(peer, value)
+
+    def _update(self, variable: Variable, value: int) -> None:
+        old_size = self.sizes.get(variable)
+        if old_size is None:
+            return
+
+        size = self.state.domain_size(variable)
+        self.recomputations += 1
+        if size != old_size:
+            self.buckets[old_size].remove(variable)
+            self.buckets[size].add(variable)
+            self.sizes[variable] = size
+
+            # the domain has lost or regained the value
+            row, col, block = variable
+            n, delta = len(self.buckets) - 1, size - old_size
+            self.counts[row][value] += delta
+            self.counts[n + col][value] += delta
+            self.counts[2 * n + block][value] += delta
+
+
+class _Restart(Exception):
+    """Raised when a run of the search has spent its backtrack budget"""
+
+
+class FirstFailSudokuSolver(BacktrackingSudokuSolver):
     """
     A first-fail backtracking sudoku solver.
     It first tries to fill cells with smallest number of available values.
+
+    The domains can be stored as sets, bitmasks or a numpy tensor,
+    see `StateBackend`; all the backends find identical solutions.
+    Free variables are kept in a `DomainIndex`, so the most constrained
+    one is found without rescanning the whole grid.
+
+    After every assignment the forced cells are filled as well:
+    - naked singles: cells with a single available value,
+    - hidden singles: values with a single possible cell in a row,
+      column or block containing a freshly filled cell.
+    All cells filled because of a single assignment form a batch on the trail,
+    so removing the assignment undoes the whole batch.
+
+    The search can be randomized with a seed: ties among the variables
+    with the smallest domain and among equally constraining values are
+    broken at random. Given a `RestartSchedule`, the randomized search
+    starts over whenever it exceeds its backtrack budget, which cuts off
+    the heavy tail of unlucky runs; the budgets keep growing, so the search
+    stays complete. A run is reproducible from its seed.
+
+    Attributes:
+    -----------
+    state: AnyState
+        a current state of the search
+    index: DomainIndex
+        free variables ordered by their domain size
+    trail: list[list[Variable]]
+        batches of the assigned variables, each batch starts with
+        the variable chosen by the search followed by the forced ones
+    nodes: int
+        how many values have been tried by the search
+    propagations: int
+        how many cells have been filled by the propagation
+    backtracks: int
+        how many assignments have been removed
+    restarts: int
+        how many times the search has started over
+
+    Protected Attributes:
+    ---------------------
+    _random: random.Random | None
+        source of the random tie-breaking, `None` for the deterministic search
+    _schedule: RestartSchedule | None
+        the restart schedule, `None` for the search without restarts
+    _restart_base: int
+        backtrack budget of the first run
+    _budget: int | None
+        the number of backtracks ending the current run
     """
 
-    state: State
+    RESTART_BASE: int = 100
+
+    state: AnyState
+    index: DomainIndex
+    trail: list[list[Variable]]
+    nodes: int
+    propagations: int
+    backtracks: int
+    restarts: int
+    _units: list[tuple[list[Variable], Mask]]
+    _random: random.Random | None
+    _schedule: RestartSchedule | None
+    _restart_base: int
+    _budget: int | None
+
+    def __init__(
+        self,
+        puzzle,
+        time_limit,
+        backend: StateBackend = StateBackend.SET,
+        seed: int | None = None,
+        restarts: RestartSchedule | None = None,
+        restart_base: int = RESTART_BASE,
+    ):
+        """
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle to be solved
+        time_limit: float
+            amount of time (in seconds) available to the solver
+        backend: StateBackend
+            how the domains are stored
+        seed: int | None
+            seed of the random tie-breaking, the search is deterministic by default
+        restarts: RestartSchedule | None
+            the restart schedule, implies random tie-breaking
+            (seeded from the system if no seed is given), no restarts by default
+        restart_base: int
+            backtrack budget of the first run
+        """
 
-    def __init__(self, puzzle, time_limit):
         super().__init__(puzzle, time_limit)
-        self.state = State.from_grid(puzzle)
+        self.state = backend.state_from_grid(self._puzzle)
+        self.index = DomainIndex(self.state)
+        self.trail = []
+        self.nodes = 0
+        self.propagations = 0
+        self.backtracks = 0
+        self.restarts = 0
+        self._random = random.Random(seed) if seed is not None or restarts is not None else None
+        self._schedule = restarts
+        self._restart_base = restart_base
+        self._budget = None
+
+        # rows, then columns, then blocks:
+        # initially free variables of the unit together with the given values
+        size, block_index = self._puzzle.size, self._puzzle.topology.block_index
+        given = [0] * (3 * size)
+        for (row, col), val in self._puzzle.enumerate():
+            if val != 0:
+                bit = 1 << int(val)
+                given[row] |= bit
+                given[size + col] |= bit
+                given[2 * size + block_index[row][col]] |= bit
+        self._units = [(unit, Mask(mask)) for unit, mask in zip(self.index.units, given)]
+
+    @property
+    def recomputations_avoided(self) -> int:
+        """
+        Returns how many domain computations the index has saved
+        compared to scanning all the free variables at every step.
+
+        Return:
+        --------
+        avoided: int
+            number of avoided domain computations
+        """
+        return self.index.recomputations_avoided
+
+    @property
+    def propagations_per_node(self) -> float:
+        """
+        Returns how many cells have been filled by the propagation
+        per a single value tried by the search.
+
+        Return:
+        --------
+        ratio: float
+            average number of forced cells per node
+        """
+        return self.propagations / self.nodes if self.nodes else 0.0
 
     def run_algorithm(self) -> SudokuGrid | None:
-        with recursion_limit_set_to(self._puzzle.size**3):
-            if self._dfs():
-                return self.state.grid
-            return None
+        if self._schedule is None:
+            return self.state.grid if self._dfs() else None
+
+        for budget in self._schedule.budgets(self._restart_base):
+            solved = self.run_with_budget(budget)
+            if solved is not None:
+                return self.state.grid if solved else None
+            self.restarts += 1
 
-    def _dfs(self) -> bool:
+    def run_with_budget(self, backtracks: int) -> bool | None:
         """
-        Performs a first-fail depth-first-search to solve the sudoku puzzle.
-        It always chooses a variable with the smallest domain and tries it first.
+        Searches until it finds a solution, proves there is none,
+        or spends the backtrack budget. In the last case the search is undone,
+        i.e. the solver is back at the puzzle, so it can be restarted or split.
+
+        Parameters:
+        -----------
+        backtracks: int
+            how many backtracks the search may spend
 
         Return:
         --------
-        solved: bool
-            `True` - if method found the solution
-            `False` - otherwise
+        solved: bool | None
+            `True` if the solution has been found, it is left in `state.grid`,
+            `False` if there is no solution,
+            `None` if the budget has been spent
         """
 
-        variable_and_domain = self._choose_variable()
-        if variable_and_domain is None:
-            return True
+        self._budget = self.backtracks + backtracks
+        try:
+            return self._dfs()
+        except _Restart:
+            self._budget = None
+            while self.trail:
+                self._remove_assignment(self.trail[-1][0])
+            return None
+        finally:
+            self._budget = None
+
+    def subproblems(self, depth: int) -> Iterator[SudokuGrid]:
+        """
+        Expands the top `depth` levels of the search tree and yields
+        the partial assignments at its frontier: every value of the chosen
+        variable is assigned and propagated, the inconsistent ones are pruned.
+        Together the subproblems cover all the solutions of the puzzle.
+        A branch ending above the frontier yields its complete assignment,
+        which is a solution. The solver is back at the puzzle afterwards.
+
+        Parameters:
+        -----------
+        depth: int
+            how many levels should be expanded
+
+        Return:
+        --------
+        subproblems: Iterator[SudokuGrid]
+            copies of the partially filled grids
+        """
 
         if self._timeout():
             raise TimeoutError()
 
-        var, domain = variable_and_domain
-        self.state.assign(var, domain.pop())
+        choice = self._choose_variable()
+        if choice is None or depth == 0:
+            yield self.state.grid.copy()
+            return
+
+        variable, domain = choice
+        for value in self._candidates(variable, domain):
+            self._assign(variable, value)
+            if self._propagate():
+                yield from self.subproblems(depth - 1)
+            self._remove_assignment(variable)
+
+    def _candidates(self, variable: Variable, domain: Domain) -> list[int]:
+        """
+        Orders the values by the least-constraining-value heuristic:
+        values ruling out the fewest options of the free peers
+        (cells sharing a row, column or block) are tried first,
+        ties are broken by the value itself, or at random if the search is randomized.
+        The options are looked up in the per-unit value counts of the index;
+        only the peers counted in both the row (or column) and the block
+        are scanned, so that every peer is counted once.
+
+        Parameters:
+        -----------
+        variable: Variable
+            a variable chosen by `_choose_variable`
+        domain: Domain
+            its available values
+
+        Return:
+        --------
+        candidates: list[int]
+            values to be tried
+        """
+        values = sorted(domain)
+        if len(values) < 2:
+            return values
+
+        row, col, block = variable
+        size, sizes = self.state.grid.size, self.index.sizes
+        row_counts = self.index.counts[row]
+        col_counts = self.index.counts[size + col]
+        block_counts = self.index.counts[2 * size + block]
+        # the variable itself adds the same to every value of its domain,
+        # the block peers sharing its row or its column are counted twice
+        twice = [
+            self.state.domain_mask(peer)
+            for peer in self.index.units[2 * size + block]
+            if peer in sizes and (peer[0] == row) != (peer[1] == col)
+        ]
+        if self._random is not None:
+            self._random.shuffle(values)
+        return sorted(
+            values,
+            key=lambda value: row_counts[value] + col_counts[value] + block_counts[value]
+            - sum(mask >> value & 1 for mask in twice),
+        )
 
-        if not self._dfs():
+    def _assign(self, variable: Variable, value: int) -> None:
+        """
+        Assigns a value to the variable, starting a new batch on the trail.
+
+        Parameters:
+        -----------
+        variable: Variable
+            variable to be assigned to
+        value: int
+            what value should we assign
+        """
+
+        self.nodes += 1
+        self.trail.append([variable])
+        self._fill(variable, value, self.state.domain_mask(variable))
+
+    def _remove_assignment(self, variable: Variable) -> None:
+        """
+        Removes a value assignment together with all the cells it forced.
+
+        Parameters:
+        -----------
+        variable: Variable
+            an already assigned variable
+
+        Raises:
+        -------
+        restart: _Restart
+            when the current run has spent its backtrack budget
+        """
+
+        batch = self.trail.pop()
+        for var in reversed(batch):
             self.state.remove_assignment(var)
+            self.index.unassigned(var)
+
+        self.backtracks += 1
+        if self._budget is not None and self.backtracks >= self._budget:
+            raise _Restart()
+
+    def _fill(self, variable: Variable, value: int, domain: Mask) -> None:
+        self.state.assign(variable, value)
+        self.index.assigned(variable, value, domain)
+
+    def _propagate(self) -> bool:
+        """
+        Fills the forced cells until there are none left.
+        Newly filled cells are appended to the latest batch.
+        A single assignment may force thousands of cells on a large grid,
+        so the deadline is checked for every forced cell and every unit pass too.
+
+        Return:
+        --------
+        consistent: bool
+            `False` if some cell or some value has no options left
+            `True` otherwise
+
+        Raises:
+        -------
+        timeout: TimeoutError
+            when the deadline passes during the propagation
+        """
+
+        batch = self.trail[-1]
+        size = self.state.grid.size
+        empty, singles = self.index.buckets[0], self.index.buckets[1]
+        checked = 0
+        while True:
+            if self._timeout():
+                raise TimeoutError()
+
+            if empty:
+                return False
+
+            if singles:
+                var = next(iter(singles))
+                value = min(self.state.domain(var))
+                self._fill(var, value, Mask(1 << value))
+                batch.append(var)
+                self.propagations += 1
+                continue
+
+            if checked == len(batch):
+                return True
+
+            row, col, block = batch[checked]
+            checked += 1
+            for unit in (row, size + col, 2 * size + block):
+                if not self._hidden_singles(batch, *self._units[unit]):
+                    return False
+
+    def _hidden_singles(self, batch: list[Variable], unit: list[Variable], given: Mask) -> bool:
+        """
+        Fills values which have a single possible cell within the unit.
+
+        Parameters:
+        -----------
+        batch: list[Variable]
+            variables assigned so far in the current batch
+        unit: list[Variable]
+            initially free variables of a row, column or block
+        given: Mask
+            values given in the unit by the puzzle
+
+        Return:
+        --------
+        consistent: bool
+            `False` if some value cannot be placed anywhere in the unit
+            `True` otherwise
+        """
+
+        placed, once, twice = given, 0, 0
+        sizes = self.index.sizes
+        for var in unit:
+            if var in sizes:
+                mask = self.state.domain_mask(var)
+                twice |= once & mask
+                once |= mask
+            else:
+                placed |= 1 << int(self.state.grid[var[0], var[1]])
+
+        full = ((1 << self.state.grid.size) - 1) << 1
+        if (placed | once) != full:
             return False
+
+        hidden = once & ~twice
+        if not hidden:
+            return True
+
+        for var in unit:
+            if var not in sizes:
+                continue
+            domain = self.state.domain_mask(var)
+            mask = domain & hidden
+            if not mask:
+                continue
+            if mask & (mask - 1):
+                return False
+            self._fill(var, mask.bit_length() - 1, domain)
+            batch.append(var)
+            self.propagations += 1
         return True
 
     def _choose_variable(self) -> tuple[Variable, Domain] | None:
@@ -194,14 +1120,8 @@ class FirstFailSudokuSolver(SudokuSolver):
             otherwise returns a variable with the smallest domain (together with its domain)
         """
 
-        free_variables = self.state.free_variables
-        if not free_variables:
+        var = self.index.minimum(self._random)
+        if var is None:
             return None
 
-        lowest_domain = float('inf'), None, None
-        for var in free_variables:
-            domain = self.state.domain(var)
-            if len(domain) < lowest_domain[0]:
-                lowest_domain = len(domain), var, domain
-
-        return lowest_domain[1], lowest_domain[2]
\ No newline at end of file
+        return var, self.state.domain(var)
\ No newline at end of file
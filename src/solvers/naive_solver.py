@@ -1,18 +1,43 @@
-from src.solvers.solver import SudokuSolver
+from src.solvers.backtracking_solver import BacktrackingSudokuSolver
+from src.model.candidates import CandidateTensor
 from src.model.grid import SudokuGrid
-from src.utils.recursion_limit import recursion_limit_set_to  # noqa
 
 
-class NaiveSudokuSolver(SudokuSolver):
+class NaiveSudokuSolver(BacktrackingSudokuSolver):
     """
     A naive sudoku solver inspired by https://www.geeksforgeeks.org/sudoku-backtracking-7/.
+    It fills the empty cells one by one, left to right, top to bottom.
+
+    Protected Attributes:
+    ---------------------
+    _free_cells: list[tuple[int, int]]
+        coordinates of the initially empty cells, in the filling order
+    _depth: int
+        how many of the free cells are currently filled
+    _tensor: CandidateTensor
+        candidates of all the cells, kept in sync with the puzzle
     """
 
+    _free_cells: list[tuple[int, int]]
+    _depth: int
+    _tensor: CandidateTensor
+
+    def __init__(self, puzzle: SudokuGrid, time_limit: float) -> None:
+        super().__init__(puzzle, time_limit)
+        self._free_cells = []
+        self._depth = 0
+        self._tensor = CandidateTensor(self._puzzle)
+
+        row, col = 0, 0
+        while row < self._puzzle.size:
+            if self._puzzle[row, col] == 0:
+                self._free_cells.append((row, col))
+            row, col = self._increment_coordinates(row, col)
+
     def run_algorithm(self) -> SudokuGrid | None:
-        with recursion_limit_set_to(self._puzzle.size**3):
-            if self._dfs(0, 0):
-                return self._puzzle
-            return None
+        if self._dfs():
+            return self._puzzle
+        return None
 
     def _increment_coordinates(self, row: int, col: int) -> tuple[int, int]:
         """
@@ -39,79 +64,30 @@ class NaiveSudokuSolver(SudokuSolver):
 
         return row, col
 
-    def _is_excluded(self, row: int, col: int, val: int) -> bool:
-        """
-        Checks whether a given value can be put in the specified cell.
-
-        Parameters:
-        -----------
-        row: int
-            a row coordinate
-        col: int
-            a column coordinate
-        val: int
-            a value to be stored in the cell
-
-        Return:
-        --------
-        excluded: bool
-            - `True` if the value can**not** be put in the cell
-            - `False` otherwise
-        """
-
-        if val in self._puzzle._array[row, :] or val in self._puzzle._array[:, col]:
-            return True
-
-        block_index = self._puzzle.block_index(row, col)
-        return val in self._puzzle.block(block_index)
-
-    def _dfs(self, row: int, col: int) -> bool:
+    def _choose_variable(self) -> tuple[tuple[int, int], list[int]] | None:
         """
-        Performs a depth-first-search to solve the sudoku puzzle.
-        Basically, it tries to put any acceptable value at the current cell
-        and then moves to the next cell recursively.
-
-        It may happen that it is impossible to find any
-        acceptable value for the given cell.
-        In such a case we check other values for the **previous**
-        cells. This is called backtracking.
-
-        - https://en.wikipedia.org/wiki/Backtracking
-        - https://www.geeksforgeeks.org/introduction-to-backtracking-2/
-
-        Parameters:
-        -----------
-        row: int
-            row coordinate of the currently considered cell
-        col: int
-            column coordinate of the currently considered cell
+        Chooses the next empty cell.
 
         Return:
         --------
-        solved: bool
-            `True` - if method found the solution
-            `False` - otherwise
+        cell_values: tuple[tuple[int, int], list[int]] | None:
+            if there are no empty cells left, returns `None`
+            otherwise returns coordinates of the next empty cell
+            together with the values acceptable there
         """
 
-        arr = self._puzzle
-
-        if row >= arr.size:
-            return True
-
-        if self._timeout():
-            raise TimeoutError
-
-        new_row, new_col = self._increment_coordinates(row, col)
+        if self._depth == len(self._free_cells):
+            return None
 
-        if arr[row, col] != 0:
-            return self._dfs(new_row, new_col)
+        row, col = self._free_cells[self._depth]
+        return (row, col), self._tensor.values(row, col)
 
-        for val in range(1,arr.size+1):
-            if self._is_excluded(row, col, val):
-                continue
-            arr[row, col] = val
-            if self._dfs(new_row, new_col):
-                return True
-            arr[row, col] = 0
+    def _assign(self, variable: tuple[int, int], value: int) -> None:
+        self._puzzle[variable] = value
+        self._tensor.assign(*variable, value)
+        self._depth += 1
 
-        return False
\ No newline at end of file
+    def _remove_assignment(self, variable: tuple[int, int]) -> None:
+        self._tensor.remove_assignment(*variable, int(self._puzzle[variable]))
+        self._puzzle[variable] = 0
+        self._depth -= 1
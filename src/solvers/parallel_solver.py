@@ -0,0 +1,212 @@
+from __future__ import annotations
+import os
+from enum import StrEnum, auto
+from multiprocessing import Process, Queue
+from queue import Empty
+from timeit import default_timer as timer
+
+import numpy as np
+
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.solver import SudokuSolver
+from src.utils.deadline import DeadlineType
+
+
+class _Outcome(StrEnum):
+    """
+    Type representing what a worker has done with a subproblem.
+    """
+
+    SOLVED = auto()
+    EXHAUSTED = auto()
+    SPLIT = auto()
+    TIMEOUT = auto()
+    FAILURE = auto()
+
+
+def _is_complete(grid: SudokuGrid) -> bool:
+    return bool(np.all(grid._array))
+
+
+def _work(tasks: Queue, results: Queue, time_limit: float) -> None:
+    """
+    Solves subproblems from the task queue until it is terminated.
+
+    Every subproblem comes with a backtrack budget. If the search spends it,
+    the subproblem is split one level deeper and its children are sent back
+    with a doubled budget, so they can be shared by the idle workers.
+
+    Parameters:
+    -----------
+    tasks: Queue
+        queue of (partial grid, backtrack budget) pairs
+    results: Queue
+        queue of (outcome, payload) pairs, the payload is the solution
+        of a solved subproblem or the tasks of a split one
+    time_limit: float
+        amount of time (in seconds) available to the worker
+    """
+
+    deadline = timer() + time_limit
+    while True:
+        grid, budget = tasks.get()
+        solver = None
+        try:
+            solver = FirstFailSudokuSolver(grid, max(deadline - timer(), 0.0))
+            solved = solver.run_with_budget(budget)
+            if solved is None:
+                children = [(child, 2 * budget) for child in solver.subproblems(1)]
+                results.put((_Outcome.SPLIT, children))
+            elif solved:
+                results.put((_Outcome.SOLVED, solver.state.grid))
+            else:
+                results.put((_Outcome.EXHAUSTED, None))
+        except TimeoutError:
+            results.put((_Outcome.TIMEOUT, None))
+        except Exception:
+            results.put((_Outcome.FAILURE, None))
+        finally:
+            # the solver is not run by `solve`, so its deadline is released here
+            if solver is not None:
+                solver._deadline.cancel()
+
+
+class ParallelSudokuSolver(SudokuSolver):
+    """
+    Searches a single puzzle on several cores.
+
+    The top levels of the first-fail search tree are expanded
+    into independent subproblems (partially filled grids, see
+    `FirstFailSudokuSolver.subproblems`), until there are at least
+    `TASKS_PER_WORKER` of them per worker. The worker processes take
+    the subproblems from a shared queue, so the faster workers take more.
+    A subproblem which spends its backtrack budget is split again and its
+    children return to the queue with a doubled budget, so a hard branch
+    is shared among the workers instead of keeping a single one busy.
+    The first solution wins and all the workers are terminated.
+
+    Protected Attributes:
+    ---------------------
+    _workers: int
+        number of the worker processes
+    _split_budget: int
+        backtrack budget of the initial subproblems
+    """
+
+    DEADLINE = DeadlineType.CLOCK
+
+    TASKS_PER_WORKER: int = 4
+    SPLIT_BUDGET: int = 1000
+
+    _workers: int
+    _split_budget: int
+
+    def __init__(
+        self,
+        puzzle: SudokuGrid,
+        time_limit: float,
+        workers: int | None = None,
+        split_budget: int = SPLIT_BUDGET,
+    ) -> None:
+        """
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle to be solved
+        time_limit: float
+            amount of time (in seconds) available to the solver
+        workers: int | None
+            number of the worker processes, the number of CPUs by default;
+            `1` runs the first-fail search in the current process
+        split_budget: int
+            backtrack budget of the initial subproblems
+        """
+
+        super().__init__(puzzle, time_limit)
+        self._workers = workers or os.cpu_count() or 1
+        self._split_budget = split_budget
+
+    def run_algorithm(self) -> SudokuGrid | None:
+        if self._workers == 1:
+            return FirstFailSudokuSolver.solve(self._puzzle, self._deadline.remaining())
+
+        subproblems = self._split()
+        if isinstance(subproblems, SudokuGrid):
+            return subproblems
+        if not subproblems:
+            return None
+
+        tasks, results = Queue(), Queue()
+        for grid in subproblems:
+            tasks.put((grid, self._split_budget))
+        processes = [
+            Process(target=_work, args=(tasks, results, self._deadline.remaining()))
+            for _ in range(self._workers)
+        ]
+        for process in processes:
+            process.start()
+
+        pending, timed_out, failed = len(subproblems), False, False
+        try:
+            while pending:
+                outcome, payload = results.get(timeout=self._deadline.remaining())
+                pending -= 1
+                match outcome:
+                    case _Outcome.SOLVED:
+                        return payload
+                    case _Outcome.SPLIT:
+                        for grid, budget in payload:
+                            if _is_complete(grid):
+                                return grid
+                            tasks.put((grid, budget))
+                        pending += len(payload)
+                    case _Outcome.TIMEOUT:
+                        timed_out = True
+                    case _Outcome.FAILURE:
+                        failed = True
+        except Empty:
+            timed_out = True
+        finally:
+            # the queued subproblems are not needed any more
+            tasks.cancel_join_thread()
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        if timed_out:
+            raise TimeoutError()
+        if failed:
+            raise RuntimeError("a worker has failed")
+        return None
+
+    def _split(self) -> list[SudokuGrid] | SudokuGrid:
+        """
+        Expands the search tree level by level, until there are enough
+        subproblems for all the workers or the tree cannot grow any more.
+
+        Return:
+        --------
+        subproblems: list[SudokuGrid] | SudokuGrid
+            the subproblems, empty if the puzzle has no solution,
+            or a solution found while expanding the tree
+        """
+
+        solver = FirstFailSudokuSolver(self._puzzle, self._deadline.remaining())
+        target = self.TASKS_PER_WORKER * self._workers
+        depth, subproblems = 0, [self._puzzle]
+        try:
+            while len(subproblems) < target:
+                depth += 1
+                expanded = []
+                for grid in solver.subproblems(depth):
+                    if _is_complete(grid):
+                        return grid
+                    expanded.append(grid)
+                if len(expanded) <= len(subproblems) and depth > 1:
+                    return expanded
+                subproblems = expanded
+            return subproblems
+        finally:
+            solver._deadline.cancel()
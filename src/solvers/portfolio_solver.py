@@ -0,0 +1,141 @@
+from __future__ import annotations
+from multiprocessing import Process, Queue
+from queue import Empty
+
+import numpy as np
+
+from src.model.grid import SudokuGrid
+from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
+from src.solvers.exact_cover_solver import ExactCoverSudokuSolver
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.naive_solver import NaiveSudokuSolver
+from src.solvers.solver import SudokuSolver
+from src.utils.deadline import DeadlineType
+
+
+def _race(solver: type[SudokuSolver], puzzle: SudokuGrid, time_limit: float, queue: Queue) -> None:
+    """
+    Runs a single solver of the portfolio and returns its result via the queue.
+    The dancing links solver is run in the race process itself,
+    so terminating the race process stops it.
+
+    Parameters:
+    -----------
+    solver: type[SudokuSolver]
+        a solver to be run
+    puzzle: SudokuGrid
+        a sudoku puzzle to be solved
+    time_limit: float
+        amount of time (in seconds) available to the solver
+    queue: Queue
+        queue used to return the result, `TimeoutError()` if the solver
+        has run out of time, `None` if it has failed
+    """
+
+    try:
+        if solver is DancingLinksSudokuSolver:
+            # the race process already isolates the C solver, a process of its own
+            # would survive the termination of the race and keep a CPU busy
+            queue.put(DancingLinksSudokuSolver(puzzle, time_limit)._run_algorithm())
+        else:
+            queue.put(solver.solve(puzzle, time_limit))
+    except TimeoutError as error:
+        queue.put(error)
+    except Exception:
+        queue.put(None)
+
+
+class PortfolioSudokuSolver(SudokuSolver):
+    """
+    Runs several solvers concurrently on the same puzzle, each in its own process.
+    The first valid solution wins and the remaining solvers are terminated,
+    so the running time is bounded by the best solver for the given puzzle.
+
+    Protected Attributes:
+    ---------------------
+    _solvers: tuple[type[SudokuSolver], ...]
+        solvers taking part in the race
+    """
+
+    DEADLINE = DeadlineType.CLOCK
+
+    SOLVERS: tuple[type[SudokuSolver], ...] = (
+        NaiveSudokuSolver,
+        FirstFailSudokuSolver,
+        DancingLinksSudokuSolver,
+        ExactCoverSudokuSolver,
+    )
+
+    _solvers: tuple[type[SudokuSolver], ...]
+
+    def __init__(
+        self,
+        puzzle: SudokuGrid,
+        time_limit: float,
+        solvers: tuple[type[SudokuSolver], ...] = SOLVERS,
+    ) -> None:
+        super().__init__(puzzle, time_limit)
+        self._solvers = solvers
+
+    def run_algorithm(self) -> SudokuGrid | None:
+        queue = Queue()
+        processes = [
+            Process(target=_race, args=(solver, self._puzzle, self._time_limit, queue))
+            for solver in self._solvers
+        ]
+        for process in processes:
+            process.start()
+
+        timed_out = False
+        try:
+            for _ in processes:
+                result = queue.get(timeout=self._deadline.remaining())
+                if isinstance(result, TimeoutError):
+                    timed_out = True
+                elif result is not None and self._is_solution(result):
+                    return result
+        except Empty:
+            timed_out = True
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+
+        if timed_out:
+            raise TimeoutError()
+        return None
+
+    def _is_solution(self, solution: SudokuGrid) -> bool:
+        """
+        Checks whether the grid is a valid solution of the puzzle.
+
+        Parameters:
+        -----------
+        solution: SudokuGrid
+            a grid returned by one of the solvers
+
+        Return:
+        --------
+        valid: bool
+            `True` if the grid keeps the puzzle's values and every row,
+            column and block contains every value exactly once,
+            `False` otherwise
+        """
+
+        puzzle = self._puzzle._array
+        array = solution._array
+        if array.shape != puzzle.shape:
+            return False
+
+        given = puzzle != 0
+        if not np.array_equal(array[given], puzzle[given]):
+            return False
+
+        size = solution.size
+        blocks = array.reshape(-1)[solution.topology.blocks]
+        expected = np.arange(1, size + 1)
+        return all(
+            np.array_equal(np.sort(units, axis=1), np.broadcast_to(expected, (size, size)))
+            for units in (array, array.T, blocks)
+        )
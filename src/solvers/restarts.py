@@ -0,0 +1,69 @@
+from __future__ import annotations
+from collections.abc import Iterator
+from enum import StrEnum, auto
+from itertools import count
+
+
+def luby(index: int) -> int:
+    """
+    Returns the `index`-th element (counted from 1) of the Luby sequence
+    1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8, ...
+    See: https://doi.org/10.1016/0020-0190(93)90029-9
+
+    Parameters:
+    -----------
+    index: int
+        a positive index
+
+    Return:
+    --------
+    element: int
+        the element of the sequence
+    """
+
+    while True:
+        k = index.bit_length()
+        if index == (1 << k) - 1:
+            return 1 << (k - 1)
+        index -= (1 << (k - 1)) - 1
+
+
+class RestartSchedule(StrEnum):
+    """
+    Type representing how many backtracks a randomized search
+    may spend before it starts over.
+
+    Methods:
+    --------
+    budgets(self, base: int, factor: float = 2.0) -> Iterator[int]:
+        yields the backtrack budgets of the consecutive runs
+    """
+
+    LUBY = auto()
+    GEOMETRIC = auto()
+
+    def budgets(self, base: int, factor: float = 2.0) -> Iterator[int]:
+        """
+        Yields the backtrack budgets of the consecutive runs.
+        The budgets grow without a bound, so the search stays complete.
+
+        Parameters:
+        -----------
+        base: int
+            budget of the first run
+        factor: float
+            growth of the budget between the runs, used by the geometric schedule only
+
+        Return:
+        --------
+        budgets: Iterator[int]
+            `base * luby(i)` or `base * factor^i` for i = 1, 2, ...
+        """
+
+        match self:
+            case RestartSchedule.LUBY:
+                return (base * luby(index) for index in count(1))
+            case RestartSchedule.GEOMETRIC:
+                return (max(int(base * factor**index), 1) for index in count())
+            case _:
+                raise NotImplementedError()
@@ -0,0 +1,172 @@
+from __future__ import annotations
+import os
+import sqlite3
+from collections import OrderedDict
+
+import numpy as np
+
+from src.model.canonical import canonical_form
+from src.model.grid import SudokuGrid, cell_dtype
+
+
+class SolutionCache:
+    """
+    Remembers solutions of solved puzzles, keyed by their canonical form
+    (see `canonical_form`), so a repeated puzzle, or a puzzle isomorphic
+    to an already solved one, is answered without searching.
+
+    The solutions are kept in a bounded in-memory LRU and optionally
+    in a SQLite database as well, which survives the process.
+    Canonicalizing takes about a millisecond, so recently solved puzzles
+    are also remembered as they are, which answers exact repeats
+    with a single dictionary lookup.
+
+    Protected Attributes:
+    ---------------------
+    _entries: OrderedDict[bytes, bytes]
+        canonical solutions by the canonical keys, the most recently used last
+    _recent: OrderedDict[bytes, bytes]
+        solutions by the puzzles themselves, the most recently used last
+    _max_size: int
+        how many solutions are kept in memory
+    _database: sqlite3.Connection | None
+        the on-disk store, if any
+
+    Attributes:
+    -----------
+    hits: int
+        how many lookups have found a solution
+    misses: int
+        how many lookups have not found a solution
+
+    Methods:
+    --------
+    get(puzzle: SudokuGrid) -> SudokuGrid | None:
+        returns a cached solution of the puzzle
+    put(puzzle: SudokuGrid, solution: SudokuGrid) -> None:
+        stores a solution of the puzzle
+    close() -> None:
+        closes the on-disk store
+    """
+
+    hits: int
+    misses: int
+    _entries: OrderedDict[bytes, bytes]
+    _recent: OrderedDict[bytes, bytes]
+    _max_size: int
+    _database: sqlite3.Connection | None
+
+    def __init__(self, max_size: int = 4096, path: str | os.PathLike | None = None) -> None:
+        """
+        Parameters:
+        -----------
+        max_size: int
+            how many solutions are kept in memory
+        path: str | os.PathLike | None
+            path to a SQLite database storing the solutions on disk,
+            none by default
+        """
+
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._recent = OrderedDict()
+        self._max_size = max_size
+        self._database = None
+        if path is not None:
+            self._database = sqlite3.connect(path)
+            self._database.execute("CREATE TABLE IF NOT EXISTS solutions (key BLOB PRIMARY KEY, solution BLOB)")
+            self._database.commit()
+
+    def __enter__(self) -> SolutionCache:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def close(self) -> None:
+        if self._database is not None:
+            self._database.close()
+            self._database = None
+
+    def get(self, puzzle: SudokuGrid) -> SudokuGrid | None:
+        """
+        Returns a cached solution of the puzzle, in the puzzle's orientation.
+
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle
+
+        Return:
+        --------
+        solution: SudokuGrid | None
+            a solution of the puzzle, `None` if none is cached
+        """
+
+        size = puzzle.size
+        raw = puzzle._array.tobytes()
+        solution = self._recent.get(raw)
+        if solution is not None:
+            self.hits += 1
+            self._recent.move_to_end(raw)
+            return SudokuGrid(np.frombuffer(solution, dtype=cell_dtype(size)).reshape(size, size).copy())
+
+        form = canonical_form(puzzle)
+        solution = self._lookup(form.key)
+        if solution is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        array = np.frombuffer(solution, dtype=cell_dtype(size)).reshape(size, size)
+        original = form.to_original(SudokuGrid(array))
+        self._remember(self._recent, raw, original._array.tobytes())
+        return original
+
+    def put(self, puzzle: SudokuGrid, solution: SudokuGrid) -> None:
+        """
+        Stores a solution of the puzzle, transformed to the canonical form.
+
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle
+        solution: SudokuGrid
+            its solution
+        """
+
+        form = canonical_form(puzzle)
+        array = solution._array.T if form.transposed else solution._array
+        canonical = form.labels[array[np.ix_(form.rows, form.cols)]].astype(cell_dtype(puzzle.size))
+        self._remember(self._entries, form.key, canonical.tobytes())
+        self._remember(self._recent, puzzle._array.tobytes(), solution._array.tobytes())
+        if self._database is not None:
+            self._database.execute(
+                "INSERT OR REPLACE INTO solutions (key, solution) VALUES (?, ?)",
+                (form.key, canonical.tobytes()),
+            )
+            self._database.commit()
+
+    def _lookup(self, key: bytes) -> bytes | None:
+        solution = self._entries.get(key)
+        if solution is not None:
+            self._entries.move_to_end(key)
+            return solution
+
+        if self._database is None:
+            return None
+        row = self._database.execute("SELECT solution FROM solutions WHERE key = ?", (key,)).fetchone()
+        if row is None:
+            return None
+        self._remember(self._entries, key, row[0])
+        return row[0]
+
+    def _remember(self, entries: OrderedDict[bytes, bytes], key: bytes, solution: bytes) -> None:
+        entries[key] = solution
+        entries.move_to_end(key)
+        if len(entries) > self._max_size:
+            entries.popitem(last=False)
@@ -0,0 +1,38 @@
+from __future__ import annotations
+from dataclasses import dataclass
+from enum import StrEnum, auto
+
+from src.model.grid import SudokuGrid
+
+
+class SolveStatus(StrEnum):
+    """
+    Type representing the outcome of solving a single puzzle.
+    """
+
+    SOLVED = auto()
+    UNSOLVABLE = auto()
+    TIMEOUT = auto()
+    FAILURE = auto()
+    INVALID = auto()
+
+
+@dataclass(frozen=True, slots=True)
+class SolveResult:
+    """
+    Represents the outcome of solving a single puzzle.
+
+    Attributes:
+    -----------
+    status: SolveStatus
+        - `SOLVED` if the solution has been found,
+        - `UNSOLVABLE` if the solver has found there is no solution,
+        - `TIMEOUT` if the solver has run out of time,
+        - `FAILURE` if the solver has crashed,
+        - `INVALID` if the puzzle could not be read
+    solution: SudokuGrid | None
+        the solution, `None` unless the puzzle has been solved
+    """
+
+    status: SolveStatus
+    solution: SudokuGrid | None = None
@@ -1,7 +1,10 @@
 from abc import ABC, abstractmethod #noqa
+from collections.abc import Iterator
 from warnings import catch_warnings
 
 from src.model.grid import SudokuGrid
+from src.utils.deadline import Deadline, DeadlineType
+from src.utils.metrics import SearchMetrics
 from timeit import default_timer as timer
 
 
@@ -17,13 +20,17 @@ class SudokuSolver(ABC):
         **copy** of the sudoku puzzle to be solved. Solvers can modify this grid.
     _time_limit: float
         how much time is available for the solver
-    _deadline: float
+    _deadline: Deadline
         a deadline used in the built-in _timeout() method
 
     Methods:
     --------
+    run_counting(limit: int) -> int:
+        counts the solutions, stopping at the limit
     _timeout() -> bool:
         checks whether the available time has run out
+    _solutions() -> Iterator:
+        enumerates the solutions, implemented by the solvers able to count them
 
     Abstract Methods:
     -----------------
@@ -32,22 +39,29 @@ class SudokuSolver(ABC):
 
     Class Methods:
     --––––––––––––
-    solve(cls, puzzle: SudokuGrid, time_limit: float, *args, **kwargs) -> SudokuGrid | None:
+    solve(cls, puzzle: SudokuGrid, time_limit: float, *args, metrics: SearchMetrics | None = None, **kwargs) -> SudokuGrid | None:
         an interface method supposed dispatch correct algorithm
+    count_solutions(cls, puzzle: SudokuGrid, time_limit: float, *args, limit: int = 2, **kwargs) -> int:
+        counts the solutions of the puzzle, up to the limit
     """
 
+    DEADLINE: DeadlineType = DeadlineType.TIMER
+    MAX_OVERSHOOT: float = 0.01
+
     _puzzle: SudokuGrid
     _time_limit: float
-    _deadline: float
+    _deadline: Deadline
 
     def __init__(self, puzzle: SudokuGrid, time_limit: float) -> None:
         self._puzzle = puzzle.copy()
         self._time_limit = time_limit
-        self._deadline = timer() + time_limit
+        self._deadline = self.DEADLINE.create(time_limit, self.MAX_OVERSHOOT)
 
     def _timeout(self) -> bool:
         """
         Checks whether the available time has run out.
+        It is called once per search node, the check itself
+        depends on the solver's `DEADLINE`.
 
         Return:
         --------
@@ -55,7 +69,7 @@ class SudokuSolver(ABC):
             - `True` if solver has missed the deadline
             - `False` otherwise
         """
-        return timer() > self._deadline
+        return self._deadline.expired()
 
     @abstractmethod
     def run_algorithm(self) -> SudokuGrid | None:
@@ -75,9 +89,54 @@ class SudokuSolver(ABC):
         """
         pass
 
+    def run_counting(self, limit: int) -> int:
+        """
+        Counts the solutions of the puzzle. The search stops as soon as
+        the limit is reached, e.g. `limit=2` is enough to tell whether
+        the solution is unique.
+
+        Parameters:
+        -----------
+        limit: int
+            the number of solutions to stop at
+
+        Return:
+        --------
+        count: int
+            the number of solutions, at most `limit`
+
+        Raises:
+        -------
+        timeout_error: TimeoutError
+            when the available time runs out
+        """
+
+        count = 0
+        for _ in self._solutions():
+            count += 1
+            if count >= limit:
+                break
+        return count
+
+    def _solutions(self) -> Iterator:
+        """
+        Enumerates the solutions of the puzzle, pausing at every one of them.
+
+        Return:
+        --------
+        solutions: Iterator
+            an iterator pausing at every solution
+
+        Raises:
+        -------
+        not_implemented_error: NotImplementedError
+            when the solver cannot enumerate the solutions
+        """
+        raise NotImplementedError()
+
     @classmethod
     def solve(
-        cls, puzzle: SudokuGrid, time_limit: float, *args, **kwargs
+        cls, puzzle: SudokuGrid, time_limit: float, *args, metrics: SearchMetrics | None = None, **kwargs
     ) -> SudokuGrid | None:
         """
         Solves the given sudoku puzzle within a specified time limit using
@@ -91,6 +150,8 @@ class SudokuSolver(ABC):
             amount of time (in seconds) available to the solver
         *args: Any
             extra arguments passed to the solver constructor
+        metrics: SearchMetrics | None
+            if given, it is filled with statistics of the run
         **kwargs: Any
             extra named arguments passed to the solver constructor
 
@@ -106,5 +167,49 @@ class SudokuSolver(ABC):
             when the available time runs out
         """
 
+        start = timer()
+        solver = cls(puzzle, time_limit, *args, **kwargs)
+        if metrics is not None:
+            metrics.attach(solver)
+        try:
+            return solver.run_algorithm()
+        finally:
+            solver._deadline.cancel()
+            if metrics is not None:
+                metrics.total_time += timer() - start
+
+    @classmethod
+    def count_solutions(cls, puzzle: SudokuGrid, time_limit: float, *args, limit: int = 2, **kwargs) -> int:
+        """
+        Counts the solutions of the given sudoku puzzle, up to the limit,
+        using the solver implemented within the class `cls`.
+
+        Parameters:
+        -----------
+        puzzle: SudokuGrid
+            a sudoku puzzle
+        time_limit: float
+            amount of time (in seconds) available to the solver
+        *args: Any
+            extra arguments passed to the solver constructor
+        limit: int
+            the number of solutions to stop at, `2` tells whether the solution is unique
+        **kwargs: Any
+            extra named arguments passed to the solver constructor
+
+        Return:
+        --------
+        count: int
+            the number of solutions, at most `limit`
+
+        Raises:
+        -------
+        timeout_error: TimeoutError
+            when the available time runs out
+        """
+
         solver = cls(puzzle, time_limit, *args, **kwargs)
-        return solver.run_algorithm()
+        try:
+            return solver.run_counting(limit)
+        finally:
+            solver._deadline.cancel()
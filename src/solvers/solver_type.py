@@ -1,9 +1,16 @@
 from enum import StrEnum, auto
+from timeit import default_timer as timer
 
 from src.model.grid import SudokuGrid
+from src.solvers.dancing_links_pool import shared_pool
 from src.solvers.first_fail_solver import FirstFailSudokuSolver
 from src.solvers.naive_solver import NaiveSudokuSolver
-from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
+from src.solvers.exact_cover_solver import ExactCoverSudokuSolver
+from src.solvers.parallel_solver import ParallelSudokuSolver
+from src.solvers.portfolio_solver import PortfolioSudokuSolver
+from src.solvers.restarts import RestartSchedule
+from src.solvers.solution_cache import SolutionCache
+from src.utils.metrics import SearchMetrics
 
 
 class SudokuSolverType(StrEnum):
@@ -12,22 +19,88 @@ class SudokuSolverType(StrEnum):
 
     Methods:
     --------
-    solve(self, puzzle: SudokuGrid, time_limit: float) -> SudokuGrid:
+    solve(self, puzzle: SudokuGrid, time_limit: float, metrics: SearchMetrics | None = None, cache: SolutionCache | None = None, seed: int | None = None, workers: int | None = None) -> SudokuGrid:
         solves the given puzzle with a time limit
-        uses a solver corresponding to the enum value
+        uses a solver corresponding to the enum value,
+        the dancing links solves go through the shared pool (see `shared_pool`)
+        fills the metrics with statistics of the run, if given
+        looks the puzzle up in the cache first and stores the found solution there, if given
+        seeds the randomized solvers with the seed, if given
+        runs the parallel solvers with the number of workers, if given
+    count_solutions(self, puzzle: SudokuGrid, time_limit: float, limit: int = 2) -> int:
+        counts the solutions of the given puzzle, up to the limit,
+        supported by the naive, first-fail and exact cover solvers
     """
 
     NAIVE = auto()
     FIRST_FAIL = auto()
     DANCING_LINKS = auto()
+    EXACT_COVER = auto()
+    PORTFOLIO = auto()
+    FIRST_FAIL_RESTARTS = auto()
+    PARALLEL_FIRST_FAIL = auto()
 
-    def solve(self, puzzle: SudokuGrid, time_limit: float) -> SudokuGrid:
+    def solve(
+        self,
+        puzzle: SudokuGrid,
+        time_limit: float,
+        metrics: SearchMetrics | None = None,
+        cache: SolutionCache | None = None,
+        seed: int | None = None,
+        workers: int | None = None,
+    ) -> SudokuGrid:
+        if cache is not None:
+            solution = cache.get(puzzle)
+            if solution is not None:
+                return solution
+
+        solution = self._solve(puzzle, time_limit, metrics, seed, workers)
+        if cache is not None and solution is not None:
+            cache.put(puzzle, solution)
+        return solution
+
+    def _solve(
+        self,
+        puzzle: SudokuGrid,
+        time_limit: float,
+        metrics: SearchMetrics | None,
+        seed: int | None,
+        workers: int | None,
+    ) -> SudokuGrid:
         match self:
             case SudokuSolverType.NAIVE:
-                return NaiveSudokuSolver.solve(puzzle, time_limit)
+                return NaiveSudokuSolver.solve(puzzle, time_limit, metrics=metrics)
             case SudokuSolverType.FIRST_FAIL:
-                return FirstFailSudokuSolver.solve(puzzle, time_limit)
+                return FirstFailSudokuSolver.solve(puzzle, time_limit, metrics=metrics)
             case SudokuSolverType.DANCING_LINKS:
-                return DancingLinksSudokuSolver.solve(puzzle, time_limit)
+                # the shared pool keeps the library loaded in a worker between the puzzles,
+                # instead of starting a process for every one of them
+                start = timer()
+                try:
+                    return shared_pool().solve(puzzle, time_limit)
+                finally:
+                    if metrics is not None:
+                        metrics.total_time += timer() - start
+            case SudokuSolverType.EXACT_COVER:
+                return ExactCoverSudokuSolver.solve(puzzle, time_limit, metrics=metrics)
+            case SudokuSolverType.PORTFOLIO:
+                return PortfolioSudokuSolver.solve(puzzle, time_limit, metrics=metrics)
+            case SudokuSolverType.FIRST_FAIL_RESTARTS:
+                return FirstFailSudokuSolver.solve(
+                    puzzle, time_limit, metrics=metrics, seed=seed, restarts=RestartSchedule.LUBY
+                )
+            case SudokuSolverType.PARALLEL_FIRST_FAIL:
+                return ParallelSudokuSolver.solve(puzzle, time_limit, metrics=metrics, workers=workers)
+            case _:
+                raise NotImplementedError()
+
+    def count_solutions(self, puzzle: SudokuGrid, time_limit: float, limit: int = 2) -> int:
+        match self:
+            case SudokuSolverType.NAIVE:
+                return NaiveSudokuSolver.count_solutions(puzzle, time_limit, limit=limit)
+            case SudokuSolverType.FIRST_FAIL:
+                return FirstFailSudokuSolver.count_solutions(puzzle, time_limit, limit=limit)
+            case SudokuSolverType.EXACT_COVER:
+                return ExactCoverSudokuSolver.count_solutions(puzzle, time_limit, limit=limit)
             case _:
                 raise NotImplementedError()
@@ -0,0 +1,207 @@
+from __future__ import annotations
+import math
+import threading
+from abc import ABC, abstractmethod
+from enum import StrEnum, auto
+from timeit import default_timer as timer
+
+
+class Deadline(ABC):
+    """
+    A point in time the search has to finish by.
+
+    Solvers ask `expired()` at least once per search node, so the different
+    implementations trade the cost of that call for the precision
+    of detecting the deadline. No implementation interrupts the solver,
+    so a step taking long between two checks delays the detection
+    by up to its duration.
+
+    Attributes:
+    -----------
+    at: float
+        the deadline, as a `timer()` reading
+
+    Methods:
+    --------
+    remaining() -> float:
+        returns the time (in seconds) left until the deadline
+    cancel() -> None:
+        releases resources held by the deadline, once the search is over
+
+    Abstract Methods:
+    -----------------
+    expired() -> bool:
+        checks whether the deadline has passed
+    """
+
+    at: float
+
+    def __init__(self, time_limit: float) -> None:
+        self.at = timer() + time_limit
+
+    @abstractmethod
+    def expired(self) -> bool:
+        """
+        Checks whether the deadline has passed.
+
+        Return:
+        --------
+        expired: bool
+            - `True` if the deadline has been detected to pass
+            - `False` otherwise
+        """
+        pass
+
+    def remaining(self) -> float:
+        return max(self.at - timer(), 0.0)
+
+    def cancel(self) -> None:
+        pass
+
+
+class ClockDeadline(Deadline):
+    """
+    Reads the clock on every check. Exact, but the clock read
+    is a noticeable share of the cost of a cheap search node.
+    """
+
+    def expired(self) -> bool:
+        return timer() > self.at
+
+
+class AmortizedDeadline(Deadline):
+    """
+    Reads the clock only once every `budget` checks.
+
+    The budget is calibrated to the measured rate of checks, so that
+    the checks between two clock reads take about `max_overshoot` seconds
+    (and never more than the time remaining), and it at most doubles
+    from one clock read to the next. The budget counts checks, not time:
+    while the checks keep their pace the deadline is detected about
+    `max_overshoot` late, but if they become `k` times slower, the clock
+    reads become `k` times rarer until the next one recalibrates the budget.
+    The overshoot therefore depends on how evenly the solver checks,
+    a solver checking unevenly should use the timer deadline instead.
+
+    Protected Attributes:
+    ---------------------
+    _max_overshoot: float
+        desired time (in seconds) between two clock reads
+    _budget: int
+        number of checks between the last two clock reads
+    _countdown: int
+        number of checks left until the next clock read
+    _last: float
+        time of the last clock read
+    """
+
+    _max_overshoot: float
+    _budget: int
+    _countdown: int
+    _last: float
+
+    def __init__(self, time_limit: float, max_overshoot: float) -> None:
+        super().__init__(time_limit)
+        self._max_overshoot = max_overshoot
+        self._budget = self._countdown = 1
+        self._last = timer()
+
+    def expired(self) -> bool:
+        self._countdown -= 1
+        if self._countdown > 0:
+            return False
+
+        now = timer()
+        if now > self.at:
+            return True
+
+        elapsed = now - self._last
+        window = min(self._max_overshoot, self.at - now)
+        if elapsed > 0:
+            budget = int(self._budget * window / elapsed)
+        else:
+            budget = 2 * self._budget
+        self._budget = self._countdown = max(1, min(budget, 2 * self._budget))
+        self._last = now
+        return False
+
+
+class TimerDeadline(Deadline):
+    """
+    A background timer thread raises a flag when the deadline passes,
+    so a check only reads the flag. The deadline is detected as soon as
+    the interpreter switches to the timer thread (see `sys.getswitchinterval`),
+    so unlike the amortized deadline the overshoot is bounded in time,
+    whatever the pace of the checks. The default deadline of the solvers.
+
+    Protected Attributes:
+    ---------------------
+    _expired: bool
+        the flag raised by the timer
+    _timer: threading.Timer | None
+        the timer thread, `None` for an infinite time limit
+    """
+
+    _expired: bool
+    _timer: threading.Timer | None
+
+    def __init__(self, time_limit: float) -> None:
+        super().__init__(time_limit)
+        self._expired = False
+        self._timer = None
+        # a timer cannot wait for an infinite time, and it would never fire anyway
+        if math.isfinite(time_limit):
+            self._timer = threading.Timer(time_limit, self._expire)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def expired(self) -> bool:
+        return self._expired
+
+    def cancel(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+
+    def _expire(self) -> None:
+        self._expired = True
+
+
+class DeadlineType(StrEnum):
+    """
+    Type representing how the deadline of a solver is checked.
+
+    Methods:
+    --------
+    create(self, time_limit: float, max_overshoot: float) -> Deadline:
+        creates a deadline of this type
+    """
+
+    CLOCK = auto()
+    AMORTIZED = auto()
+    TIMER = auto()
+
+    def create(self, time_limit: float, max_overshoot: float) -> Deadline:
+        """
+        Creates a deadline of this type.
+
+        Parameters:
+        -----------
+        time_limit: float
+            amount of time (in seconds) until the deadline
+        max_overshoot: float
+            how late (in seconds) the deadline may be detected,
+            used by the amortized deadline only
+
+        Return:
+        --------
+        deadline: Deadline
+            a new deadline
+        """
+
+        match self:
+            case DeadlineType.CLOCK:
+                return ClockDeadline(time_limit)
+            case DeadlineType.AMORTIZED:
+                return AmortizedDeadline(time_limit, max_overshoot)
+            case DeadlineType.TIMER:
+                return TimerDeadline(time_limit)
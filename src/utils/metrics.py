@@ -0,0 +1,151 @@
+from __future__ import annotations
+from dataclasses import asdict, dataclass
+from functools import wraps
+from timeit import default_timer as timer
+from typing import Any, Callable
+
+
+@dataclass(slots=True)
+class SearchMetrics:
+    """
+    Statistics of a single solver run.
+
+    The metrics are collected by wrapping the solver's search hooks
+    on the solver instance, so a solver without attached metrics
+    runs its original methods and pays nothing for them.
+
+    Attributes:
+    -----------
+    nodes: int
+        how many values (candidates) have been tried
+    backtracks: int
+        how many assignments have been taken back
+    max_depth: int
+        maximum number of assignments in place at the same time
+    timeout_checks: int
+        how many times the deadline has been checked
+    choose_time: float
+        time (in seconds) spent choosing variables
+    assign_time: float
+        time (in seconds) spent assigning and unassigning values
+    check_time: float
+        time (in seconds) spent checking constraints (propagation)
+    total_time: float
+        time (in seconds) of the whole run
+
+    Methods:
+    --------
+    attach(solver: Any) -> None:
+        starts collecting the metrics of the solver
+    as_dict() -> dict[str, int | float]:
+        returns the metrics as a dictionary
+    """
+
+    nodes: int = 0
+    backtracks: int = 0
+    max_depth: int = 0
+    timeout_checks: int = 0
+    choose_time: float = 0.0
+    assign_time: float = 0.0
+    check_time: float = 0.0
+    total_time: float = 0.0
+    _depth: int = 0
+
+    HOOKS = {
+        "_choose_variable": "choose",
+        "_choose_column": "choose",
+        "_candidates": "choose",
+        "_assign": "descend",
+        "_select": "descend",
+        "_remove_assignment": "ascend",
+        "_deselect": "ascend",
+        "_propagate": "check",
+        "_timeout": "timeout",
+    }
+    """Search methods of the solvers and the role they play"""
+
+    def attach(self, solver: Any) -> None:
+        """
+        Starts collecting the metrics of the solver,
+        by wrapping those of its methods listed in `HOOKS`.
+
+        Parameters:
+        -----------
+        solver: Any
+            a solver whose run should be measured
+        """
+
+        for name, role in self.HOOKS.items():
+            method = getattr(solver, name, None)
+            if callable(method):
+                setattr(solver, name, getattr(self, f"_{role}")(method))
+
+    def as_dict(self) -> dict[str, int | float]:
+        """
+        Returns the metrics as a dictionary.
+
+        Return:
+        --------
+        metrics: dict[str, int | float]
+            the public metrics by their names
+        """
+        metrics = asdict(self)
+        del metrics["_depth"]
+        return metrics
+
+    def _choose(self, method: Callable) -> Callable:
+        @wraps(method)
+        def choose(*args):
+            start = timer()
+            try:
+                return method(*args)
+            finally:
+                self.choose_time += timer() - start
+
+        return choose
+
+    def _descend(self, method: Callable) -> Callable:
+        @wraps(method)
+        def descend(*args):
+            self.nodes += 1
+            self._depth += 1
+            self.max_depth = max(self.max_depth, self._depth)
+            start = timer()
+            try:
+                return method(*args)
+            finally:
+                self.assign_time += timer() - start
+
+        return descend
+
+    def _ascend(self, method: Callable) -> Callable:
+        @wraps(method)
+        def ascend(*args):
+            self.backtracks += 1
+            self._depth -= 1
+            start = timer()
+            try:
+                return method(*args)
+            finally:
+                self.assign_time += timer() - start
+
+        return ascend
+
+    def _check(self, method: Callable) -> Callable:
+        @wraps(method)
+        def check(*args):
+            start = timer()
+            try:
+                return method(*args)
+            finally:
+                self.check_time += timer() - start
+
+        return check
+
+    def _timeout(self, method: Callable) -> Callable:
+        @wraps(method)
+        def timeout(*args):
+            self.timeout_checks += 1
+            return method(*args)
+
+        return timeout
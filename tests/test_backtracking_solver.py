@@ -0,0 +1,46 @@
+import inspect
+import unittest
+from pathlib import Path
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver, StateBackend
+from src.solvers.naive_solver import NaiveSudokuSolver
+from src.utils.recursion_limit import recursion_limit_set_to
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+# the first row needs a 3, which its block already has
+UNSOLVABLE = [[1, 2, 0, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+class IterativeSearchTest(unittest.TestCase):
+    def test_search_deeper_than_the_recursion_limit(self) -> None:
+        puzzle = load("sudokuN4num0.txt")
+        free_cells = int((puzzle.to_array(int) == 0).sum())
+        limit = len(inspect.stack()) + 30
+        self.assertGreater(free_cells, limit)
+
+        with recursion_limit_set_to(limit):
+            solution = NaiveSudokuSolver.solve(puzzle, 60.0)
+        self.assertIsNotNone(solution)
+        self.assertFalse((solution.to_array(int) == 0).any())
+
+    def test_solvers_agree(self) -> None:
+        for name in ("sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN3num2.txt"):
+            with self.subTest(puzzle=name):
+                puzzle = load(name)
+                expected = str(NaiveSudokuSolver.solve(puzzle, 60.0))
+                for backend in StateBackend:
+                    self.assertEqual(str(FirstFailSudokuSolver.solve(puzzle, 60.0, backend=backend)), expected)
+
+    def test_unsolvable_puzzle(self) -> None:
+        puzzle = grid_from_values(UNSOLVABLE)
+        self.assertIsNone(NaiveSudokuSolver.solve(puzzle, 60.0))
+        for backend in StateBackend:
+            self.assertIsNone(FirstFailSudokuSolver.solve(puzzle, 60.0, backend=backend))
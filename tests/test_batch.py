@@ -0,0 +1,51 @@
+import threading
+import unittest
+from pathlib import Path
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.batch import SolveStatus, solve_batch, solve_one, solve_stream
+from src.solvers.solver_type import SudokuSolverType
+
+
+PUZZLE = [[0, 0, 3, 4], [3, 4, 0, 0], [0, 0, 4, 3], [4, 3, 0, 0]]
+# the first row needs a 3, which its block already has
+UNSOLVABLE = [[1, 2, 0, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+class SolveBatchTest(unittest.TestCase):
+    def test_results_keep_the_puzzle_order(self) -> None:
+        puzzles = [grid_from_values(values) for values in (PUZZLE, UNSOLVABLE, PUZZLE, UNSOLVABLE, PUZZLE)]
+        for workers in (1, 2):
+            with self.subTest(workers=workers):
+                results = solve_batch(puzzles, SudokuSolverType.FIRST_FAIL, 5.0, workers=workers, chunk_size=2)
+                self.assertEqual(
+                    [result.status for result in results],
+                    [SolveStatus.SOLVED, SolveStatus.UNSOLVABLE, SolveStatus.SOLVED, SolveStatus.UNSOLVABLE, SolveStatus.SOLVED],
+                )
+                self.assertEqual(results[0].solution._array.sum(), 40)
+                self.assertIsNone(results[1].solution)
+
+    def test_timeout_is_reported(self) -> None:
+        with open(Path(__file__).parent.parent / "puzzles" / "sudokuN9num0.txt") as file:
+            puzzle = SudokuGrid.from_text(file.readlines())
+        result = solve_one(puzzle, SudokuSolverType.FIRST_FAIL, 0.001)
+        self.assertEqual(result.status, SolveStatus.TIMEOUT)
+        self.assertIsNone(result.solution)
+
+
+class SolveStreamTest(unittest.TestCase):
+    def test_result_is_yielded_before_the_next_puzzle(self) -> None:
+        answered = threading.Event()
+
+        def puzzles():
+            yield grid_from_values(PUZZLE)
+            # like a client on a pipe, waits for the answer before sending more
+            self.assertTrue(answered.wait(timeout=10))
+            yield None
+
+        results = []
+        for result in solve_stream(puzzles(), SudokuSolverType.FIRST_FAIL, 5.0, workers=2):
+            results.append(result.status)
+            answered.set()
+        self.assertEqual(results, [SolveStatus.SOLVED, SolveStatus.INVALID])
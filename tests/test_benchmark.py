@@ -0,0 +1,130 @@
+import itertools
+import json
+import math
+import tempfile
+import unittest
+from pathlib import Path
+
+import benchmark
+from src.model.corpus import grid_from_values
+from src.solvers.solve_result import SolveStatus
+from src.solvers.solver_type import SudokuSolverType
+
+
+PUZZLE = [[0, 0, 3, 4], [3, 4, 0, 0], [0, 0, 4, 3], [4, 3, 0, 0]]
+# the first row needs a 3, which its block already has
+UNSOLVABLE = [[1, 2, 0, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+class SummarizeTest(unittest.TestCase):
+    def test_statistics(self) -> None:
+        summary = benchmark.summarize([3.0, 1.0, 2.0, 4.0])
+        self.assertEqual(summary["median"], 2.5)
+        self.assertEqual(summary["p95"], 4.0)
+        self.assertEqual((summary["min"], summary["max"]), (1.0, 4.0))
+        self.assertAlmostEqual(summary["stddev"], 1.2909944)
+        self.assertAlmostEqual(summary["cv"], 1.2909944 / 2.5)
+
+    def test_no_times(self) -> None:
+        self.assertEqual(set(benchmark.summarize([]).values()), {None})
+
+    def test_single_time(self) -> None:
+        summary = benchmark.summarize([2.0])
+        self.assertEqual((summary["median"], summary["p95"], summary["stddev"], summary["cv"]), (2.0, 2.0, 0.0, 0.0))
+
+
+class MeasureTest(unittest.TestCase):
+    def test_puzzle_size(self) -> None:
+        puzzle = grid_from_values(PUZZLE)
+        self.assertEqual(benchmark.puzzle_size("puzzles/sudokuN3num0.txt", puzzle), 9)
+        self.assertEqual(benchmark.puzzle_size("puzzles/other.txt", puzzle), 4)
+
+    def test_measured_repetitions(self) -> None:
+        measurement = benchmark.measure("solved", grid_from_values(PUZZLE), SudokuSolverType.FIRST_FAIL, 3, 1, 5.0)
+        self.assertEqual(measurement.status, SolveStatus.SOLVED)
+        self.assertEqual(len(measurement.times), 3)
+
+    def test_stops_at_the_first_failure(self) -> None:
+        measurement = benchmark.measure("unsolvable", grid_from_values(UNSOLVABLE), SudokuSolverType.FIRST_FAIL, 3, 0, 5.0)
+        self.assertEqual(measurement.status, SolveStatus.UNSOLVABLE)
+        self.assertEqual(measurement.times, [])
+
+    def test_groups_by_size(self) -> None:
+        measurements = [
+            benchmark.Measurement("a", 9, "first_fail", times=[1.0, 3.0]),
+            benchmark.Measurement("b", 9, "first_fail", times=[5.0]),
+            benchmark.Measurement("c", 9, "first_fail", SolveStatus.TIMEOUT),
+            benchmark.Measurement("d", 16, "first_fail", times=[7.0]),
+        ]
+        groups = benchmark.group_by_size(measurements)
+        self.assertEqual([(group["size"], group["puzzles"], group["solved"]) for group in groups], [(9, 3, 2), (16, 1, 1)])
+        self.assertEqual(groups[0]["median"], 3.5)
+
+    def test_saves_json_and_csv(self) -> None:
+        result = {"puzzle": "a", "size": 4, "solver": "naive", "status": "solved", "times": [1.0, 2.0], "metrics": None}
+        report = {"results": [result | benchmark.summarize(result["times"])]}
+        with tempfile.TemporaryDirectory() as directory:
+            benchmark.save(Path(directory) / "report.json", report)
+            self.assertEqual(json.loads((Path(directory) / "report.json").read_text()), report)
+
+            benchmark.save(Path(directory) / "report.csv", report)
+            header, row = (Path(directory) / "report.csv").read_text().splitlines()
+            record = dict(zip(header.split(","), row.split(",")))
+            self.assertEqual((record["puzzle"], record["median"], record["times"]), ("a", "1.5", "1.0 2.0"))
+
+
+class SlowdownTest(unittest.TestCase):
+    def test_no_times(self) -> None:
+        self.assertEqual(benchmark.slower_p_value([], [1.0]), 1.0)
+        self.assertEqual(benchmark.slower_p_value([1.0], []), 1.0)
+
+    def test_exact_for_small_samples(self) -> None:
+        # 3 against 3 timings cannot go below 1 / C(6, 3)
+        self.assertAlmostEqual(benchmark.slower_p_value([4.0, 5.0, 6.0], [1.0, 2.0, 3.0]), 1 / 20)
+        self.assertAlmostEqual(benchmark.slower_p_value([1.0, 2.0, 3.0], [4.0, 5.0, 6.0]), 1.0)
+
+    def test_exact_matches_enumeration(self) -> None:
+        current, baseline = [2.0, 3.0, 3.0, 5.0], [1.0, 2.0, 3.0, 4.0, 4.0]
+        times = sorted(current + baseline)
+        ranks = {time: (times.index(time) + 1 + len(times) - times[::-1].index(time)) / 2 for time in times}
+        rank_sum = sum(ranks[time] for time in current)
+        subsets = list(itertools.combinations([ranks[time] for time in times], len(current)))
+        expected = sum(sum(subset) >= rank_sum for subset in subsets) / len(subsets)
+        self.assertEqual(len(subsets), math.comb(9, 4))
+        self.assertAlmostEqual(benchmark.slower_p_value(current, baseline), expected)
+
+    def test_normal_approximation_for_large_samples(self) -> None:
+        baseline = [1.0 + i / 100 for i in range(30)]
+        slower = [2.0 + i / 100 for i in range(30)]
+        self.assertLess(benchmark.slower_p_value(slower, baseline), 1e-6)
+        self.assertGreater(benchmark.slower_p_value(baseline, baseline), 0.4)
+
+
+class CompareTest(unittest.TestCase):
+    def report(self, status: str, times: list[float]) -> dict:
+        result = {"puzzle": "a", "solver": "naive", "status": status, "times": times}
+        return {"results": [result | benchmark.summarize(times)]}
+
+    def test_lost_solution_is_a_regression(self) -> None:
+        [comparison] = benchmark.compare(self.report("solved", [1.0]), self.report("timeout", []), 0.1, 0.05)
+        self.assertTrue(comparison["regression"])
+        self.assertIsNone(comparison["change"])
+
+    def test_significant_slowdown_is_a_regression(self) -> None:
+        baseline = self.report("solved", [1.0 + i / 100 for i in range(10)])
+        current = self.report("solved", [2.0 + i / 100 for i in range(10)])
+        [comparison] = benchmark.compare(baseline, current, 0.1, 0.05)
+        self.assertTrue(comparison["regression"])
+        self.assertAlmostEqual(comparison["change"], 2.045 / 1.045 - 1)
+
+    def test_few_timings_are_not_significant(self) -> None:
+        baseline, current = self.report("solved", [1.0, 1.1]), self.report("solved", [2.0, 2.1])
+        [comparison] = benchmark.compare(baseline, current, 0.1, 0.05)
+        self.assertFalse(comparison["regression"])
+        self.assertGreater(comparison["p_value"], 0.05)
+
+    def test_small_slowdown_is_not_a_regression(self) -> None:
+        baseline = self.report("solved", [1.0 + i / 1000 for i in range(10)])
+        current = self.report("solved", [1.05 + i / 1000 for i in range(10)])
+        [comparison] = benchmark.compare(baseline, current, 0.1, 0.05)
+        self.assertFalse(comparison["regression"])
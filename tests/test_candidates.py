@@ -0,0 +1,43 @@
+import unittest
+
+from src.model.candidates import CandidateTensor
+from src.model.corpus import grid_from_values
+
+
+PUZZLE = [[0, 0, 3, 4], [3, 4, 0, 0], [0, 0, 4, 3], [4, 3, 0, 0]]
+
+
+def brute_force(grid, row, col):
+    if grid[row, col] != 0:
+        return []
+    block = [
+        grid[r, c]
+        for r in range(row // 2 * 2, row // 2 * 2 + 2)
+        for c in range(col // 2 * 2, col // 2 * 2 + 2)
+    ]
+    used = {grid[row, c] for c in range(4)} | {grid[r, col] for r in range(4)} | set(block)
+    return [value for value in range(1, 5) if value not in used]
+
+
+class CandidateTensorTest(unittest.TestCase):
+    def assertMatches(self, grid, tensor) -> None:
+        for row in range(4):
+            for col in range(4):
+                expected = brute_force(grid, row, col)
+                self.assertEqual(tensor.values(row, col), expected)
+                self.assertEqual(tensor.count(row, col), len(expected))
+                for value in range(1, 5):
+                    self.assertEqual(tensor.allowed(row, col, value), value in expected)
+
+    def test_follows_assignments(self) -> None:
+        grid = grid_from_values(PUZZLE)
+        tensor = CandidateTensor(grid)
+        self.assertMatches(grid, tensor)
+
+        grid[0, 0] = 1
+        tensor.assign(0, 0, 1)
+        self.assertMatches(grid, tensor)
+
+        grid[0, 0] = 0
+        tensor.remove_assignment(0, 0, 1)
+        self.assertMatches(grid, tensor)
@@ -0,0 +1,66 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.model.corpus import read_corpus, read_puzzles, read_text_puzzles, write_corpus
+from src.model.grid import SudokuGrid
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+class CorpusTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = Path(self.directory.name)
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+
+    def test_round_trip(self) -> None:
+        for names in (["sudokuN3num0.txt", "sudokuN3num1.txt", "sudokuN3num2.txt"], ["sudokuN16num0.txt"]):
+            with self.subTest(names=names):
+                puzzles = [load(name) for name in names]
+                path = self.path / "puzzles.sdc"
+                self.assertEqual(write_corpus(path, puzzles), len(puzzles))
+
+                read = list(read_puzzles(path))
+                self.assertEqual(len(read), len(puzzles))
+                for puzzle, copy in zip(puzzles, read):
+                    self.assertTrue(np.array_equal(copy._array, puzzle._array))
+                    self.assertEqual(copy._array.dtype, puzzle._array.dtype)
+
+    def test_empty_corpus(self) -> None:
+        path = self.path / "empty.sdc"
+        self.assertEqual(write_corpus(path, []), 0)
+        self.assertEqual(list(read_corpus(path)), [])
+
+    def test_sizes_cannot_be_mixed(self) -> None:
+        with self.assertRaises(ValueError):
+            write_corpus(self.path / "mixed.sdc", [load("sudokuN2num0.txt"), load("sudokuN3num0.txt")])
+
+    def test_invalid_corpus(self) -> None:
+        path = self.path / "puzzles.sdc"
+        write_corpus(path, [load("sudokuN3num0.txt")])
+        data = path.read_bytes()
+        for corrupted in (data[:5], b"XXXX" + data[4:], data[:-1]):
+            with self.subTest(corrupted=corrupted[:8]):
+                path.write_bytes(corrupted)
+                with self.assertRaises(ValueError):
+                    list(read_corpus(path))
+
+    def test_text_puzzles_separated_by_empty_lines(self) -> None:
+        names = ["sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN2num1.txt"]
+        path = self.path / "puzzles.txt"
+        path.write_text("\n\n".join((PUZZLES / name).read_text().strip() for name in names) + "\n")
+
+        read = list(read_text_puzzles(path))
+        self.assertEqual([str(puzzle) for puzzle in read], [str(load(name)) for name in names])
+        self.assertEqual([str(puzzle) for puzzle in read_puzzles(path)], [str(puzzle) for puzzle in read])
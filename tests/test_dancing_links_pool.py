@@ -0,0 +1,105 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from pathlib import Path
+
+from src.model.corpus import grid_from_values
+from src.solvers import dancing_links_pool
+from src.solvers.batch import solve_batch
+from src.solvers.dancing_links_pool import DancingLinksPool, shared_pool
+from src.solvers.solve_result import SolveStatus
+from src.solvers.solver_type import SudokuSolverType
+
+
+STUB = r"""
+#include <unistd.h>
+
+/* Stands in for the C solver: a complete grid is its own solution,
+   a grid starting with two empty cells never finishes
+   and any other one has no solution. */
+int solve_puzzle(int *puzzle, int size, int *solution) {
+    if (puzzle[0] == 0 && puzzle[1] == 0) {
+        sleep(60);
+    }
+    for (int i = 0; i < size * size; i++) {
+        if (puzzle[i] == 0) {
+            return 0;
+        }
+        solution[i] = puzzle[i];
+    }
+    return 1;
+}
+"""
+
+SOLVED = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+UNSOLVABLE = [[1, 0, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+ENDLESS = [[0, 0, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+
+
+@unittest.skipUnless(shutil.which("cc"), "needs a C compiler")
+class DancingLinksPoolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        library = Path(self.directory.name) / "lib" / "ss.so"
+        library.parent.mkdir()
+        source = library.with_suffix(".c")
+        source.write_text(STUB)
+        subprocess.run(["cc", "-shared", "-fPIC", "-o", str(library), str(source)], check=True)
+        # the workers load the library from `lib/ss.so` relative to their directory
+        os.chdir(self.directory.name)
+
+    def tearDown(self) -> None:
+        if dancing_links_pool._shared is not None:
+            dancing_links_pool._shared[1].close()
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_solve_many_reports_statuses(self) -> None:
+        puzzles = [grid_from_values(values) for values in (SOLVED, UNSOLVABLE, ENDLESS, SOLVED)]
+        with DancingLinksPool(workers=2) as pool:
+            results = pool.solve_many(puzzles, 1.0)
+
+        statuses = [result.status for result in results]
+        self.assertEqual(statuses, [SolveStatus.SOLVED, SolveStatus.UNSOLVABLE, SolveStatus.TIMEOUT, SolveStatus.SOLVED])
+        self.assertEqual(results[0].solution._array.tolist(), SOLVED)
+        self.assertIsNone(results[1].solution)
+
+    def test_worker_survives_timeout(self) -> None:
+        with DancingLinksPool(workers=1) as pool:
+            with self.assertRaises(TimeoutError):
+                pool.solve(grid_from_values(ENDLESS), 0.5)
+            self.assertIsNone(pool.solve(grid_from_values(UNSOLVABLE), 5.0))
+            self.assertIsNotNone(pool.solve(grid_from_values(SOLVED), 5.0))
+
+    def test_batch_reports_statuses(self) -> None:
+        puzzles = [grid_from_values(values) for values in (UNSOLVABLE, ENDLESS, SOLVED)]
+        results = solve_batch(puzzles, SudokuSolverType.DANCING_LINKS, 1.0, workers=2)
+        statuses = [result.status for result in results]
+        self.assertEqual(statuses, [SolveStatus.UNSOLVABLE, SolveStatus.TIMEOUT, SolveStatus.SOLVED])
+
+    def test_solver_type_uses_shared_pool(self) -> None:
+        pool = shared_pool()
+        [worker] = pool._workers
+        for _ in range(3):
+            solution = SudokuSolverType.DANCING_LINKS.solve(grid_from_values(SOLVED), 5.0)
+            self.assertEqual(solution._array.tolist(), SOLVED)
+        self.assertIs(shared_pool(), pool)
+        self.assertEqual(pool._workers, [worker])
+
+
+class MissingLibraryTest(unittest.TestCase):
+    def test_failure_is_reported(self) -> None:
+        cwd = os.getcwd()
+        with tempfile.TemporaryDirectory() as directory:
+            os.chdir(directory)
+            try:
+                with DancingLinksPool(workers=1) as pool:
+                    [result] = pool.solve_many([grid_from_values(SOLVED)], 5.0)
+                    with self.assertRaises(RuntimeError):
+                        pool.solve(grid_from_values(SOLVED), 5.0)
+            finally:
+                os.chdir(cwd)
+        self.assertEqual(result.status, SolveStatus.FAILURE)
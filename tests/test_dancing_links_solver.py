@@ -0,0 +1,87 @@
+import os
+import shutil
+import subprocess
+import tempfile
+import unittest
+from ctypes import c_int
+from pathlib import Path
+
+import numpy as np
+
+from src.model.corpus import grid_from_values
+from src.solvers import dancing_links_solver
+from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
+
+
+STUB = r"""
+/* Stands in for the C solver: fills every empty cell of the last row
+   with the value missing there, the other rows are copied. */
+int solve_puzzle(int *puzzle, int size, int *solution) {
+    int missing = size * (size + 1) / 2;
+    for (int i = 0; i < size * size; i++) {
+        solution[i] = puzzle[i];
+        if (i >= size * (size - 1)) {
+            missing -= puzzle[i];
+        }
+    }
+    for (int i = size * (size - 1); i < size * size; i++) {
+        if (solution[i] == 0) {
+            solution[i] = missing;
+            return 1;
+        }
+    }
+    return 0;
+}
+"""
+
+SOLVED = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+ALMOST = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 0, 1]]
+
+
+class CArgumentsTest(unittest.TestCase):
+    def test_arrays_are_flat_c_ints(self) -> None:
+        solver = DancingLinksSudokuSolver(grid_from_values(ALMOST), 5.0)
+        puzzle, size, solution = solver._c_args()
+
+        self.assertIsInstance(size, c_int)
+        self.assertEqual(size.value, 4)
+        for array in (puzzle, solution):
+            self.assertEqual(array.dtype, np.intc)
+            self.assertEqual(array.shape, (16,))
+            self.assertTrue(array.flags["C_CONTIGUOUS"])
+        self.assertEqual(puzzle.tolist(), sum(ALMOST, []))
+        self.assertFalse(solution.any())
+
+    def test_grid_from_array(self) -> None:
+        solver = DancingLinksSudokuSolver(grid_from_values(ALMOST), 5.0)
+        flat = np.array(sum(SOLVED, []), dtype=np.intc)
+        for solution in (flat, np.ctypeslib.as_ctypes(flat)):
+            grid = solver._grid_from_array(solution)
+            self.assertEqual(grid._array.tolist(), SOLVED)
+            self.assertEqual(grid._array.dtype, grid_from_values(SOLVED)._array.dtype)
+
+
+@unittest.skipUnless(shutil.which("cc"), "needs a C compiler")
+class LibraryCallTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.cwd = os.getcwd()
+        self.directory = tempfile.TemporaryDirectory()
+        library = Path(self.directory.name) / "lib" / "ss.so"
+        library.parent.mkdir()
+        source = library.with_suffix(".c")
+        source.write_text(STUB)
+        subprocess.run(["cc", "-shared", "-fPIC", "-o", str(library), str(source)], check=True)
+        os.chdir(self.directory.name)
+        dancing_links_solver._load_library.cache_clear()
+
+    def tearDown(self) -> None:
+        dancing_links_solver._load_library.cache_clear()
+        os.chdir(self.cwd)
+        self.directory.cleanup()
+
+    def test_solution_is_written_into_the_array(self) -> None:
+        solution = DancingLinksSudokuSolver(grid_from_values(ALMOST), 5.0)._run_algorithm()
+        self.assertEqual(solution._array.tolist(), SOLVED)
+
+    def test_failure_gives_none(self) -> None:
+        self.assertIsNone(DancingLinksSudokuSolver(grid_from_values(SOLVED), 5.0)._run_algorithm())
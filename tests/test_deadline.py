@@ -0,0 +1,59 @@
+import math
+import threading
+import time
+import unittest
+
+from src.solvers.solver import SudokuSolver
+from src.utils.deadline import DeadlineType, TimerDeadline
+
+
+def _detection_delay(deadline_type: DeadlineType, time_limit: float) -> float:
+    """
+    Checks quickly for a while, then slowly, as a solver reaching an expensive
+    part of the search does, and returns how late the deadline is detected.
+    """
+
+    deadline = deadline_type.create(time_limit, SudokuSolver.MAX_OVERSHOOT)
+    try:
+        warmup = time.monotonic() + time_limit / 3
+        while time.monotonic() < warmup:
+            if deadline.expired():
+                break
+        while not deadline.expired():
+            time.sleep(0.001)
+        return time.monotonic() - warmup - 2 * time_limit / 3
+    finally:
+        deadline.cancel()
+
+
+class DeadlineTest(unittest.TestCase):
+    def test_solvers_default_to_timer(self) -> None:
+        self.assertEqual(SudokuSolver.DEADLINE, DeadlineType.TIMER)
+
+    def test_overshoot_bounded_by_time_when_checks_slow_down(self) -> None:
+        for deadline_type in (DeadlineType.CLOCK, DeadlineType.TIMER):
+            with self.subTest(deadline_type=deadline_type):
+                self.assertLess(_detection_delay(deadline_type, 0.3), 0.05)
+
+    def test_timer_expires(self) -> None:
+        deadline = TimerDeadline(0.05)
+        self.assertFalse(deadline.expired())
+        time.sleep(0.2)
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0.0)
+
+    def test_cancelled_timer_stops_its_thread(self) -> None:
+        threads = threading.active_count()
+        deadline = TimerDeadline(60.0)
+        deadline.cancel()
+        time.sleep(0.05)
+        self.assertEqual(threading.active_count(), threads)
+        self.assertFalse(deadline.expired())
+
+    def test_infinite_time_limit(self) -> None:
+        threads = threading.active_count()
+        for deadline_type in DeadlineType:
+            deadline = deadline_type.create(math.inf, SudokuSolver.MAX_OVERSHOOT)
+            self.assertFalse(deadline.expired())
+            deadline.cancel()
+        self.assertEqual(threading.active_count(), threads)
@@ -0,0 +1,62 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.exact_cover_solver import ExactCoverSudokuSolver
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+# the first row needs a 3, which its block already has
+UNSOLVABLE = [[1, 2, 0, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]]
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+def is_solution(puzzle: SudokuGrid, solution: SudokuGrid) -> bool:
+    array, size = solution.to_array(np.int64), solution.size
+    given = puzzle.to_array(np.int64) != 0
+    if not np.array_equal(array[given], puzzle.to_array(np.int64)[given]):
+        return False
+    expected = list(range(1, size + 1))
+    return all(
+        sorted(array[row].tolist()) == expected
+        and sorted(array[:, row].tolist()) == expected
+        and sorted(solution.block(row).flatten().tolist()) == expected
+        for row in range(size)
+    )
+
+
+class ExactCoverSolverTest(unittest.TestCase):
+    def test_solves_puzzles(self) -> None:
+        for name in ("sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN3num2.txt", "sudokuN4num0.txt"):
+            with self.subTest(puzzle=name):
+                puzzle = load(name)
+                self.assertTrue(is_solution(puzzle, ExactCoverSudokuSolver.solve(puzzle, 60.0)))
+
+    def test_unique_solution_matches_first_fail(self) -> None:
+        puzzle = load("sudokuN3num0.txt")
+        self.assertEqual(ExactCoverSudokuSolver.count_solutions(puzzle, 60.0), 1)
+        solution = ExactCoverSudokuSolver.solve(puzzle, 60.0)
+        self.assertEqual(str(solution), str(FirstFailSudokuSolver.solve(puzzle, 60.0)))
+
+    def test_complete_grid(self) -> None:
+        solved = [[1, 2, 3, 4], [3, 4, 1, 2], [2, 1, 4, 3], [4, 3, 2, 1]]
+        solution = ExactCoverSudokuSolver.solve(grid_from_values(solved), 5.0)
+        self.assertEqual(solution.to_array(np.int64).tolist(), solved)
+
+    def test_unsolvable_puzzle(self) -> None:
+        self.assertIsNone(ExactCoverSudokuSolver.solve(grid_from_values(UNSOLVABLE), 5.0))
+
+    def test_links_are_restored(self) -> None:
+        solver = ExactCoverSudokuSolver(load("sudokuN3num0.txt"), 60.0)
+        links = (solver._left[:], solver._right[:], solver._up[:], solver._down[:], solver._count[:])
+        solver.run_counting(2)
+        solver._deadline.cancel()
+        self.assertEqual((solver._left, solver._right, solver._up, solver._down, solver._count), links)
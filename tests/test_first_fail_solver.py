@@ -0,0 +1,198 @@
+import random
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import BitmaskState, DomainIndex, FirstFailSudokuSolver, State, StateBackend
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+def solver_for(name: str, backend: StateBackend, **kwargs) -> FirstFailSudokuSolver:
+    solver = FirstFailSudokuSolver(load(name), 60.0, backend=backend, **kwargs)
+    solver._deadline.cancel()
+    return solver
+
+
+def is_solution(puzzle: SudokuGrid, solution: SudokuGrid) -> bool:
+    array, size = solution.to_array(np.int64), solution.size
+    given = puzzle.to_array(np.int64) != 0
+    if not np.array_equal(array[given], puzzle.to_array(np.int64)[given]):
+        return False
+    expected = list(range(1, size + 1))
+    return all(
+        sorted(array[row].tolist()) == expected
+        and sorted(array[:, row].tolist()) == expected
+        and sorted(solution.block(row).flatten().tolist()) == expected
+        for row in range(size)
+    )
+
+
+class BitmaskBackendTest(unittest.TestCase):
+    def test_domains_match_the_set_backend(self) -> None:
+        puzzle = load("sudokuN3num1.txt")
+        sets, masks = State.from_grid(puzzle.copy()), BitmaskState.from_grid(puzzle.copy())
+        self.assertEqual(sets.free_variables, masks.free_variables)
+
+        def assert_same_domains() -> None:
+            for variable in sets.free_variables:
+                domain = sets.domain(variable)
+                self.assertEqual(masks.domain(variable), domain)
+                self.assertEqual(masks.domain_size(variable), len(domain))
+                self.assertEqual(masks.domain_mask(variable), sets.domain_mask(variable))
+
+        assert_same_domains()
+        variable = min(sets.free_variables)
+        value = min(sets.domain(variable))
+        sets.assign(variable, value)
+        masks.assign(variable, value)
+        assert_same_domains()
+        sets.remove_assignment(variable)
+        masks.remove_assignment(variable)
+        assert_same_domains()
+
+    def test_solution_matches_the_set_backend(self) -> None:
+        for name in ("sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN4num0.txt"):
+            with self.subTest(puzzle=name):
+                puzzle = load(name)
+                expected = FirstFailSudokuSolver.solve(puzzle, 60.0, backend=StateBackend.SET)
+                solution = FirstFailSudokuSolver.solve(puzzle, 60.0, backend=StateBackend.BITMASK)
+                self.assertTrue(is_solution(puzzle, solution))
+                self.assertEqual(str(solution), str(expected))
+
+
+class DomainIndexTest(unittest.TestCase):
+    def assertIndexes(self, index: DomainIndex, state: State) -> None:
+        self.assertEqual(index.sizes, {var: state.domain_size(var) for var in state.free_variables})
+        for size, bucket in enumerate(index.buckets):
+            self.assertEqual(bucket, {var for var, var_size in index.sizes.items() if var_size == size})
+
+    def test_follows_assignments(self) -> None:
+        state = State.from_grid(load("sudokuN3num1.txt"))
+        index = DomainIndex(state)
+        self.assertIndexes(index, state)
+
+        variable = index.minimum()
+        self.assertEqual(state.domain_size(variable), min(map(state.domain_size, state.free_variables)))
+
+        value, domain = min(state.domain(variable)), state.domain_mask(variable)
+        state.assign(variable, value)
+        index.assigned(variable, value, domain)
+        self.assertIndexes(index, state)
+
+        state.remove_assignment(variable)
+        index.unassigned(variable)
+        self.assertIndexes(index, state)
+
+    def test_empty_index_has_no_minimum(self) -> None:
+        solution = FirstFailSudokuSolver.solve(load("sudokuN2num0.txt"), 60.0)
+        self.assertIsNone(DomainIndex(State.from_grid(solution)).minimum())
+
+    def test_random_minimum_has_the_smallest_domain(self) -> None:
+        state = State.from_grid(load("sudokuN3num1.txt"))
+        index = DomainIndex(state)
+        smallest = min(map(state.domain_size, state.free_variables))
+        rng = random.Random(0)
+        chosen = {index.minimum(rng) for _ in range(50)}
+        self.assertEqual({state.domain_size(var) for var in chosen}, {smallest})
+
+
+class PropagationTest(unittest.TestCase):
+    def test_forced_cells_are_filled(self) -> None:
+        puzzle = load("sudokuN3num1.txt")
+        free_cells = int((puzzle.to_array(np.int64) == 0).sum())
+        solver = solver_for("sudokuN3num1.txt", StateBackend.SET)
+        solution = solver.run_algorithm()
+        self.assertTrue(is_solution(puzzle, solution))
+        self.assertEqual(solver.backtracks, 0)
+        self.assertEqual(solver.nodes + solver.propagations, free_cells)
+
+    def test_hidden_single(self) -> None:
+        # 1 is ruled out everywhere in the first block but the top left corner
+        puzzle = grid_from_values([[0, 0, 0, 0], [0, 0, 1, 0], [0, 0, 0, 0], [0, 1, 0, 0]])
+        solver = FirstFailSudokuSolver(puzzle, 60.0)
+        solver._deadline.cancel()
+        variable = next(var for var in solver.index.sizes if var[:2] == (0, 1))
+        self.assertEqual(solver.state.domain_size(variable), 3)
+
+        solver._assign(variable, 2)
+        self.assertTrue(solver._propagate())
+        self.assertEqual(solver.state.grid[0, 0], 1)
+
+    def test_batch_is_undone_at_once(self) -> None:
+        for backend in StateBackend:
+            with self.subTest(backend=backend):
+                solver = solver_for("sudokuN3num0.txt", backend)
+                puzzle = solver.state.grid.copy()
+                sizes = dict(solver.index.sizes)
+
+                variable, domain = solver._choose_variable()
+                solver._assign(variable, min(domain))
+                solver._propagate()
+                self.assertGreater(len(solver.trail[-1]), 1)
+
+                solver._remove_assignment(variable)
+                self.assertEqual(solver.trail, [])
+                self.assertEqual(str(solver.state.grid), str(puzzle))
+                self.assertEqual(solver.index.sizes, sizes)
+
+    def test_backends_search_alike(self) -> None:
+        for name in ("sudokuN3num0.txt", "sudokuN3num2.txt", "sudokuN5num0.txt"):
+            with self.subTest(puzzle=name):
+                runs = []
+                for backend in StateBackend:
+                    solver = solver_for(name, backend)
+                    runs.append((str(solver.run_algorithm()), solver.nodes, solver.propagations, solver.backtracks))
+                self.assertEqual(runs[1:], runs[:-1])
+
+
+class LeastConstrainingValueTest(unittest.TestCase):
+    def recount(self, solver: FirstFailSudokuSolver) -> list[list[int]]:
+        size = solver.state.grid.size
+        counts = [[0] * (size + 1) for _ in range(3 * size)]
+        for unit, variables in enumerate(solver.index.units):
+            for var in variables:
+                if var in solver.index.sizes:
+                    for value in solver.state.domain(var):
+                        counts[unit][value] += 1
+        return counts
+
+    def test_counts_follow_the_search(self) -> None:
+        for backend in StateBackend:
+            with self.subTest(backend=backend):
+                solver = solver_for("sudokuN3num0.txt", backend)
+                self.assertEqual(solver.index.counts, self.recount(solver))
+
+                variable, domain = solver._choose_variable()
+                solver._assign(variable, min(domain))
+                solver._propagate()
+                self.assertEqual(solver.index.counts, self.recount(solver))
+
+                solver._remove_assignment(variable)
+                self.assertEqual(solver.index.counts, self.recount(solver))
+
+    def test_fewest_ruled_out_options_first(self) -> None:
+        for backend in StateBackend:
+            with self.subTest(backend=backend):
+                solver = solver_for("sudokuN3num0.txt", backend)
+                sizes = solver.index.sizes
+                for variable in list(sizes):
+                    row, col, block = variable
+                    peers = {
+                        peer
+                        for peer in sizes
+                        if peer != variable and (peer[0] == row or peer[1] == col or peer[2] == block)
+                    }
+                    domain = solver.state.domain(variable)
+                    ruled_out = {value: sum(value in solver.state.domain(peer) for peer in peers) for value in domain}
+                    expected = sorted(sorted(domain), key=ruled_out.__getitem__)
+                    self.assertEqual(solver._candidates(variable, domain), expected)
@@ -0,0 +1,81 @@
+import unittest
+import warnings
+from pathlib import Path
+
+import numpy as np
+
+from src.model.grid import SudokuGrid, cell_dtype
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+LINES = ["1,0,3,4\n", "3,4,0,2\n", "0,1,4,3\n", "4,3,2,0\n"]
+
+
+class FromTextTest(unittest.TestCase):
+    def test_parses_the_values(self) -> None:
+        grid = SudokuGrid.from_text(LINES)
+        self.assertEqual(grid._array.tolist(), [[1, 0, 3, 4], [3, 4, 0, 2], [0, 1, 4, 3], [4, 3, 2, 0]])
+
+    def test_whitespace_is_ignored(self) -> None:
+        grid = SudokuGrid.from_text([" 1, 0,3 ,4", "3,4,0,2\r\n", "0,1,4,3 \n", "4,3,2,0"])
+        self.assertEqual(str(grid), str(SudokuGrid.from_text(LINES)))
+
+    def test_puzzle_files(self) -> None:
+        for name in ("sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN6num0.txt"):
+            with self.subTest(puzzle=name):
+                with open(PUZZLES / name) as file:
+                    lines = file.readlines()
+                grid = SudokuGrid.from_text(lines)
+                expected = [[int(value) for value in line.split(",")] for line in lines if line.strip()]
+                self.assertEqual(grid._array.tolist(), expected)
+
+    def test_malformed_text(self) -> None:
+        malformed = {
+            "empty": [],
+            "not a square of blocks": ["1,2,3", "2,3,1", "3,1,2"],
+            "missing row": LINES[:3],
+            "short row": LINES[:3] + ["4,3,2\n"],
+            "not a number": LINES[:3] + ["4,3,x,0\n"],
+            "empty cell": LINES[:3] + ["4,3,,0\n"],
+        }
+        for case, lines in malformed.items():
+            with self.subTest(case=case), warnings.catch_warnings():
+                warnings.simplefilter("ignore", DeprecationWarning)
+                with self.assertRaises(ValueError):
+                    SudokuGrid.from_text(lines)
+
+    def test_wrong_puzzle_files(self) -> None:
+        for name in ("wrongN2shape.txt", "wrongN2size.txt"):
+            with self.subTest(puzzle=name), open(PUZZLES / name) as file:
+                with self.assertRaises(ValueError):
+                    SudokuGrid.from_text(file.readlines())
+
+
+class CellDtypeTest(unittest.TestCase):
+    def test_narrowest_dtype(self) -> None:
+        self.assertEqual(cell_dtype(9), np.uint8)
+        self.assertEqual(cell_dtype(225), np.uint8)
+        self.assertEqual(cell_dtype(256), np.uint16)
+
+    def test_grid_is_narrowed(self) -> None:
+        for size in (4, 9, 256):
+            with self.subTest(size=size):
+                grid = SudokuGrid(np.full((size, size), size, dtype=np.int64))
+                self.assertEqual(grid._array.dtype, cell_dtype(size))
+                self.assertEqual(int(grid[size - 1, size - 1]), size)
+                self.assertEqual(grid.copy()._array.dtype, cell_dtype(size))
+
+    def test_values_out_of_range(self) -> None:
+        for value in (-1, 5, 256):
+            with self.subTest(value=value):
+                array = np.zeros((4, 4), dtype=np.int64)
+                array[1, 2] = value
+                with self.assertRaises(ValueError):
+                    SudokuGrid(array)
+
+    def test_to_array_widens(self) -> None:
+        grid = SudokuGrid(np.full((4, 4), 3, dtype=np.int64))
+        widened = grid.to_array(np.intc)
+        self.assertEqual(widened.dtype, np.intc)
+        widened[0, 0] = 1000
+        self.assertEqual(int(grid[0, 0]), 3)
@@ -0,0 +1,59 @@
+import unittest
+from pathlib import Path
+
+from src.model.grid import SudokuGrid
+from src.solvers.exact_cover_solver import ExactCoverSudokuSolver
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.naive_solver import NaiveSudokuSolver
+from src.utils.metrics import SearchMetrics
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+class SearchMetricsTest(unittest.TestCase):
+    def test_matches_the_solver_counters(self) -> None:
+        solver = FirstFailSudokuSolver(load("sudokuN3num2.txt"), 60.0)
+        metrics = SearchMetrics()
+        metrics.attach(solver)
+        try:
+            self.assertIsNotNone(solver.run_algorithm())
+        finally:
+            solver._deadline.cancel()
+
+        self.assertEqual(metrics.nodes, solver.nodes)
+        self.assertEqual(metrics.backtracks, solver.backtracks)
+        self.assertEqual(metrics.max_depth, metrics.nodes - metrics.backtracks)
+        self.assertGreaterEqual(metrics.timeout_checks, metrics.nodes)
+
+    def test_depth_of_a_search_without_propagation(self) -> None:
+        puzzle = load("sudokuN3num0.txt")
+        free_cells = int((puzzle.to_array(int) == 0).sum())
+        for solver_class in (NaiveSudokuSolver, ExactCoverSudokuSolver):
+            with self.subTest(solver=solver_class.__name__):
+                metrics = SearchMetrics()
+                self.assertIsNotNone(solver_class.solve(puzzle, 60.0, metrics=metrics))
+                self.assertEqual(metrics.max_depth, free_cells)
+                self.assertEqual(metrics.nodes - metrics.backtracks, free_cells)
+                self.assertGreater(metrics.choose_time, 0.0)
+                self.assertGreaterEqual(
+                    metrics.total_time, metrics.choose_time + metrics.assign_time + metrics.check_time
+                )
+
+    def test_as_dict(self) -> None:
+        metrics = SearchMetrics(nodes=3, backtracks=1)
+        exported = metrics.as_dict()
+        self.assertEqual((exported["nodes"], exported["backtracks"]), (3, 1))
+        self.assertNotIn("_depth", exported)
+
+    def test_solvers_are_untouched_without_metrics(self) -> None:
+        solver = NaiveSudokuSolver(load("sudokuN2num0.txt"), 5.0)
+        solver._deadline.cancel()
+        self.assertNotIn("_assign", vars(solver))
+        SearchMetrics().attach(solver)
+        self.assertIn("_assign", vars(solver))
@@ -0,0 +1,57 @@
+import multiprocessing
+import unittest
+from pathlib import Path
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.parallel_solver import ParallelSudokuSolver
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+# no solution, but it takes dozens of backtracks to find out
+UNSOLVABLE = [
+    [0, 0, 0, 9, 5, 0, 0, 0, 0],
+    [8, 1, 0, 0, 0, 7, 0, 0, 0],
+    [0, 5, 0, 0, 0, 0, 0, 0, 0],
+    [5, 7, 0, 0, 2, 0, 0, 0, 0],
+    [0, 0, 0, 3, 6, 0, 0, 0, 9],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 3, 5],
+    [0, 0, 4, 0, 0, 3, 0, 0, 0],
+    [0, 0, 0, 7, 0, 5, 0, 0, 0],
+]
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+class ParallelSolverTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        self.assertEqual(multiprocessing.active_children(), [])
+
+    def test_same_verdict_as_the_sequential_search(self) -> None:
+        puzzles = {name: load(name) for name in ("sudokuN3num0.txt", "sudokuN3num2.txt", "sudokuN5num0.txt")}
+        puzzles["unsolvable"] = grid_from_values(UNSOLVABLE)
+        for name, puzzle in puzzles.items():
+            for workers in (1, 2):
+                with self.subTest(puzzle=name, workers=workers):
+                    expected = FirstFailSudokuSolver.solve(puzzle, 60.0)
+                    solution = ParallelSudokuSolver.solve(puzzle, 60.0, workers=workers, split_budget=2)
+                    if expected is None:
+                        self.assertIsNone(solution)
+                    else:
+                        self.assertEqual(FirstFailSudokuSolver.count_solutions(puzzle, 60.0), 1)
+                        self.assertEqual(str(solution), str(expected))
+
+    def test_subproblems_cover_the_search(self) -> None:
+        puzzle = grid_from_values(UNSOLVABLE)
+        solver = FirstFailSudokuSolver(puzzle, 60.0)
+        solver._deadline.cancel()
+        subproblems = list(solver.subproblems(2))
+        self.assertGreater(len(subproblems), 1)
+        self.assertEqual(str(solver.state.grid), str(puzzle))
+        for subproblem in subproblems:
+            self.assertIsNone(FirstFailSudokuSolver.solve(subproblem, 60.0))
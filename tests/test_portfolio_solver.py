@@ -0,0 +1,66 @@
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from src.model.corpus import grid_from_values
+from src.solvers.dancing_links_solver import DancingLinksSudokuSolver
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.portfolio_solver import PortfolioSudokuSolver
+
+
+PUZZLE = [[0, 0, 3, 4], [3, 4, 0, 0], [0, 0, 4, 3], [4, 3, 0, 0]]
+
+PID_FILE = Path(tempfile.gettempdir()) / f"portfolio-test-{os.getpid()}.pid"
+"""File the slow C solver stand-in writes the pid of its process to"""
+
+
+def _slow_run_algorithm(self: DancingLinksSudokuSolver) -> None:
+    PID_FILE.write_text(str(os.getpid()))
+    time.sleep(30)
+
+
+class _LateFirstFailSolver(FirstFailSudokuSolver):
+    """
+    Wins the race only once the dancing links solver is running.
+    """
+
+    def run_algorithm(self):
+        start = time.monotonic()
+        while not PID_FILE.exists() and time.monotonic() - start < 10:
+            time.sleep(0.01)
+        return super().run_algorithm()
+
+
+class PortfolioSudokuSolverTest(unittest.TestCase):
+    def tearDown(self) -> None:
+        if PID_FILE.exists():
+            try:
+                os.kill(int(PID_FILE.read_text()), 9)
+            except (ProcessLookupError, ValueError):
+                pass
+            PID_FILE.unlink()
+
+    def test_solves_puzzle(self) -> None:
+        solution = PortfolioSudokuSolver.solve(grid_from_values(PUZZLE), 10.0)
+        self.assertIsNotNone(solution)
+        self.assertEqual(int(solution._array.sum()), 40)
+
+    def test_no_process_left_behind(self) -> None:
+        solvers = (_LateFirstFailSolver, DancingLinksSudokuSolver)
+        with mock.patch.object(DancingLinksSudokuSolver, "_run_algorithm", _slow_run_algorithm):
+            solution = PortfolioSudokuSolver.solve(grid_from_values(PUZZLE), 10.0, solvers=solvers)
+        self.assertIsNotNone(solution)
+
+        pid = int(PID_FILE.read_text())
+        start = time.monotonic()
+        while time.monotonic() - start < 2:
+            try:
+                os.kill(pid, 0)
+            except ProcessLookupError:
+                break
+            time.sleep(0.05)
+        else:
+            self.fail(f"the dancing links process {pid} is still running")
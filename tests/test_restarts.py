@@ -0,0 +1,78 @@
+import unittest
+from itertools import islice
+from pathlib import Path
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.restarts import RestartSchedule, luby
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+# no solution, but it takes dozens of backtracks to find out
+UNSOLVABLE = [
+    [0, 0, 0, 9, 5, 0, 0, 0, 0],
+    [8, 1, 0, 0, 0, 7, 0, 0, 0],
+    [0, 5, 0, 0, 0, 0, 0, 0, 0],
+    [5, 7, 0, 0, 2, 0, 0, 0, 0],
+    [0, 0, 0, 3, 6, 0, 0, 0, 9],
+    [0, 0, 0, 0, 0, 0, 0, 0, 0],
+    [0, 0, 0, 0, 0, 0, 0, 3, 5],
+    [0, 0, 4, 0, 0, 3, 0, 0, 0],
+    [0, 0, 0, 7, 0, 5, 0, 0, 0],
+]
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+def run(puzzle: SudokuGrid, **kwargs) -> tuple[SudokuGrid | None, FirstFailSudokuSolver]:
+    solver = FirstFailSudokuSolver(puzzle, 60.0, **kwargs)
+    try:
+        return solver.run_algorithm(), solver
+    finally:
+        solver._deadline.cancel()
+
+
+class RestartScheduleTest(unittest.TestCase):
+    def test_luby_sequence(self) -> None:
+        self.assertEqual([luby(index) for index in range(1, 16)], [1, 1, 2, 1, 1, 2, 4, 1, 1, 2, 1, 1, 2, 4, 8])
+
+    def test_budgets(self) -> None:
+        self.assertEqual(list(islice(RestartSchedule.LUBY.budgets(10), 7)), [10, 10, 20, 10, 10, 20, 40])
+        self.assertEqual(list(islice(RestartSchedule.GEOMETRIC.budgets(10), 4)), [10, 20, 40, 80])
+        self.assertEqual(list(islice(RestartSchedule.GEOMETRIC.budgets(1, 1.5), 4)), [1, 1, 2, 3])
+
+
+class RandomizedRestartsTest(unittest.TestCase):
+    def test_unsolvable_puzzle_terminates(self) -> None:
+        for schedule in RestartSchedule:
+            with self.subTest(schedule=schedule):
+                solution, solver = run(grid_from_values(UNSOLVABLE), seed=1, restarts=schedule, restart_base=2)
+                self.assertIsNone(solution)
+                self.assertGreater(solver.restarts, 0)
+
+    def test_solves_with_restarts(self) -> None:
+        puzzle = load("sudokuN3num2.txt")
+        expected = FirstFailSudokuSolver.solve(puzzle, 60.0)
+        for seed in range(3):
+            solution, _ = run(puzzle, seed=seed, restarts=RestartSchedule.LUBY, restart_base=1)
+            self.assertEqual(str(solution), str(expected))
+
+    def test_seed_reproduces_the_run(self) -> None:
+        runs = []
+        for _ in range(2):
+            _, solver = run(grid_from_values(UNSOLVABLE), seed=7, restarts=RestartSchedule.LUBY, restart_base=2)
+            runs.append((solver.nodes, solver.backtracks, solver.restarts))
+        self.assertEqual(runs[0], runs[1])
+
+    def test_spent_budget_undoes_the_search(self) -> None:
+        puzzle = grid_from_values(UNSOLVABLE)
+        solver = FirstFailSudokuSolver(puzzle, 60.0, seed=3)
+        solver._deadline.cancel()
+        self.assertIsNone(solver.run_with_budget(1))
+        self.assertEqual(solver.trail, [])
+        self.assertEqual(str(solver.state.grid), str(puzzle))
+        self.assertFalse(solver.run_with_budget(10_000))
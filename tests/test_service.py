@@ -0,0 +1,61 @@
+import asyncio
+import json
+import unittest
+
+from src.model.grid import SudokuGrid
+from src.service.server import REJECTED, SolvingService
+from src.solvers.batch import SolveStatus
+
+
+PUZZLE = [[0, 0, 3, 4], [3, 4, 0, 0], [0, 0, 4, 3], [4, 3, 0, 0]]
+
+
+class SolvingServiceTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        self.service = SolvingService(workers=2, max_pending=4)
+        self.host, self.port = await self.service.start()
+
+    async def asyncTearDown(self) -> None:
+        await self.service.close()
+
+    async def test_half_closed_connection_gets_eof(self) -> None:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        for request_id in range(3):
+            writer.write(json.dumps({"id": request_id, "puzzle": PUZZLE}).encode() + b"\n")
+        writer.write_eof()
+
+        data = await asyncio.wait_for(reader.read(), timeout=10)
+        responses = [json.loads(line) for line in data.splitlines()]
+        self.assertEqual(sorted(response["id"] for response in responses), [0, 1, 2])
+        self.assertTrue(all(response["status"] == SolveStatus.SOLVED for response in responses))
+        writer.close()
+
+    async def test_invalid_request(self) -> None:
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        writer.write(b'{"id": 7, "puzzle": [[1, 2], [3]]}\n')
+        writer.write_eof()
+
+        response = json.loads(await asyncio.wait_for(reader.readline(), timeout=10))
+        self.assertEqual(response["id"], 7)
+        self.assertEqual(response["status"], SolveStatus.INVALID)
+        writer.close()
+
+    async def test_timed_out_request_keeps_its_slot(self) -> None:
+        with open("puzzles/sudokuN5num0.txt") as f:
+            puzzle = SudokuGrid.from_text(f.readlines())._array.tolist()
+        service = SolvingService(workers=1, max_pending=1)
+        # answer before the solver gives up, as if it overshot its time limit
+        service.TIMEOUT_GRACE = -0.3
+        await service.start()
+        try:
+            request = {"puzzle": puzzle, "algorithm": "naive", "time_limit": 0.6}
+            self.assertEqual((await service.handle(request))["status"], SolveStatus.TIMEOUT)
+            self.assertEqual((await service.handle(request))["status"], REJECTED)
+            await asyncio.sleep(1.0)
+            self.assertEqual(service.stats()["in_flight"], 0)
+        finally:
+            await service.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
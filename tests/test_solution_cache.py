@@ -0,0 +1,84 @@
+import tempfile
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver
+from src.solvers.solution_cache import SolutionCache
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+def is_solution(puzzle: SudokuGrid, solution: SudokuGrid) -> bool:
+    array, size = solution.to_array(np.int64), solution.size
+    given = puzzle.to_array(np.int64) != 0
+    if not np.array_equal(array[given], puzzle.to_array(np.int64)[given]):
+        return False
+    expected = list(range(1, size + 1))
+    return all(
+        sorted(array[row].tolist()) == expected
+        and sorted(array[:, row].tolist()) == expected
+        and sorted(solution.block(row).flatten().tolist()) == expected
+        for row in range(size)
+    )
+
+
+def transform(puzzle: SudokuGrid, rng: np.random.Generator) -> SudokuGrid:
+    """Applies a random sudoku symmetry: transposition, line permutations and relabeling"""
+    array, size, block_size = puzzle.to_array(np.int64), puzzle.size, puzzle.block_size
+    if rng.random() < 0.5:
+        array = array.T
+    rows = np.concatenate([band * block_size + rng.permutation(block_size) for band in rng.permutation(block_size)])
+    cols = np.concatenate([stack * block_size + rng.permutation(block_size) for stack in rng.permutation(block_size)])
+    labels = np.concatenate(([0], rng.permutation(size) + 1))
+    return SudokuGrid(labels[array[np.ix_(rows, cols)]])
+
+
+class SolutionCacheTest(unittest.TestCase):
+    def test_isomorphic_puzzles_get_valid_solutions(self) -> None:
+        rng = np.random.default_rng(0)
+        for name in ("sudokuN2num0.txt", "sudokuN3num0.txt", "sudokuN3num2.txt", "sudokuN4num0.txt"):
+            with self.subTest(puzzle=name):
+                puzzle = load(name)
+                cache = SolutionCache()
+                cache.put(puzzle, FirstFailSudokuSolver.solve(puzzle, 60.0))
+                for _ in range(10):
+                    isomorphic = transform(puzzle, rng)
+                    solution = cache.get(isomorphic)
+                    self.assertIsNotNone(solution)
+                    self.assertTrue(is_solution(isomorphic, solution))
+                self.assertEqual((cache.hits, cache.misses), (10, 0))
+
+    def test_unknown_puzzle_misses(self) -> None:
+        cache = SolutionCache()
+        puzzle = load("sudokuN3num0.txt")
+        cache.put(puzzle, FirstFailSudokuSolver.solve(puzzle, 60.0))
+        self.assertIsNone(cache.get(load("sudokuN3num1.txt")))
+        self.assertEqual((cache.hits, cache.misses), (0, 1))
+
+    def test_least_recently_used_is_evicted(self) -> None:
+        cache = SolutionCache(max_size=2)
+        puzzles = [load(f"sudokuN3num{number}.txt") for number in range(3)]
+        for puzzle in puzzles:
+            cache.put(puzzle, FirstFailSudokuSolver.solve(puzzle, 60.0))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get(transform(puzzles[0], np.random.default_rng(1))))
+        self.assertIsNotNone(cache.get(transform(puzzles[2], np.random.default_rng(1))))
+
+    def test_database_survives_the_cache(self) -> None:
+        puzzle = load("sudokuN3num0.txt")
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "solutions.db"
+            with SolutionCache(path=path) as cache:
+                cache.put(puzzle, FirstFailSudokuSolver.solve(puzzle, 60.0))
+            with SolutionCache(path=path) as cache:
+                isomorphic = transform(puzzle, np.random.default_rng(2))
+                self.assertTrue(is_solution(isomorphic, cache.get(isomorphic)))
@@ -0,0 +1,48 @@
+import unittest
+from pathlib import Path
+
+import numpy as np
+
+from src.model.corpus import grid_from_values
+from src.model.grid import SudokuGrid
+from src.solvers.first_fail_solver import FirstFailSudokuSolver, StateBackend
+from src.solvers.solver_type import SudokuSolverType
+
+
+PUZZLES = Path(__file__).parent.parent / "puzzles"
+EMPTY = np.zeros((4, 4), dtype=np.int64)
+# the first row needs a 3, which its block already has
+UNSOLVABLE = [[1, 2, 0, 0], [0, 0, 0, 3], [0, 0, 0, 0], [0, 0, 0, 0]]
+COUNTING = (SudokuSolverType.NAIVE, SudokuSolverType.FIRST_FAIL, SudokuSolverType.EXACT_COVER)
+
+
+def load(name: str) -> SudokuGrid:
+    with open(PUZZLES / name) as file:
+        return SudokuGrid.from_text(file.readlines())
+
+
+class CountSolutionsTest(unittest.TestCase):
+    def test_all_4x4_grids(self) -> None:
+        for solver_type in COUNTING:
+            with self.subTest(solver=solver_type):
+                self.assertEqual(solver_type.count_solutions(SudokuGrid(EMPTY), 60.0, limit=1000), 288)
+        for backend in StateBackend:
+            with self.subTest(backend=backend):
+                count = FirstFailSudokuSolver.count_solutions(SudokuGrid(EMPTY), 60.0, backend=backend, limit=1000)
+                self.assertEqual(count, 288)
+
+    def test_stops_at_the_limit(self) -> None:
+        for solver_type in COUNTING:
+            with self.subTest(solver=solver_type):
+                self.assertEqual(solver_type.count_solutions(SudokuGrid(EMPTY), 60.0, limit=5), 5)
+                self.assertEqual(solver_type.count_solutions(SudokuGrid(EMPTY), 60.0), 2)
+
+    def test_unique_and_unsolvable(self) -> None:
+        for solver_type in COUNTING:
+            with self.subTest(solver=solver_type):
+                self.assertEqual(solver_type.count_solutions(load("sudokuN3num0.txt"), 60.0), 1)
+                self.assertEqual(solver_type.count_solutions(grid_from_values(UNSOLVABLE), 60.0), 0)
+
+    def test_solvers_without_counting(self) -> None:
+        with self.assertRaises(NotImplementedError):
+            SudokuSolverType.DANCING_LINKS.count_solutions(SudokuGrid(EMPTY), 5.0)
@@ -0,0 +1,38 @@
+import unittest
+
+from src.model.grid import SudokuGrid
+from src.model.topology import topology
+from src.solvers.first_fail_solver import FirstFailSudokuSolver, StateBackend
+
+
+class TopologyTest(unittest.TestCase):
+    def test_shared_per_size(self) -> None:
+        self.assertIs(topology(9), topology(9))
+        puzzle = SudokuGrid.from_text(["0,0,3,4", "3,4,0,0", "0,0,4,3", "4,3,0,0"])
+        self.assertIs(puzzle.topology, topology(4))
+
+    def test_units(self) -> None:
+        layout = topology(9)
+        self.assertEqual(len(layout.units), 27)
+        for unit in layout.units:
+            self.assertEqual(len(set(unit)), 9)
+        self.assertEqual([cell[:2] for cell in layout.units[2]], [(2, col) for col in range(9)])
+        self.assertEqual([cell[:2] for cell in layout.units[9 + 4]], [(row, 4) for row in range(9)])
+        self.assertEqual({cell[:2] for cell in layout.units[18 + 4]}, {(row, col) for row in range(3, 6) for col in range(3, 6)})
+
+    def test_cells_are_shared_by_units(self) -> None:
+        layout = topology(4)
+        for index, (row, col, block) in enumerate(layout.cells):
+            self.assertEqual(index, row * 4 + col)
+            self.assertEqual(block, layout.block_index[row][col])
+            for unit in (row, 4 + col, 8 + block):
+                self.assertTrue(any(cell is layout.cells[index] for cell in layout.units[unit]))
+
+    def test_index_uses_shared_cells(self) -> None:
+        puzzle = SudokuGrid.from_text(["0,0,3,4", "3,4,0,0", "0,0,4,3", "4,3,0,0"])
+        cells = set(map(id, puzzle.topology.cells))
+        for backend in StateBackend:
+            solver = FirstFailSudokuSolver(puzzle, 10.0, backend=backend)
+            self.assertTrue(all(id(variable) in cells for unit in solver.index.units for variable in unit))
+            self.assertEqual(sum(map(len, solver.index.units)), 3 * 8)
+            solver._deadline.cancel()